@@ -0,0 +1,65 @@
+"""
+Compare the deflate implementations available to compress the worksheet::
+
+    python -m benchmarks.compression [--rows 100000]
+"""
+import argparse
+import datetime
+import time
+import zipfile
+
+from xlsx_streaming import compression
+from xlsx_streaming import render
+from xlsx_streaming import schema
+from xlsx_streaming import streaming
+
+
+def gen_worksheet(rows_count, batch_size=1000):
+    types = [schema.NUMBER, schema.TEXT, schema.DATETIME, schema.NUMBER, schema.BOOL]
+    with zipfile.ZipFile(schema.build_template(types, header=['id', 'label', 'date', 'amount', 'ok'])) as template:
+        sheet = template.read(streaming.get_first_sheet_name(template)).decode()
+    start = datetime.datetime(2020, 1, 1)
+    batches = (
+        [
+            [i, f'label {i % 97}', start + datetime.timedelta(minutes=i), i * 1.25, i % 3 == 0]
+            for i in range(first, min(first + batch_size, rows_count))
+        ]
+        for first in range(0, rows_count, batch_size)
+    )
+    return list(render.render_worksheet(batches, sheet))
+
+
+def bench(compressor, level, chunks):
+    started_at = time.perf_counter()
+    compressobj = compressor.compressobj(level)
+    crc = compressed_size = 0
+    for chunk in chunks:
+        crc = compressor.crc32(chunk, crc)
+        compressed_size += len(compressobj.compress(chunk))
+    compressed_size += len(compressobj.flush())
+    return time.perf_counter() - started_at, compressed_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    chunks = gen_worksheet(args.rows)
+    size = sum(len(chunk) for chunk in chunks)
+    print(f'worksheet: {args.rows} rows, {size / 1e6:.1f} MB')
+    print(f'{"compressor":<10} {"level":>7} {"time (s)":>9} {"MB/s":>8} {"ratio":>7}')
+    for compressor in compression.COMPRESSORS:
+        if not compressor.is_available():
+            print(f'{compressor.name:<10} not installed')
+            continue
+        for level in (None, 1, 6, 9):
+            elapsed, compressed_size = bench(compressor, level, chunks)
+            print(
+                f'{compressor.name:<10} {"default" if level is None else level:>7} {elapsed:>9.3f} '
+                f'{size / 1e6 / elapsed:>8.1f} {size / compressed_size:>7.2f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Measure the per-cell cost of rendering numeric values::
+
+    python -m benchmarks.rendering [--rows 20000]
+
+The cost of updating a numeric cell with a value (``update``) is compared with the previous
+implementation (``before``: a datetime conversion attempted on each value, then a conversion to text
+validated by parsing the text back), then the cost of rendering rows of each numeric type, with and
+without validation (``trusted``).
+"""
+import argparse
+import decimal
+import time
+
+from xml.etree import ElementTree as ETree
+
+from xlsx_streaming import render
+from xlsx_streaming import schema
+from xlsx_streaming import streaming
+
+
+VALUES = {
+    'int': lambda i: i * 7919,
+    'float': lambda i: i * 1.25,
+    'Decimal': lambda i: decimal.Decimal(i) / 100,
+}
+
+COLUMNS = 10
+
+
+def update_numeric_cell_before(cell, value):
+    """The update of numeric cells before values were formatted by type."""
+    if value is None:
+        cell_text = ''
+    else:
+        try:
+            cell_text = str(render.datetime_to_excel_datetime(value))
+        except TypeError:
+            cell_text = str(value)
+        try:
+            float(cell_text)
+        except Exception as e:  # pylint: disable=broad-except
+            raise AttributeError(f"expected a numeric or date like value got {cell_text}.") from e
+    next(child for child in cell if child.tag == 'v').text = cell_text
+
+
+def update_numeric_cell(cell, value):
+    render._update_value_cell(cell, render._get_numeric_text(value))  # pylint: disable=protected-access
+
+
+def update_all(update, values):
+    cell = ETree.Element('c', r='A1')
+    ETree.SubElement(cell, 'v')
+    for value in values:
+        update(cell, value)
+
+
+def bench(function, *args):
+    started_at = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - started_at
+
+
+def get_row_template():
+    zip_template, _, (_, _, row_template) = streaming.open_template(schema.build_template([schema.NUMBER] * COLUMNS))
+    zip_template.close()
+    return row_template
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=20000)
+    args = parser.parse_args()
+
+    cells = args.rows * COLUMNS
+    print(f'{args.rows} rows of {COLUMNS} cells, nanoseconds per cell')
+    print(f'{"type":<8} {"before":>8} {"update":>8} {"render":>8} {"trusted":>8}')
+    for type_name, gen_value in VALUES.items():
+        values = [gen_value(i) for i in range(cells)]
+        rows = [values[i:i + COLUMNS] for i in range(0, cells, COLUMNS)]
+        timings = [
+            bench(update_all, update_numeric_cell_before, values),
+            bench(update_all, update_numeric_cell, values),
+            bench(render.render_rows, rows, get_row_template(), 1),
+            bench(render.render_rows_trusted, rows, render.compile_row_template(get_row_template()), 1),
+        ]
+        print(f'{type_name:<8} ' + ' '.join(f'{timing / cells * 1e9:>8.0f}' for timing in timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+import unittest
+from xml.etree import ElementTree as ETree
+
+from xlsx_streaming import batching
+from xlsx_streaming import render
+
+
+class TestAdaptiveBatchSize(unittest.TestCase):
+
+    def test_growth(self):
+        sizer = batching.AdaptiveBatchSize(initial_size=100, min_size=10, max_size=1000, target_latency=10)
+        for _ in range(5):
+            sizer.record([[1, 2]] * sizer.size, fetch_time=0.001)
+        self.assertEqual(sizer.sizes, [100, 200, 400, 800, 1000])
+        self.assertEqual(sizer.size, 1000)
+
+    def test_target_latency(self):
+        sizer = batching.AdaptiveBatchSize(initial_size=1000, min_size=10, max_size=10000, target_latency=0.5)
+        sizer.record([[1]] * 1000, fetch_time=2)  # 2 ms per row
+        self.assertEqual(sizer.size, 250)
+        sizer.record([[1]] * 1000, fetch_time=100)
+        self.assertEqual(sizer.size, 10)
+
+    def test_max_batch_bytes(self):
+        sizer = batching.AdaptiveBatchSize(initial_size=1000, min_size=1, max_batch_bytes=100000)
+        row = ['x' * (1000 - batching.CELL_SIZE - batching.ROW_SIZE)]
+        sizer.record([row] * 1000, fetch_time=0)
+        self.assertEqual(batching.estimate_row_size(row), 1000)
+        self.assertEqual(sizer.size, 100)
+        self.assertEqual(sizer.batches[0], batching.BatchStats(1000, 1000, 0, 1000))
+
+    def test_empty_batch(self):
+        sizer = batching.AdaptiveBatchSize()
+        sizer.record([], fetch_time=0.1)
+        self.assertEqual(sizer.size, 1000)
+        self.assertEqual(sizer.sizes, [1000])
+
+    def test_invalid_bounds(self):
+        self.assertRaises(ValueError, batching.AdaptiveBatchSize, initial_size=10, min_size=100)
+
+    def test_row_overhead(self):
+        row = ETree.Element('row', r='2')
+        ETree.SubElement(row, 'c', r='A2', t='n')
+        ETree.SubElement(row, 'c', r='B2', t='inlineStr', s='1')
+        overhead = batching.get_row_overhead(row)
+        rendered, _ = render.render_rows_trusted([[1, '']], render.compile_row_template(row), 1000000)
+        self.assertGreaterEqual(overhead, len(rendered))
+        self.assertLess(overhead, len(rendered) + 20)
+        self.assertEqual(batching.estimate_row_size([1, 'abc'], overhead), overhead + batching.VALUE_SIZE + 3)
+        self.assertIsNone(batching.get_row_overhead(None))
+
+    def test_split_batches(self):
+        batches = [[['a' * 10]] * 5, [['b' * 50], ['c' * 10]], []]
+        split = list(batching.split_batches(batches, 30, row_overhead=0))
+        self.assertEqual(split, [
+            [['a' * 10]] * 3, [['a' * 10]] * 2, [['b' * 50]], [['c' * 10]],
+        ])
+
+    def test_get_batch_sizer(self):
+        self.assertIsNone(batching.get_batch_sizer(10))
+        self.assertIsInstance(batching.get_batch_sizer('auto'), batching.AdaptiveBatchSize)
+        sizer = batching.AdaptiveBatchSize()
+        self.assertIs(batching.get_batch_sizer(sizer), sizer)
+        for batch_size in (0, 'big', None):
+            self.assertRaises(ValueError, batching.get_batch_sizer, batch_size)
@@ -0,0 +1,112 @@
+import contextlib
+import datetime
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import openpyxl
+
+from xlsx_streaming import cli
+
+from .utils import gen_xlsx_template
+
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.output = os.path.join(self.tmp_dir.name, 'output.xlsx')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write_input(self, name, content):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def _run(self, *args):
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            cli.main([*args, '-o', self.output])
+        return stderr.getvalue()
+
+    def _read_output(self):
+        return list(openpyxl.load_workbook(self.output).active.values)
+
+    def test_csv(self):
+        path = self._write_input('input.csv', 'id,name\n1,"a, b"\n2,é€\n')
+        report = self._run(path)
+        self.assertEqual(self._read_output(), [('id', 'name'), ('1', 'a, b'), ('2', 'é€')])
+        self.assertIn('2 rows', report)
+        self.assertIn('rows/s', report)
+
+    def test_csv_with_types(self):
+        path = self._write_input('input.csv', 'id,amount,day,ok\n1,1.5,2012-01-02,true\n2,,,no\n')
+        self._run(path, '--types', 'number,number,date,bool', '--batch-size', '1', '--compression-level', '1', '-q')
+        self.assertEqual(self._read_output(), [
+            ('id', 'amount', 'day', 'ok'),
+            (1, 1.5, datetime.datetime(2012, 1, 2), True),
+            (2, None, None, False),
+        ])
+
+    def test_csv_with_int_and_float_types(self):
+        path = self._write_input('input.csv', 'id,amount,name\n1,1.5,a\n,,b\n')
+        self._run(path, '--types', 'int,float,text', '-q')
+        self.assertEqual(self._read_output(), [('id', 'amount', 'name'), (1, 1.5, 'a'), (None, None, 'b')])
+
+    def test_tsv_without_header(self):
+        path = self._write_input('input.tsv', '1\tfoo\n2\tbar\n')
+        self._run(path, '--no-header', '--types', 'number,text', '-q')
+        self.assertEqual(self._read_output(), [(1, 'foo'), (2, 'bar')])
+
+    def test_jsonl(self):
+        lines = [{'id': i, 'name': f'n{i}', 'ok': i % 2 == 0} for i in range(5)]
+        path = self._write_input('input.jsonl', '\n'.join(json.dumps(line) for line in lines))
+        self._run(path, '-q')
+        rows = self._read_output()
+        self.assertEqual(rows[0], ('id', 'name', 'ok'))
+        self.assertEqual(rows[1:], [(i, f'n{i}', i % 2 == 0) for i in range(5)])
+
+    def test_template(self):
+        template = gen_xlsx_template(with_header=True)
+        template_path = os.path.join(self.tmp_dir.name, 'template.xlsx')
+        with open(template_path, 'wb') as f:
+            f.write(template.read())
+        path = self._write_input('input.csv', 'a,b,c\n1,foo,2.5\n')
+        self._run(path, '--template', template_path, '-q')
+        self.assertEqual(self._read_output(), [
+            ('Id', 'Description', 'Date'),
+            (1, 'foo', datetime.datetime(1900, 1, 2, 12, 0)),
+        ])
+
+    def test_missing_template(self):
+        path = self._write_input('input.csv', 'a\n1\n')
+        template_path = os.path.join(self.tmp_dir.name, 'missing.xlsx')
+        self.assertRaises(SystemExit, self._run, path, '--template', template_path, '-q')
+
+    def test_workers(self):
+        path = self._write_input('input.csv', 'id,name\n' + ''.join(f'{i},name{i}\n' for i in range(50)))
+        self._run(path, '--types', 'number,text', '--workers', '2', '--batch-size', '7', '-q')
+        rows = self._read_output()
+        self.assertEqual(len(rows), 51)
+        self.assertEqual(rows[1:], [(i, f'name{i}') for i in range(50)])
+
+    def test_compact(self):
+        path = self._write_input('input.csv', 'id,name\n1,a\n,b\n')
+        self._run(path, '--types', 'number,text', '--compact', '-q')
+        self.assertEqual(self._read_output(), [('id', 'name'), (1, 'a'), (None, 'b')])
+
+    def test_auto_batch_size(self):
+        path = self._write_input('input.csv', 'id\n' + ''.join(f'{i}\n' for i in range(50)))
+        self._run(path, '--types', 'number', '--batch-size', 'auto', '-q')
+        self.assertEqual(len(self._read_output()), 51)
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertRaises(SystemExit, self._run, path, '--batch-size', 'big')
+
+    def test_unknown_type(self):
+        path = self._write_input('input.csv', 'id\n1\n')
+        self.assertRaises(SystemExit, self._run, path, '--types', 'color')
@@ -0,0 +1,123 @@
+import collections
+import datetime
+import io
+import unittest
+
+import openpyxl
+
+import xlsx_streaming
+from xlsx_streaming import columnar
+from xlsx_streaming import render
+from xlsx_streaming import schema
+from xlsx_streaming import streaming
+
+
+Customer = collections.namedtuple('Customer', ['name'])
+Order = collections.namedtuple('Order', ['pk', 'customer', 'created_at'])
+
+TYPES = ['int', 'text', 'datetime']
+
+
+def gen_orders(count):
+    return [
+        Order(i, Customer(None if i % 3 == 0 else f'<customer {i}>'), datetime.datetime(2020, 1, 1, i % 24))
+        for i in range(count)
+    ]
+
+
+class TestColumnBatch(unittest.TestCase):
+
+    def test_rows(self):
+        batch = columnar.ColumnBatch([[1, 2], iter(['a', 'b'])])
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(list(batch), [(1, 'a'), (2, 'b')])
+        self.assertEqual(repr(batch), '<ColumnBatch: 2 columns, 2 rows>')
+
+    def test_empty(self):
+        self.assertEqual(len(columnar.ColumnBatch([])), 0)
+        self.assertEqual(list(columnar.ColumnBatch([[], []])), [])
+
+    def test_different_lengths(self):
+        with self.assertRaisesRegex(ValueError, 'same length'):
+            columnar.ColumnBatch([[1, 2], [1]])
+
+
+class TestFields(unittest.TestCase):
+
+    def test_getters(self):
+        order = gen_orders(2)[1]
+        self.assertEqual(columnar.get_getter('customer.name')(order), '<customer 1>')
+        self.assertEqual(columnar.get_getter(0)(order), 1)
+        self.assertEqual(columnar.get_getter(lambda row: row.pk * 2)(order), 2)
+        self.assertRaises(TypeError, columnar.get_getter, 1.5)
+
+    def test_fields_serializer(self):
+        serializer = columnar.fields_serializer(['pk', 'customer.name'])
+        batch = serializer(gen_orders(3))
+        self.assertEqual(batch.columns, [[0, 1, 2], [None, '<customer 1>', '<customer 2>']])
+
+    def test_serializer(self):
+        serializer = columnar.fields_serializer(
+            [1, 0], serializer=lambda rows: ((row.pk, row.customer.name) for row in rows),
+        )
+        self.assertEqual(list(serializer(gen_orders(2))), [(None, 0), ('<customer 1>', 1)])
+
+
+class TestRenderColumns(unittest.TestCase):
+
+    def setUp(self):
+        zip_template, _, (_, _, row_template) = streaming.open_template(schema.build_template(TYPES))
+        zip_template.close()
+        self.cells = render.compile_row_template(row_template, schema.get_encoders(TYPES))
+        self.rows = [[order.pk, order.customer.name, order.created_at] for order in gen_orders(50)]
+
+    def test_same_as_rows(self):
+        for compact in (False, True):
+            with self.subTest(compact=compact):
+                batch = columnar.ColumnBatch(list(zip(*self.rows)))
+                self.assertEqual(
+                    render.render_rows_trusted(batch, self.cells, 2, compact=compact),
+                    render.render_rows_trusted(self.rows, self.cells, 2, compact=compact),
+                )
+
+    def test_extra_columns(self):
+        rows = [row + ['extra'] for row in self.rows]
+        self.assertEqual(
+            render.render_rows_trusted(columnar.ColumnBatch(list(zip(*rows))), self.cells, 1),
+            render.render_rows_trusted(self.rows, self.cells, 1),
+        )
+
+    def test_cache(self):
+        cache = xlsx_streaming.ValueCache()
+        render.render_rows_trusted(columnar.ColumnBatch(list(zip(*self.rows))), self.cells, 1, cache=cache)
+        self.assertEqual(cache.info()['C'].hits, 26)
+
+
+class TestStreamFields(unittest.TestCase):
+
+    def read_rows(self, stream):
+        return list(openpyxl.load_workbook(io.BytesIO(b''.join(stream))).active.values)
+
+    def test_fields(self):
+        orders = gen_orders(250)
+        rows = [[order.pk, order.customer.name, order.created_at] for order in orders]
+        for options in ({}, {'trusted': True}, {'trusted': True, 'compact': True}, {'batch_bytes': 1024}):
+            with self.subTest(**options):
+                expected = self.read_rows(
+                    xlsx_streaming.stream_queryset_as_xlsx(rows, columns=TYPES, batch_size=100, **options),
+                )
+                self.assertEqual(expected[1], (1, '<customer 1>', datetime.datetime(2020, 1, 1, 1)))
+                self.assertEqual(self.read_rows(xlsx_streaming.stream_queryset_as_xlsx(
+                    orders, columns=TYPES, fields=['pk', 'customer.name', 'created_at'], batch_size=100, **options,
+                )), expected)
+
+    def test_columnar_serializer(self):
+        def serializer(orders):
+            return columnar.ColumnBatch([[order.pk for order in orders], [order.customer.name for order in orders]])
+
+        profiler = xlsx_streaming.Profiler()
+        rows = self.read_rows(xlsx_streaming.stream_queryset_as_xlsx(
+            gen_orders(10), columns=['int', 'text'], serializer=serializer, trusted=True, profiler=profiler,
+        ))
+        self.assertEqual(rows[:2], [(0, None), (1, '<customer 1>')])
+        self.assertEqual(profiler.encoders['encode_int'][0], 10)
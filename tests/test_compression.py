@@ -0,0 +1,60 @@
+import io
+import unittest
+import zlib
+from unittest import mock
+
+import openpyxl
+
+from xlsx_streaming import compression
+from xlsx_streaming import streaming
+
+
+class TestCompression(unittest.TestCase):
+
+    def test_crc32_combine(self):
+        first, second = b'<row r="1"/>' * 100, 'é€'.encode() * 1000
+        self.assertEqual(
+            compression.crc32_combine(zlib.crc32(first), zlib.crc32(second), len(second)),
+            zlib.crc32(first + second),
+        )
+        self.assertEqual(compression.crc32_combine(zlib.crc32(first), 0, 0), zlib.crc32(first))
+        self.assertEqual(compression.crc32_combine(0, zlib.crc32(second), len(second)), zlib.crc32(second))
+
+    def test_get_compressor(self):
+        self.assertIs(compression.get_compressor('zlib'), compression.ZLIB)
+        self.assertIs(compression.get_compressor(compression.ZLIB), compression.ZLIB)
+        self.assertIs(compression.get_compressor(), compression.ZLIB)
+        self.assertIs(compression.get_compressor('auto'), compression.available_compressors()[0])
+        self.assertRaises(ValueError, compression.get_compressor, 'lz4')
+
+    def test_unavailable_compressor(self):
+        missing = compression.Compressor('missing', 'xlsx_streaming_missing_module')
+        self.assertFalse(missing.is_available())
+        self.assertNotIn(missing, compression.available_compressors())
+        self.assertIn(compression.ZLIB, compression.available_compressors())
+
+    def test_import_error_cached(self):
+        missing = compression.Compressor('missing', 'xlsx_streaming_missing_module')
+        with mock.patch.object(compression.importlib, 'import_module', side_effect=ImportError) as import_module:
+            self.assertFalse(missing.is_available())
+            self.assertFalse(missing.is_available())
+            self.assertRaises(ImportError, missing.compressobj)
+        import_module.assert_called_once_with('xlsx_streaming_missing_module')
+
+    def test_compressors(self):
+        data = b'<row><c><v>42</v></c></row>' * 1000
+        for compressor in compression.available_compressors():
+            for level in (None, 0, 1, 9):
+                with self.subTest(compressor=compressor.name, level=level):
+                    compressobj = compressor.compressobj(level)
+                    deflated = compressobj.compress(data) + compressobj.flush()
+                    self.assertEqual(zlib.decompress(deflated, -15), data)
+                    self.assertEqual(compressor.crc32(data), zlib.crc32(data))
+
+    def test_stream_queryset_as_xlsx(self):
+        qs = [[i, f'row {i}'] for i in range(100)]
+        for compressor in compression.available_compressors():
+            with self.subTest(compressor=compressor.name):
+                stream = streaming.stream_queryset_as_xlsx(qs, compressor=compressor.name, compresslevel=1)
+                new_wb = openpyxl.load_workbook(io.BytesIO(b''.join(stream)))
+                self.assertEqual(new_wb.active.cell(row=100, column=2).value, 'row 99')
@@ -0,0 +1,88 @@
+import decimal
+import enum
+import unittest
+import uuid
+from xml.etree import ElementTree as ETree
+
+from xlsx_streaming import converters
+from xlsx_streaming import render
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Color(enum.Enum):
+    RED = 'red'
+    BLUE = 2
+
+
+class Size(enum.IntEnum):
+    SMALL = 1
+
+
+class Money:
+    def __init__(self, amount):
+        self.amount = amount
+
+
+class TestConverters(unittest.TestCase):
+
+    def test_builtin_converters(self):
+        self.assertEqual(converters.convert(12), '12')
+        self.assertEqual(converters.convert(1.5), '1.5')
+        self.assertEqual(converters.convert(True), 'True')
+        self.assertEqual(converters.convert(decimal.Decimal('12.30')), '12.30')
+        identifier = uuid.uuid4()
+        self.assertEqual(converters.convert(identifier), str(identifier))
+        self.assertEqual(converters.convert(Color.RED), str(Color.RED))
+        self.assertEqual(converters.convert(Size.SMALL), '1')
+        self.assertEqual(converters.convert('text'), 'text')
+        money = Money(1)
+        self.assertEqual(converters.convert(money), str(money))
+
+    def test_enum_value_converter(self):
+        converters.register_converter(enum.Enum, converters.convert_enum_value)
+        self.addCleanup(converters.registry.unregister, enum.Enum)
+        self.assertEqual(converters.convert(Color.RED), 'red')
+        self.assertEqual(converters.convert(Color.BLUE), '2')
+        self.assertEqual(render.encode_text(Color.RED), '<is><t>red</t></is>')
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_numpy_converters(self):
+        self.assertEqual(converters.convert(numpy.int64(12)), '12')
+        self.assertEqual(converters.convert(numpy.float32(1.5)), '1.5')
+
+    def test_registry(self):
+        registry = converters.ConverterRegistry()
+        self.assertIsNone(registry.get(Money))
+
+        @registry.register(Money)
+        def convert_money(value):
+            return f'{value.amount:.2f}'
+
+        self.assertIs(registry.get(Money), convert_money)
+        self.assertEqual(registry.convert(Money(3)), '3.00')
+        # subclasses use the converter of their parent
+        self.assertIs(registry.get(type('Euros', (Money,), {})), convert_money)
+
+        registry.unregister(Money)
+        self.assertIsNone(registry.get(Money))
+
+    def test_custom_converter_in_cells(self):
+        converters.register_converter(Money, lambda value: f'{value.amount:.2f}')
+        self.addCleanup(converters.registry.unregister, Money)
+
+        cell = ETree.Element('c', t='n', r='A1')
+        ETree.SubElement(cell, 'v')
+        render.update_cell(cell, line=2, value=Money(12))
+        self.assertEqual(cell[0].text, '12.00')
+
+        cell = ETree.Element('c', t='inlineStr', r='B1')
+        ETree.SubElement(ETree.SubElement(cell, 'is'), 't')
+        render.update_cell(cell, line=2, value=Money(12))
+        self.assertEqual(cell[0][0].text, '12.00')
+
+        self.assertEqual(render.encode_number(Money(1)), '<v>1.00</v>')
+        self.assertEqual(render.encode_text(Money(1)), '<is><t>1.00</t></is>')
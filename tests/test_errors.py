@@ -0,0 +1,97 @@
+import concurrent.futures
+import pickle
+import unittest
+
+from xlsx_streaming import errors
+from xlsx_streaming import render
+from xlsx_streaming import streaming
+
+from .utils import gen_xlsx_sheet
+from .utils import gen_xlsx_template
+
+
+class TestErrorReport(unittest.TestCase):
+
+    def test_add(self):
+        report = errors.ErrorReport(max_samples=2)
+        for line in range(2, 6):
+            report.add('A', line, f'value {line}', AttributeError('expected a number'))
+        report.add('AB', 3, 'x', AttributeError())
+        self.assertEqual(report.total, 5)
+        self.assertEqual(report.counts, {'A': 4, 'AB': 1})
+        self.assertEqual(
+            report.samples['A'],
+            [(2, 'value 2', 'expected a number'), (3, 'value 3', 'expected a number')],
+        )
+        self.assertEqual(
+            report.summary(),
+            "5 values do not match the template:\n"
+            "  column A: 4 invalid values, e.g. 'value 2' (line 2), 'value 3' (line 3)\n"
+            "  column AB: 1 invalid values, e.g. 'x' (line 3)"
+        )
+
+    def test_strict(self):
+        report = errors.ErrorReport(strict=True)
+        with self.assertRaises(errors.DataError) as context:
+            report.add('B', 12, 'foo', AttributeError('expected a boolean got foo.'))
+        self.assertEqual(context.exception.column, 'B')
+        self.assertEqual(context.exception.line, 12)
+        self.assertEqual(context.exception.value, 'foo')
+        self.assertEqual(
+            str(context.exception),
+            "(column 'B', line '12') data does not match template: expected a boolean got foo.",
+        )
+
+    def test_invalid_value(self):
+        report = errors.ErrorReport()
+        report.add('A', 2, 'foo', errors.InvalidValue('a boolean', 'foo'))
+        self.assertEqual(report.samples['A'], [(2, 'foo', 'expected a boolean got foo.')])
+        error = pickle.loads(pickle.dumps(errors.InvalidValue('a boolean', 'foo')))
+        self.assertEqual(str(error), 'expected a boolean got foo.')
+
+    def test_pickle(self):
+        error = pickle.loads(pickle.dumps(errors.DataError('B', 12, 'foo', 'expected a number')))
+        self.assertEqual((error.column, error.line, error.value, error.reason), ('B', 12, 'foo', 'expected a number'))
+        self.assertEqual(str(error), "(column 'B', line '12') data does not match template: expected a number")
+
+    def test_merge(self):
+        report, other = errors.ErrorReport(max_samples=2), errors.ErrorReport(max_samples=2)
+        report.add('A', 2, 'a', AttributeError())
+        for line in range(3, 6):
+            other.add('A', line, 'b', AttributeError())
+        report.merge(other)
+        self.assertEqual(report.counts, {'A': 4})
+        self.assertEqual([sample[0] for sample in report.samples['A']], [2, 3])
+
+    def test_render_worksheet(self):
+        data = [[[42, 'a', 'not a date'], ['not a number', 'b', 1.5]], [['x', 'c', 2]]]
+        for executor in (None, concurrent.futures.ThreadPoolExecutor(2)):
+            with self.subTest(executor=executor):
+                report = errors.ErrorReport()
+                worksheet = render.render_worksheet(
+                    data, gen_xlsx_sheet(with_header=True), executor=executor, errors=report,
+                )
+                b''.join(worksheet)
+                self.assertEqual(report.counts, {'A': 2, 'C': 1})
+                self.assertEqual(report.samples['A'][0][:2], (3, 'not a number'))
+                self.assertEqual(report.samples['A'][0][2], 'expected a numeric or date like value got not a number.')
+                self.assertEqual(report.samples['A'][1][:2], (4, 'x'))
+
+    def test_stream_queryset_as_xlsx_strict(self):
+        qs = [[1, 'a', 1.5], ['b', 'b', 1.5]]
+        stream = streaming.stream_queryset_as_xlsx(
+            qs, xlsx_template=gen_xlsx_template(), errors=errors.ErrorReport(strict=True),
+        )
+        with self.assertRaises(errors.DataError) as context:
+            b''.join(stream)
+        self.assertEqual((context.exception.column, context.exception.line), ('A', 2))
+
+    def test_render_worksheet_strict_in_processes(self):
+        data = [[[42, 'a', 1.5]], [['not a number', 'b', 1.5]]]
+        with concurrent.futures.ProcessPoolExecutor(2) as executor:
+            worksheet = render.render_worksheet(
+                data, gen_xlsx_sheet(with_header=True), executor=executor, errors=errors.ErrorReport(strict=True),
+            )
+            with self.assertRaises(errors.DataError) as context:
+                b''.join(worksheet)
+        self.assertEqual((context.exception.column, context.exception.line), ('A', 3))
@@ -0,0 +1,92 @@
+import functools
+import io
+import os
+import pickle
+import tempfile
+import unittest
+import zipfile
+from xml.etree import ElementTree as ETree
+
+import openpyxl
+
+from xlsx_streaming import jobs
+from xlsx_streaming import streaming
+
+from .utils import gen_xlsx_template
+
+
+def get_rows(count):
+    return [[i, f'row {i}'] for i in range(count)]
+
+
+def failing_rows():
+    raise ValueError('no rows')
+
+
+class TestPreparedTemplate(unittest.TestCase):
+
+    def test_stream(self):
+        template = gen_xlsx_template(with_header=True)
+        prepared = jobs.PreparedTemplate(template)
+        template.seek(0)
+        rows = [[i, f'row {i}', None] for i in range(10)]
+        expected = openpyxl.load_workbook(io.BytesIO(b''.join(streaming.stream_queryset_as_xlsx(rows, template))))
+        document = b''.join(prepared.stream([rows]))
+        result = openpyxl.load_workbook(io.BytesIO(document))
+        self.assertEqual(list(result.active.values), list(expected.active.values))
+
+    def test_stream_leaves_template_unchanged(self):
+        prepared = jobs.PreparedTemplate(gen_xlsx_template(with_header=True))
+        row_template = ETree.tostring(prepared.template_elements[2])
+        b''.join(prepared.stream([[[1, 'a', None]]]))
+        self.assertEqual(ETree.tostring(prepared.template_elements[2]), row_template)
+
+    def test_pickle(self):
+        prepared = pickle.loads(pickle.dumps(jobs.PreparedTemplate(columns=['int', 'text'])))
+        document = b''.join(prepared.stream([get_rows(3)]))
+        rows = list(openpyxl.load_workbook(io.BytesIO(document)).active.values)
+        self.assertEqual(rows, [(0, 'row 0'), (1, 'row 1'), (2, 'row 2')])
+
+
+class TestRunJobs(unittest.TestCase):
+
+    def test_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            targets = [os.path.join(directory, f'{i}.xlsx') for i in range(5)]
+            report = jobs.run_jobs(
+                [(target, get_rows(i * 10)) for i, target in enumerate(targets)],
+                columns=['int', 'text'], max_workers=2, batch_size=7,
+            )
+            self.assertEqual(len(report.results), 5)
+            self.assertEqual(report.rows, 100)
+            self.assertEqual(report.failed, [])
+            for i, target in enumerate(targets):
+                rows = list(openpyxl.load_workbook(target).active.values)
+                self.assertEqual(len(rows), i * 10)
+        self.assertIn('5 documents (100 rows', report.summary())
+
+    def test_archive(self):
+        output = io.BytesIO()
+        exports = ((f'customer-{i}.xlsx', functools.partial(get_rows, 20)) for i in range(6))
+        report = jobs.run_jobs(
+            exports, columns=['int', 'text'], max_workers=2, output=output,
+        )
+        self.assertEqual(report.rows, 120)
+        with zipfile.ZipFile(output) as outer:
+            self.assertEqual(sorted(outer.namelist()), [f'customer-{i}.xlsx' for i in range(6)])
+            for zinfo in outer.infolist():
+                self.assertEqual(zinfo.compress_type, zipfile.ZIP_STORED)
+                rows = list(openpyxl.load_workbook(io.BytesIO(outer.read(zinfo))).active.values)
+                self.assertEqual(rows[-1], (19, 'row 19'))
+        self.assertEqual(report.size, sum(result.size for result in report.results))
+
+    def test_failed_job(self):
+        output = io.BytesIO()
+        report = jobs.run_jobs(
+            [('ok.xlsx', get_rows(3)), ('failed.xlsx', failing_rows)],
+            columns=['int', 'text'], max_workers=0, output=output,
+        )
+        self.assertEqual([result.target for result in report.failed], ['failed.xlsx'])
+        self.assertIn('no rows', report.failed[0].error)
+        with zipfile.ZipFile(output) as outer:
+            self.assertEqual(outer.namelist(), ['ok.xlsx'])
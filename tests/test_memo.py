@@ -0,0 +1,101 @@
+import datetime
+import decimal
+import unittest
+from unittest import mock
+
+from xlsx_streaming import render
+from xlsx_streaming import ValueCache
+
+from .utils import gen_xlsx_sheet
+
+
+class TestValueCache(unittest.TestCase):
+
+    def test_get_encoder(self):
+        cache = ValueCache(maxsize=2)
+        encode = cache.get_encoder('A', render.encode_number)
+        self.assertEqual(
+            [encode(value) for value in (1, 1, 1.0, True)], ['<v>1</v>', '<v>1</v>', '<v>1.0</v>', '<v>True</v>'],
+        )
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+        self.assertEqual(cache.info()['A'].currsize, 2)
+        self.assertEqual(encode(1), '<v>1</v>')  # evicted
+        self.assertEqual(cache.misses, 4)
+
+    def test_encoder_built_once(self):
+        cache = ValueCache()
+        self.assertIs(cache.get_encoder('A', render.encode_number), cache.get_encoder('A', render.encode_number))
+
+    def test_equal_values_encoded_differently(self):
+        cache = ValueCache()
+        encode = cache.get_encoder('A', render.encode_number)
+        values = [decimal.Decimal('1.00'), decimal.Decimal('1.0'), 0.0, -0.0] * 2
+        self.assertEqual(
+            [encode(value) for value in values], ['<v>1.00</v>', '<v>1.0</v>', '<v>0.0</v>', '<v>-0.0</v>'] * 2,
+        )
+        self.assertEqual((cache.hits, cache.misses), (4, 4))
+        encode = cache.get_encoder('B', render.encode_text)
+        paris = datetime.timezone(datetime.timedelta(hours=1))
+        values = [
+            datetime.datetime(2012, 1, 2, tzinfo=datetime.timezone.utc), datetime.datetime(2012, 1, 2, 1, tzinfo=paris),
+        ]
+        self.assertEqual([encode(value) for value in values], [render.encode_text(value) for value in values])
+        self.assertEqual(cache.info()['B'].misses, 2)
+
+    def test_unhashable(self):
+        cache = ValueCache()
+        encode = cache.get_encoder('A', render.encode_text)
+        self.assertEqual(encode(['a']), encode(['a']))
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+
+    def test_columns(self):
+        cache = ValueCache()
+        cache.get_encoder('A', render.encode_text)('a')
+        cache.get_encoder('A', render.encode_number)(1)
+        cache.get_encoder('B', render.encode_text)('a')
+        self.assertEqual({column: info.misses for column, info in cache.info().items()}, {'A': 2, 'B': 1})
+        self.assertEqual(repr(cache), '<ValueCache: 0 hits, 3 misses>')
+
+    def test_invalid_size(self):
+        self.assertRaises(ValueError, ValueCache, 0)
+
+
+class TestRenderWithCache(unittest.TestCase):
+
+    rows = [
+        [42, 'Noé!>\x02', datetime.datetime(2012, 1, 2, 10, 10)],
+        [42, 'Noé!>\x02', 'bad date'],
+        [None, 'a', None],
+    ] * 3
+
+    def render(self, **options):
+        return b''.join(render.render_worksheet([self.rows], gen_xlsx_sheet(), **options))
+
+    def test_render(self):
+        cache = ValueCache()
+        self.assertEqual(self.render(cache=cache), self.render())
+        self.assertEqual(cache.info()['B'].misses, 2)
+        self.assertEqual(cache.info()['B'].hits, 7)
+        # invalid values are not cached, and reported each time
+        self.assertEqual(cache.info()['C'].misses, 5)
+
+    def test_render_resolves_encoders_once(self):
+        cache = ValueCache()
+        with mock.patch.object(cache, 'get_encoder', wraps=cache.get_encoder) as get_encoder:
+            self.render(cache=cache)
+        self.assertEqual(get_encoder.call_count, 3)  # once per cell of the row template
+
+    def test_render_trusted(self):
+        cache = ValueCache()
+        rows = [row for row in self.rows if row[2] != 'bad date']
+        self.assertEqual(
+            b''.join(render.render_worksheet([rows], gen_xlsx_sheet(), trusted=True, cache=cache)),
+            b''.join(render.render_worksheet([rows], gen_xlsx_sheet(), trusted=True)),
+        )
+        self.assertEqual(cache.info()['A'].hits, 2)
+
+    def test_render_trusted_default_template(self):
+        cache = ValueCache()
+        rows, _ = render.render_rows_trusted([['a'], ['a']], None, 1, cache=cache)
+        self.assertEqual(rows.count(b'<t>a</t>'), 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
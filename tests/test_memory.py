@@ -0,0 +1,140 @@
+"""
+Check that streaming a document uses a bounded amount of memory, whatever its number of rows.
+
+The peak of the memory allocated while streaming ``XLSX_STREAMING_MEMORY_ROWS`` rows (2000 by
+default, set it to 1000000 or more for a thorough run) is compared to the peak while streaming
+a tenth of them: it must be the same, within a tolerance. The memory still allocated once the
+documents are streamed must be the same as well: the slack allowed is proportional to the number of
+rows (up to 256 KiB), so that a leak of a few bytes per row fails with the default number of rows.
+"""
+import concurrent.futures
+import datetime
+import gc
+import io
+import os
+import tracemalloc
+import unittest
+
+import xlsx_streaming
+
+from .utils import gen_xlsx_template
+
+
+MEMORY_ROWS = int(os.environ.get('XLSX_STREAMING_MEMORY_ROWS', 2000))
+BATCH_SIZE = 50
+# the peak memory of the large export may exceed the one of the small export by this ratio and size
+TOLERANCE = 0.2
+SLACK = min(16 * MEMORY_ROWS, 256 * 1024)
+
+START = datetime.datetime(2020, 1, 1)
+
+
+def gen_row(i):
+    return [i, f'label {i % 97}', START + datetime.timedelta(minutes=i)]
+
+
+class SyntheticRows:
+    """A sliceable sequence of rows (like a queryset), generated when sliced."""
+
+    def __init__(self, count):
+        self.count = count
+
+    def __getitem__(self, items):
+        return [gen_row(i) for i in range(*items.indices(self.count))]
+
+
+class SyntheticCursor:
+    """A DB-API cursor whose rows are generated when fetched."""
+
+    description = [('id', None), ('label', None), ('created_at', None)]
+
+    def __init__(self, count):
+        self.count = count
+        self.position = 0
+
+    def fetchmany(self, size):
+        start, self.position = self.position, min(self.position + size, self.count)
+        return [tuple(gen_row(i)) for i in range(start, self.position)]
+
+
+def measure_memory(stream_factory, rows):
+    """
+    Return the memory still allocated once a document of ``rows`` rows is streamed, and the peak
+    of the memory allocated while streaming it.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for _ in stream_factory(rows):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return retained, peak
+
+
+class TestConstantMemory(unittest.TestCase):
+
+    def assertConstantMemory(self, stream_factory):  # pylint: disable=invalid-name
+        small_rows = MEMORY_ROWS // 10
+        measure_memory(stream_factory, small_rows)  # warm up the caches (default template, converters, …)
+        small_retained, small_peak = measure_memory(stream_factory, small_rows)
+        large_retained, large_peak = measure_memory(stream_factory, MEMORY_ROWS)
+        self.assertLessEqual(
+            large_peak, small_peak * (1 + TOLERANCE) + SLACK,
+            f'{MEMORY_ROWS} rows: peak of {large_peak} bytes, {small_rows} rows: peak of {small_peak} bytes',
+        )
+        self.assertLessEqual(
+            large_retained, small_retained + SLACK,
+            f'{MEMORY_ROWS} rows: {large_retained} bytes retained, {small_rows} rows: {small_retained} bytes retained',
+        )
+
+    def stream(self, **options):
+        def stream_factory(rows):
+            return xlsx_streaming.stream_queryset_as_xlsx(SyntheticRows(rows), batch_size=BATCH_SIZE, **options)
+        return stream_factory
+
+    def test_default_template(self):
+        self.assertConstantMemory(self.stream())
+
+    def test_template(self):
+        template = gen_xlsx_template(with_header=True).getvalue()
+        self.assertConstantMemory(lambda rows: xlsx_streaming.stream_queryset_as_xlsx(
+            SyntheticRows(rows), xlsx_template=io.BytesIO(template), batch_size=BATCH_SIZE,
+        ))
+
+    def test_columns(self):
+        columns = [xlsx_streaming.Column('id', 'int'), 'text', 'datetime']
+        self.assertConstantMemory(self.stream(columns=columns))
+
+    def test_trusted_compact(self):
+        self.assertConstantMemory(self.stream(columns=['int', 'text', 'datetime'], trusted=True, compact=True))
+
+    def test_iterator(self):
+        self.assertConstantMemory(lambda rows: xlsx_streaming.stream_queryset_as_xlsx(
+            (gen_row(i) for i in range(rows)), batch_size=BATCH_SIZE,
+        ))
+
+    def test_adaptive_batch_size(self):
+        self.assertConstantMemory(lambda rows: xlsx_streaming.stream_queryset_as_xlsx(
+            SyntheticRows(rows), batch_size=xlsx_streaming.AdaptiveBatchSize(BATCH_SIZE, 10, 2 * BATCH_SIZE),
+        ))
+
+    def test_batch_bytes(self):
+        self.assertConstantMemory(self.stream(batch_bytes=16 * 1024))
+
+    def test_pipeline(self):
+        self.assertConstantMemory(lambda rows: xlsx_streaming.stream_queryset_as_xlsx(
+            SyntheticRows(rows), batch_size=BATCH_SIZE, pipeline=xlsx_streaming.Pipeline(),
+        ))
+
+    def test_executor(self):
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            self.assertConstantMemory(self.stream(executor=executor))
+
+    def test_cursor(self):
+        self.assertConstantMemory(lambda rows: xlsx_streaming.stream_cursor_as_xlsx(
+            SyntheticCursor(rows), batch_size=BATCH_SIZE,
+        ))
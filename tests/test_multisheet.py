@@ -0,0 +1,173 @@
+import datetime
+import io
+import itertools
+import os
+import tempfile
+import threading
+import time
+import unittest
+import zipfile
+
+import openpyxl
+
+import xlsx_streaming
+from xlsx_streaming import multisheet
+from xlsx_streaming import streaming
+
+
+def gen_workbook_template():
+    workbook = openpyxl.Workbook()
+    workbook.active.title = 'Summary'
+    workbook.active.append(['Total'])
+    workbook.active.append([42])
+    detail = workbook.create_sheet('Detail')
+    detail.append(['Id', 'Label', 'Date'])
+    detail.append([1, 'label', datetime.datetime(2020, 1, 1)])
+    workbook.create_sheet('Audit').append(['kept as is'])
+    template = io.BytesIO()
+    workbook.save(template)
+    template.seek(0)
+    return template
+
+
+def read_sheets(stream):
+    workbook = openpyxl.load_workbook(io.BytesIO(b''.join(stream)))
+    return {worksheet.title: list(worksheet.values) for worksheet in workbook.worksheets}
+
+
+def gen_details(count):
+    return [[i, f'label {i}', datetime.datetime(2020, 1, 1, i % 24)] for i in range(count)]
+
+
+class TestStreamSheets(unittest.TestCase):
+
+    def test_sheets(self):
+        sheets = read_sheets(xlsx_streaming.stream_sheets_as_xlsx(
+            [[[1000]], gen_details(3000)], gen_workbook_template(), batch_size=100,
+        ))
+        self.assertEqual(list(sheets), ['Summary', 'Detail', 'Audit'])
+        self.assertEqual(sheets['Summary'], [('Total',), (1000,)])
+        self.assertEqual(len(sheets['Detail']), 3001)
+        self.assertEqual(sheets['Detail'][:2], [('Id', 'Label', 'Date'), (0, 'label 0', datetime.datetime(2020, 1, 1))])
+        self.assertEqual(sheets['Audit'], [('kept as is',)])
+
+    def test_sheets_without_data_row(self):
+        workbook = openpyxl.Workbook()
+        for title in ('One', 'Three', 'Ragged'):
+            workbook.create_sheet(title)
+        workbook.remove(workbook.active)
+        template = io.BytesIO()
+        workbook.save(template)
+        sheets = [
+            [[i] for i in range(2000)],
+            [[i, i + 1, i + 2] for i in range(2000)],
+            [[i, i + 1] if i % 2 else [i, i + 1, i + 2, i + 3] for i in range(2000)],
+        ]
+        for options in ({}, {'trusted': True}):
+            with self.subTest(**options):
+                result = read_sheets(xlsx_streaming.stream_sheets_as_xlsx(
+                    sheets, io.BytesIO(template.getvalue()), batch_size=10, **options,
+                ))
+                self.assertEqual(list(result), ['One', 'Three', 'Ragged'])
+                for rows, values in zip(sheets, result.values()):
+                    self.assertEqual(
+                        [tuple(value for value in row if value is not None) for row in values],
+                        [tuple(str(value) for value in row) for row in rows],
+                    )
+
+    def test_options(self):
+        template = gen_workbook_template().getvalue()
+        expected = read_sheets(xlsx_streaming.stream_sheets_as_xlsx(
+            [[[1]], gen_details(500), [['audit']]], io.BytesIO(template),
+        ))
+        for options in ({'trusted': True}, {'compact': True}, {'spill_size': 1024, 'max_workers': 1}):
+            with self.subTest(**options):
+                self.assertEqual(read_sheets(xlsx_streaming.stream_sheets_as_xlsx(
+                    [[[1]], gen_details(500), [['audit']]], io.BytesIO(template), batch_size=50, **options,
+                )), expected)
+
+    def test_sheet_serializer(self):
+        sheets = read_sheets(xlsx_streaming.stream_sheets_as_xlsx(
+            [multisheet.Sheet([7], serializer=lambda rows: [[row * 2] for row in rows]), gen_details(2)],
+            gen_workbook_template(),
+            serializer=lambda rows: [row[:2] + [None] for row in rows],
+        ))
+        self.assertEqual(sheets['Summary'], [('Total',), (14,)])
+        self.assertEqual(sheets['Detail'][1:], [(0, 'label 0', None), (1, 'label 1', None)])
+
+    def test_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'template.xlsx')
+            with open(path, 'wb') as template_file:
+                template_file.write(gen_workbook_template().getvalue())
+            sheets = read_sheets(xlsx_streaming.stream_sheets_as_xlsx([[[1]]], path))
+        self.assertEqual(sheets['Summary'], [('Total',), (1,)])
+        self.assertEqual(sheets['Detail'][0], ('Id', 'Label', 'Date'))
+
+    def test_too_many_sheets(self):
+        with self.assertRaisesRegex(ValueError, '4 sheets of rows'):
+            xlsx_streaming.stream_sheets_as_xlsx([[]] * 4, gen_workbook_template())
+        self.assertRaises(ValueError, xlsx_streaming.stream_sheets_as_xlsx, [], gen_workbook_template())
+
+    def test_concurrent_sheets(self):
+        def slow_rows(count):
+            for i in range(count):
+                time.sleep(.05)  # e.g. a database query for each batch
+                yield [i]
+
+        started_at = time.perf_counter()
+        sheets = read_sheets(xlsx_streaming.stream_sheets_as_xlsx(
+            [slow_rows(6), slow_rows(6), slow_rows(6)], gen_workbook_template(), batch_size=1,
+        ))
+        self.assertLess(time.perf_counter() - started_at, 0.75)  # 0.9s if the sheets were written in turn
+        self.assertEqual([len(rows) for rows in sheets.values()], [7, 7, 6])
+
+    def test_background_error(self):
+        def failing_rows():
+            yield [1, 'a', None]
+            raise ValueError('query failed')
+
+        with self.assertRaisesRegex(ValueError, 'query failed'):
+            b''.join(xlsx_streaming.stream_sheets_as_xlsx([[[1]], failing_rows()], gen_workbook_template()))
+
+    def test_close(self):
+        fetched = []
+
+        def endless_rows():
+            for i in itertools.count():
+                fetched.append(i)
+                yield [i, 'label', None]
+
+        threads = threading.active_count()
+        stream = xlsx_streaming.stream_sheets_as_xlsx([[[1]], endless_rows()], gen_workbook_template(), batch_size=10)
+        next(stream)
+        stream.close()  # the background sheet stops at its next batch
+        self.assertEqual(threading.active_count(), threads)
+        count = len(fetched)
+        time.sleep(.01)
+        self.assertEqual(len(fetched), count)
+
+
+class TestSheetNames(unittest.TestCase):
+
+    def test_workbook_order(self):
+        template = gen_workbook_template()
+        output = io.BytesIO()
+        with zipfile.ZipFile(template) as zip_template, zipfile.ZipFile(output, 'w') as zip_output:
+            for zinfo in zip_template.infolist():
+                data = zip_template.read(zinfo)
+                if zinfo.filename == streaming.WORKBOOK_RELS_PATH:  # the first sheet of the workbook is sheet3.xml
+                    data = data.replace(b'sheet1.xml', b'sheetX.xml').replace(b'sheet3.xml', b'sheet1.xml')
+                    data = data.replace(b'sheetX.xml', b'sheet3.xml')
+                zip_output.writestr(zinfo, data)
+        with zipfile.ZipFile(output) as zip_file:
+            self.assertEqual(
+                streaming.get_sheet_names(zip_file),
+                ['xl/worksheets/sheet3.xml', 'xl/worksheets/sheet2.xml', 'xl/worksheets/sheet1.xml'],
+            )
+
+    def test_without_workbook(self):
+        output = io.BytesIO()
+        with zipfile.ZipFile(output, 'w') as zip_file:
+            zip_file.writestr('xl/worksheets/sheet1.xml', '<worksheet/>')
+            self.assertEqual(streaming.get_sheet_names(zip_file), ['xl/worksheets/sheet1.xml'])
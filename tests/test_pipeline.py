@@ -0,0 +1,78 @@
+import threading
+import time
+import unittest
+
+from xlsx_streaming import pipeline
+
+
+class TestPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.pipeline = pipeline.Pipeline(maxsize=2, poll_interval=0.01)
+        self.produced = []
+        self.closed = threading.Event()
+
+    def source(self, count=100):
+        try:
+            for i in range(count):
+                self.produced.append(i)
+                yield i
+        finally:
+            self.closed.set()
+
+    def test_stages(self):
+        numbers = self.pipeline.stage('numbers', self.source(10))
+        squares = self.pipeline.stage('squares', (i * i for i in numbers))
+        self.assertEqual(list(squares), [i * i for i in range(10)])
+        self.assertTrue(self.closed.is_set())
+        self.assertEqual([stage.name for stage in self.pipeline.stages], ['numbers', 'squares'])
+        self.assertEqual([stage.items for stage in self.pipeline.stages], [10, 10])
+        self.assertEqual([stage.depth for stage in self.pipeline.stages], [0, 0])
+
+    def test_backpressure(self):
+        stage = self.pipeline.stage('numbers', self.source())
+        for i, item in enumerate(stage):
+            self.assertEqual(item, i)
+            time.sleep(0.002)
+            # the item being put, the items in the queue and the item being read
+            self.assertLessEqual(len(self.produced), i + 1 + self.pipeline.maxsize + 1)
+        metrics = self.pipeline.stages[0]
+        self.assertLessEqual(metrics.max_depth, self.pipeline.maxsize)
+        self.assertGreater(metrics.put_wait, 0)
+
+    def test_close(self):
+        numbers = self.pipeline.stage('numbers', self.source())
+        squares = self.pipeline.stage('squares', (i * i for i in numbers))
+        self.assertEqual(next(squares), 0)
+        squares.close()
+        self.assertTrue(self.closed.is_set())
+        self.assertLess(len(self.produced), 10)
+        self.assertFalse([thread for thread in threading.enumerate() if thread.name.startswith('xlsx-streaming-')])
+
+    def test_error(self):
+        def failing():
+            yield 1
+            raise ValueError('boom')
+        stage = self.pipeline.stage('failing', failing())
+        self.assertEqual(next(stage), 1)
+        with self.assertRaisesRegex(ValueError, 'boom'):
+            next(stage)
+
+    def test_cancel(self):
+        def slow():
+            while True:
+                time.sleep(0.01)
+                yield 1
+        stage = self.pipeline.stage('slow', slow())
+        next(stage)
+        self.pipeline.cancel()
+        self.assertTrue(self.pipeline.cancelled)
+        with self.assertRaises(pipeline.PipelineCancelled):
+            list(stage)
+
+    def test_not_started(self):
+        self.pipeline.stage('numbers', self.source())
+        self.assertEqual(self.produced, [])
+
+    def test_invalid_maxsize(self):
+        self.assertRaises(ValueError, pipeline.Pipeline, maxsize=0)
@@ -0,0 +1,100 @@
+import datetime
+import io
+import os
+import sqlite3
+import tempfile
+import unittest
+
+import openpyxl
+
+import xlsx_streaming
+from xlsx_streaming import profiling
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.rows = [[i, f'row {i}', datetime.datetime(2020, 1, 1)] for i in range(500)]
+
+    def export(self, profiler, **options):
+        document = b''.join(xlsx_streaming.stream_queryset_as_xlsx(
+            self.rows, columns=['int', 'text', 'datetime'], batch_size=100, profiler=profiler, **options,
+        ))
+        self.assertEqual(len(list(openpyxl.load_workbook(io.BytesIO(document)).active.values)), 500)
+
+    def test_stages(self):
+        profiler = xlsx_streaming.Profiler()
+        self.export(profiler, serializer=lambda rows: (list(row) for row in rows))
+        self.assertTrue(profiler.finished)
+        self.assertEqual(list(profiler.stages), list(profiling.STAGES))
+        self.assertGreater(profiler.stages['render'], 0.)
+        self.assertGreater(profiler.stages['serialize'], 0.)
+        self.assertAlmostEqual(sum(profiler.stages.values()), profiler.elapsed)
+
+    def test_encoders(self):
+        profiler = xlsx_streaming.Profiler()
+        self.export(profiler)
+        self.assertEqual(profiler.encoders['_get_numeric_text'][0], 1000)  # int and datetime cells
+        self.assertEqual(profiler.encoders['_get_text'][0], 500)
+
+    def test_timed_encoders_built_once(self):
+        timed_cache = xlsx_streaming.Profiler().timed_cache(xlsx_streaming.ValueCache())
+        encoder = timed_cache.get_encoder('A', str)
+        self.assertIs(timed_cache.get_encoder('A', str), encoder)
+        self.assertIsNot(timed_cache.get_encoder('B', str), encoder)
+
+    def test_trusted_encoders(self):
+        profiler = xlsx_streaming.Profiler()
+        self.export(profiler, trusted=True)
+        self.assertEqual(
+            {name: calls for name, (calls, _) in profiler.encoders.items()},
+            {'encode_int': 500, 'encode_text': 500, 'encode_datetime': 500},
+        )
+
+    def test_cache(self):
+        profiler, cache = xlsx_streaming.Profiler(), xlsx_streaming.ValueCache()
+        self.export(profiler, trusted=True, cache=cache)
+        self.assertEqual(profiler.encoders['encode_datetime'][0], 500)
+        self.assertEqual((cache.hits, cache.misses), (499, 1001))  # a single datetime value
+
+    def test_report_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'profile.txt')
+            profiler = xlsx_streaming.Profiler(path, cprofile=True, limit=5)
+            self.export(profiler)
+            with open(path, encoding='utf-8') as report_file:
+                report = report_file.read()
+        self.assertIsNotNone(profiler.stats)
+        self.assertEqual(report, profiler.report())
+        self.assertTrue(report.startswith('Export profile (complete)'))
+        self.assertIn('render ', report)
+        self.assertIn('_get_text', report)
+        self.assertIn('Ordered by: cumulative time', report)
+
+    def test_failed_export(self):
+        def serializer(rows):
+            if rows[0][0] >= 200:
+                raise ValueError('invalid row')
+            return rows
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'profile.txt')
+            profiler = xlsx_streaming.Profiler(path)
+            with self.assertRaises(ValueError):
+                b''.join(xlsx_streaming.stream_queryset_as_xlsx(self.rows, serializer=serializer, profiler=profiler,
+                                                                 batch_size=100))
+            with open(path, encoding='utf-8') as report_file:
+                self.assertTrue(report_file.read().startswith('Export profile (incomplete)'))
+        self.assertFalse(profiler.finished)
+
+    def test_stream_cursor(self):
+        connection = sqlite3.connect(':memory:')
+        connection.execute('CREATE TABLE t (id INTEGER, label TEXT)')
+        connection.executemany('INSERT INTO t VALUES (?, ?)', [row[:2] for row in self.rows])
+        profiler = xlsx_streaming.Profiler()
+        document = b''.join(xlsx_streaming.stream_cursor_as_xlsx(
+            connection.execute('SELECT * FROM t'), batch_size=100, profiler=profiler,
+        ))
+        self.assertEqual(len(list(openpyxl.load_workbook(io.BytesIO(document)).active.values)), 501)
+        self.assertGreater(profiler.stages['fetch'], 0.)
+        self.assertEqual(profiler.encoders['_get_text'][0], 500)
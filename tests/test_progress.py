@@ -0,0 +1,80 @@
+import sqlite3
+import unittest
+from unittest import mock
+
+import xlsx_streaming
+from xlsx_streaming import progress as progress_module
+
+
+class TestProgress(unittest.TestCase):
+
+    def test_not_started(self):
+        progress = xlsx_streaming.Progress(total=100)
+        self.assertEqual(progress.elapsed, 0.)
+        self.assertEqual(progress.rows_per_second, 0.)
+        self.assertEqual(progress.fraction, 0.)
+        self.assertIsNone(progress.eta)
+
+    @mock.patch.object(progress_module.time, 'perf_counter')
+    def test_eta(self, perf_counter):
+        perf_counter.return_value = 10.
+        progress = xlsx_streaming.Progress(total=1000)
+        progress.add_batch(250)
+        perf_counter.return_value = 15.
+        self.assertEqual(progress.elapsed, 5.)
+        self.assertEqual(progress.rows_per_second, 50.)
+        self.assertEqual(progress.fraction, .25)
+        self.assertEqual(progress.eta, 15.)
+        self.assertEqual(repr(progress), '<Progress: 250/1000 rows, 1 batches, 0 bytes in 5.0s, ETA 15s>')
+        progress.finish()
+        perf_counter.return_value = 20.
+        self.assertEqual(progress.elapsed, 5.)
+        self.assertEqual((progress.fraction, progress.eta), (1., 0.))
+
+    def test_unknown_total(self):
+        progress = xlsx_streaming.Progress()
+        progress.add_batch(10)
+        self.assertIsNone(progress.fraction)
+        self.assertIsNone(progress.eta)
+
+
+class TestStreamProgress(unittest.TestCase):
+
+    def setUp(self):
+        self.rows = [[i, f'row {i}'] for i in range(1050)]
+        self.reports = []
+
+    def callback(self, progress):
+        self.reports.append((progress.rows, progress.batches, progress.finished))
+
+    def check_progress(self, progress, stream):
+        self.assertEqual(progress.rows, 0)
+        document = b''.join(stream)
+        self.assertEqual(progress.rows, 1050)
+        self.assertEqual(progress.batches, 11)
+        self.assertEqual(progress.compressed_size, len(document))
+        self.assertGreater(progress.size, progress.compressed_size)
+        self.assertTrue(progress.finished)
+        self.assertEqual(self.reports[0], (100, 1, False))
+        self.assertEqual(self.reports[-2:], [(1050, 11, False), (1050, 11, True)])
+
+    def test_stream_queryset(self):
+        progress = xlsx_streaming.Progress(total=1050, callback=self.callback)
+        stream = xlsx_streaming.stream_queryset_as_xlsx(self.rows, batch_size=100, progress=progress)
+        self.check_progress(progress, stream)
+
+    def test_stream_queryset_pipeline(self):
+        progress = xlsx_streaming.Progress(callback=self.callback)
+        stream = xlsx_streaming.stream_queryset_as_xlsx(
+            self.rows, batch_size=100, progress=progress, pipeline=xlsx_streaming.Pipeline(),
+        )
+        self.check_progress(progress, stream)
+
+    def test_stream_cursor(self):
+        connection = sqlite3.connect(':memory:')
+        connection.execute('CREATE TABLE t (id INTEGER, label TEXT)')
+        connection.executemany('INSERT INTO t VALUES (?, ?)', self.rows)
+        cursor = connection.execute('SELECT * FROM t')
+        progress = xlsx_streaming.Progress(callback=self.callback)
+        stream = xlsx_streaming.stream_cursor_as_xlsx(cursor, batch_size=100, progress=progress)
+        self.check_progress(progress, stream)
@@ -1,11 +1,22 @@
+import concurrent.futures
+import datetime
+import decimal
+import enum
+import io
 import unittest
 from xml.etree import ElementTree as ETree
 
+from xlsx_streaming import converters
 from xlsx_streaming import render
+from xlsx_streaming.errors import ErrorReport
 
 from .utils import gen_xlsx_sheet
 
 
+class Size(enum.IntEnum):
+    SMALL = 1
+
+
 class TestOpenXML(unittest.TestCase):
 
     def test_rm_namespace(self):
@@ -28,6 +39,13 @@ class TestOpenXML(unittest.TestCase):
         self.assertEqual(child.tag, 'c')
         self.assertEqual(child.get('r'), 'A1')
 
+    def test_get_elements_from_template_file(self):
+        sheet = gen_xlsx_sheet(with_header=True)
+        for sheet_file in (io.BytesIO(sheet.encode('utf-8')), io.StringIO(sheet)):
+            with self.subTest(sheet_file=sheet_file):
+                header, _, template = render.get_elements_from_template(sheet_file)
+                self.assertEqual((header.get('r'), template.get('r')), ('1', '2'))
+
     def test_views_from_template(self):
         header, views, _ = render.get_elements_from_template(
             gen_xlsx_sheet(with_header=True, with_views=True)
@@ -42,6 +60,39 @@ class TestOpenXML(unittest.TestCase):
         self.assertEqual(views[0][0].get('ySplit'), '1')
         self.assertEqual(views[0][0].get('state'), 'frozen')
 
+    def test_get_elements_from_large_template(self):
+        sheet = gen_xlsx_sheet(with_header=True, with_views=True)
+        rows_start = sheet.index('<row', sheet.index('<row') + 1)
+        rows_end = sheet.index('</sheetData>')
+        extra_rows = ''.join(
+            sheet[rows_start:rows_end].replace('r="2"', f'r="{i}"').replace('2"', f'{i}"') for i in range(3, 20000)
+        )
+        large_sheet = (sheet[:rows_end] + extra_rows + sheet[rows_end:]).encode()
+        sheet_file = io.BytesIO(large_sheet)
+
+        header, views, template = render.get_elements_from_template(sheet_file)
+        self.assertEqual(header.get('r'), '1')
+        self.assertEqual(template.get('r'), '2')
+        self.assertEqual([cell.tag for cell in template], ['c', 'c', 'c'])
+        self.assertEqual(views[0][0].get('state'), 'frozen')
+        # parsing stopped after the second row
+        self.assertLess(sheet_file.tell(), 2 * render.TEMPLATE_CHUNK_SIZE)
+        self.assertGreater(len(large_sheet), 10 * render.TEMPLATE_CHUNK_SIZE)
+
+    def test_get_elements_from_truncated_template(self):
+        sheet = gen_xlsx_sheet(with_header=True)
+        truncated_sheet = sheet[:sheet.index('</sheetData>')]  # not a valid XML document
+        for source in (truncated_sheet, truncated_sheet.encode(), io.BytesIO(truncated_sheet.encode())):
+            header, _, template = render.get_elements_from_template(source)
+            self.assertEqual(header.get('r'), '1')
+            self.assertEqual(template.get('r'), '2')
+
+    def test_get_elements_from_empty_template(self):
+        self.assertEqual(
+            render.get_elements_from_template('<worksheet><sheetData/></worksheet>'),
+            (None, None, None),
+        )
+
     def test_get_column(self):
         self.assertEqual(render.get_column(ETree.Element('c', r='A1')), 'A')
         self.assertEqual(render.get_column(ETree.Element('c', r='ABC123')), 'ABC')
@@ -116,6 +167,16 @@ class TestOpenXML(unittest.TestCase):
         self.assertEqual(row, expected)
 
 
+    def test_render_row_compact(self):
+        template_row = self.gen_row()
+        row = render.render_row([None, 'Noé', 24], template_row, 12, compact=True)
+        self.assertEqual(row, '<row><c t="inlineStr" r="B12"><is><t>Noé</t></is></c><c><v>24</v></c></row>'.encode())
+        row = render.render_row([42, None, None], template_row, 13, compact=True)
+        self.assertEqual(row, b'<row><c t="n"><v>42</v></c></row>')
+        # the template is left complete for the next rows
+        row = render.render_row([1, 'a', 2], template_row, 14)
+        self.assertIn(b'<c r="C14"><v>2</v></c>', row)
+
     def test_render_row_wrong_template(self):
         template_row = self.gen_row()
         row = render.render_row([42, 'Noé!>', 24, 'NoTemplateElement'], template_row, 1)
@@ -201,3 +262,160 @@ class TestOpenXML(unittest.TestCase):
         # render worksheet with an iterator
         data = iter([iter([[42, 'Noé!>', 24], [18, '<éON', 21]])])
         self._verify_sheet(data)
+
+    def test_render_worksheet_with_executor(self):
+        data = [[[i, f'Noé{i}', i * 2] for i in range(start, start + 10)] for start in range(0, 95, 10)]
+        expected = b''.join(render.render_worksheet(data, gen_xlsx_sheet(with_header=True)))
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            worksheet = render.render_worksheet(iter(data), gen_xlsx_sheet(with_header=True), executor=executor)
+            rendered = b''.join(worksheet)
+        self.assertEqual(rendered, expected)
+
+    def test_render_worksheet_max_pending(self):
+        fetched = []
+
+        def gen_batches():
+            for start in range(0, 100, 10):
+                fetched.append(start)
+                yield [[i, f'Noé{i}', i * 2] for i in range(start, start + 10)]
+
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            worksheet = render.render_worksheet(
+                gen_batches(), gen_xlsx_sheet(with_header=True), executor=executor, max_pending=3,
+            )
+            while b'<row r="2"' not in next(worksheet):  # until the first batch
+                pass
+            self.assertEqual(len(fetched), 3)
+            worksheet.close()
+
+    def test_render_worksheet_with_executor_default_template(self):
+        data = [[['a', 'b']], [['c', 'd']]]
+        expected = b''.join(render.render_worksheet(data, '<worksheet><sheetData/></worksheet>'))
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            rendered = b''.join(render.render_worksheet(data, '<worksheet><sheetData/></worksheet>', executor=executor))
+        self.assertEqual(rendered, expected)
+
+    def test_render_worksheet_compact(self):
+        data = [[[42, 'Noé!>', 24], [None, '<éON', None]] * 10, [[None, None, None]]]
+        for options in ({}, {'trusted': True}):
+            with self.subTest(**options):
+                worksheet = b''.join(render.render_worksheet(data, gen_xlsx_sheet(with_header=True), **options))
+                compact = b''.join(
+                    render.render_worksheet(data, gen_xlsx_sheet(with_header=True), compact=True, **options)
+                )
+                self.assertNotIn(b'\n', compact)
+                self.assertLess(len(compact), len(worksheet) * 0.8)
+                rows = list(ETree.fromstring(compact).iter('{%s}row' % render.OPENXML_NS))
+                self.assertEqual([row.get('r') for row in rows], ['1'] + [None] * 21)
+
+    def test_render_worksheet_compact_with_executor(self):
+        data = [
+            [[i, None if i % 3 else f'Noé{i}', i * 2] for i in range(start, start + 10)]
+            for start in range(0, 95, 10)
+        ]
+        expected = b''.join(render.render_worksheet(data, gen_xlsx_sheet(with_header=True), compact=True))
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            worksheet = render.render_worksheet(
+                iter(data), gen_xlsx_sheet(with_header=True), executor=executor, compact=True,
+            )
+            self.assertEqual(b''.join(worksheet), expected)
+
+    def test_compile_row_template(self):
+        cells = render.compile_row_template(self.gen_row())
+        self.assertEqual(cells, [
+            ('A', '', render.encode_number_or_datetime),
+            ('B', ' t="inlineStr"', render.encode_text),
+            ('C', '', render.encode_number_or_datetime),
+        ])
+        row = ETree.Element('row', r='1')
+        ETree.SubElement(row, 'c', t='b', r='A1', s='3')
+        ETree.SubElement(row, 'c', t='n', r='B1')
+        cells = render.compile_row_template(row, [None, render.encode_int])
+        self.assertEqual(cells, [('A', ' s="3" t="b"', render.encode_bool), ('B', '', render.encode_int)])
+
+    def test_render_rows_trusted(self):
+        cells = render.compile_row_template(self.gen_row())
+        rows, lines = render.render_rows_trusted(
+            [[42, 'Noé!>\x02', datetime.date(2012, 1, 2)], [18.5, None, None]], cells, 2,
+        )
+        self.assertEqual(lines, 2)
+        self.assertEqual(
+            rows,
+            '<row r="2">'
+            '<c r="A2"><v>42</v></c>'
+            '<c r="B2" t="inlineStr"><is><t>Noé!&gt;_x0002_</t></is></c>'
+            '<c r="C2"><v>40910.0</v></c>'
+            '</row>\n'
+            '<row r="3">'
+            '<c r="A3"><v>18.5</v></c>'
+            '<c r="B3" t="inlineStr"/>'
+            '<c r="C3"/>'
+            '</row>'.encode()
+        )
+        ETree.fromstring(b'<sheetData>' + rows + b'</sheetData>')
+
+    def test_render_rows_trusted_compact(self):
+        cells = render.compile_row_template(self.gen_row())
+        rows, lines = render.render_rows_trusted([[42, None, 1.5], [None, 'a', None]], cells, 2, compact=True)
+        self.assertEqual(lines, 2)
+        self.assertEqual(
+            rows,
+            b'<row><c><v>42</v></c><c r="C2"><v>1.5</v></c></row>'
+            b'<row><c r="B3" t="inlineStr"><is><t>a</t></is></c></row>'
+        )
+
+    def test_render_rows_trusted_default_template(self):
+        rows, _ = render.render_rows_trusted([[42, 'a&b']], None, 1)
+        self.assertEqual(
+            rows,
+            b'<row r="1"><c r="A1" t="inlineStr"><is><t>42</t></is></c>'
+            b'<c r="B1" t="inlineStr"><is><t>a&amp;b</t></is></c></row>'
+        )
+
+    def test_update_numeric_cell(self):
+        cell = ETree.Element('c', r='A1')
+        sub_elem = ETree.SubElement(cell, 'v')
+        for value, text in [
+                (12, '12'),
+                (-1.5, '-1.5'),
+                (1e20, '1e+20'),
+                (decimal.Decimal('12.50'), '12.50'),
+                (Size.SMALL, '1'),  # int subclass
+                (float('nan'), ''),
+                (float('-inf'), ''),
+                (decimal.Decimal('NaN'), ''),
+                (datetime.date(2012, 1, 2), '40910.0'),
+        ]:
+            with self.subTest(value=value):
+                render.update_cell(cell, line=2, value=value)
+                self.assertEqual(sub_elem.text, text)
+
+        errors = ErrorReport()
+        render.update_cell(cell, line=3, value=True, errors=errors)
+        self.assertEqual(errors.counts['A'], 1)
+
+    def test_update_numeric_cell_converter(self):
+        converters.register_converter(float, lambda value: f'{value:.2f}')
+        self.addCleanup(converters.registry.unregister, float)
+        cell = ETree.Element('c', r='A1')
+        ETree.SubElement(cell, 'v')
+        render.update_cell(cell, line=2, value=1.5)
+        self.assertEqual(cell[0].text, '1.50')
+        self.assertEqual(render.encode_number(1.5), '<v>1.50</v>')
+
+    def test_encoders(self):
+        self.assertEqual(render.encode_int(12.7), '<v>12</v>')
+        self.assertEqual(render.encode_float(12), '<v>12.0</v>')
+        self.assertEqual(render.encode_float(float('inf')), '<v></v>')
+        self.assertEqual(render.encode_number(decimal.Decimal('1.10')), '<v>1.10</v>')
+        self.assertEqual(render.encode_number(float('nan')), '<v></v>')
+        self.assertEqual(render.encode_bool(False), '<v>0</v>')
+        self.assertEqual(render.encode_datetime(datetime.datetime(2012, 1, 2, 12)), '<v>40910.5</v>')
+        self.assertEqual(render.encode_text('<_x0001_>'), '<is><t>&lt;_x005F_x0001_&gt;</t></is>')
+
+    def test_render_worksheet_trusted(self):
+        data = [[[42, 'Noé!>', 24], [18, '<éON', 21]]]
+        worksheet = b''.join(render.render_worksheet(data, gen_xlsx_sheet(with_header=True), trusted=True))
+        tree = ETree.fromstring(worksheet)
+        rows = list(tree.iter('{%s}row' % render.OPENXML_NS))
+        self.assertEqual([row.get('r') for row in rows], ['1', '2', '3'])
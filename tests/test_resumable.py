@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+
+import openpyxl
+
+from xlsx_streaming import resumable
+from xlsx_streaming import streaming
+
+
+class Failure(Exception):
+    pass
+
+
+class TestExportToFile(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'export.xlsx')
+        self.checkpoint_path = self.path + resumable.CHECKPOINT_SUFFIX
+        self.rows = [[i, f'row {i}'] for i in range(1000)]
+        self.requested = []
+
+    def get_rows(self, after=None, fail_at=None):
+        self.requested.append(after)
+        start = 0 if after is None else after + 1
+        for row in self.rows[start:]:
+            if row[0] == fail_at:
+                raise Failure()
+            yield row
+
+    def export(self, fail_at=None, **options):
+        options.setdefault('columns', ['int', 'text'])
+        return resumable.export_to_file(
+            self.path, lambda after: self.get_rows(after, fail_at), key=lambda row: row[0],
+            batch_size=50, checkpoint_every=3, **options,
+        )
+
+    def read(self):
+        return [list(row) for row in openpyxl.load_workbook(self.path).active.values]
+
+    def test_export(self):
+        self.assertEqual(self.export(), 1000)
+        self.assertEqual(self.read(), self.rows)
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+    def test_resume(self):
+        self.assertRaises(Failure, self.export, fail_at=520)
+        checkpoint = resumable.load_checkpoint(self.checkpoint_path)
+        self.assertEqual(checkpoint.key, 449)  # every 3 batches of 50 rows
+        self.assertEqual(checkpoint.line, 451)
+        with open(self.path, 'ab') as output:  # data written after the checkpoint is discarded
+            output.write(b'garbage')
+
+        self.assertEqual(self.export(), 1000)
+        self.assertEqual(self.requested, [None, 449])
+        self.assertEqual(self.read(), self.rows)
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+    def test_resume_default_template(self):
+        self.assertRaises(Failure, self.export, fail_at=520, columns=None)
+        # another document leaves a default template of one column memoized
+        b''.join(streaming.stream_queryset_as_xlsx([['a']] * 3))
+        self.assertEqual(self.export(columns=None), 1000)
+        self.assertEqual(self.read(), [[str(value) for value in row] for row in self.rows])
+
+    def test_resume_compact(self):
+        self.assertRaises(Failure, self.export, fail_at=900, compact=True, trusted=True)
+        self.assertEqual(self.export(compact=True, trusted=True), 1000)
+        self.assertEqual(self.read(), self.rows)
+
+    def test_resume_other_options(self):
+        self.assertRaises(Failure, self.export, fail_at=500)
+        self.assertRaises(ValueError, self.export, compact=True)
+
+    def test_failure_before_checkpoint(self):
+        self.assertRaises(Failure, self.export, fail_at=10)
+        checkpoint = resumable.load_checkpoint(self.checkpoint_path)
+        self.assertIsNone(checkpoint)
+        self.export()
+        self.assertEqual(self.read(), self.rows)
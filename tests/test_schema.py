@@ -0,0 +1,69 @@
+import datetime
+import decimal
+import unittest
+import zipfile
+
+from xlsx_streaming import render
+from xlsx_streaming import schema
+from xlsx_streaming import streaming
+
+
+class TestSchema(unittest.TestCase):
+
+    def test_type_from_value(self):
+        self.assertEqual(schema.type_from_value(None), None)
+        self.assertEqual(schema.type_from_value(True), schema.BOOL)
+        self.assertEqual(schema.type_from_value(12), schema.NUMBER)
+        self.assertEqual(schema.type_from_value(decimal.Decimal('1.5')), schema.NUMBER)
+        self.assertEqual(schema.type_from_value(datetime.datetime(2012, 1, 2)), schema.DATETIME)
+        self.assertEqual(schema.type_from_value(datetime.date(2012, 1, 2)), schema.DATE)
+        self.assertEqual(schema.type_from_value(datetime.time(10, 2)), schema.TIME)
+        self.assertEqual(schema.type_from_value('12'), schema.TEXT)
+
+    def test_types_from_description(self):
+        description = [('a', 23), ('b', None), ('c', None), ('d', float), ('e', None)]
+        rows = [(1, None, 'x', 1.0, None), (2, datetime.date(2012, 1, 2), 'y', 2.0, None)]
+        self.assertEqual(
+            schema.types_from_description(description, rows),
+            [schema.NUMBER, schema.DATE, schema.TEXT, schema.NUMBER, schema.TEXT],
+        )
+
+    def test_build_template(self):
+        template = schema.build_template(
+            [schema.NUMBER, schema.TEXT, schema.DATE, schema.BOOL],
+            header=['a', 'b<', 'c', 'd'],
+        )
+        with zipfile.ZipFile(template) as zip_template:
+            self.assertEqual(zip_template.read(schema.STYLES_PATH).decode(), schema.STYLES_XML)
+            sheet = zip_template.read(streaming.get_first_sheet_name(zip_template)).decode()
+        header, _, row_template = render.get_elements_from_template(sheet)
+        self.assertEqual([cell.get('r') for cell in header], ['A1', 'B1', 'C1', 'D1'])
+        self.assertEqual(
+            [(cell.get('r'), cell.get('t'), cell.get('s')) for cell in row_template],
+            [('A2', None, None), ('B2', 'inlineStr', None), ('C2', None, '1'), ('D2', 'b', None)],
+        )
+
+    def test_build_template_with_columns(self):
+        columns = [
+            schema.Column('id', schema.INT),
+            schema.Column('when', schema.DATETIME),
+            schema.Column('amount', schema.FLOAT, style=1),
+            schema.Column('label'),
+        ]
+        with zipfile.ZipFile(schema.build_template(columns)) as zip_template:
+            sheet = zip_template.read(streaming.get_first_sheet_name(zip_template)).decode()
+        header, _, row_template = render.get_elements_from_template(sheet)
+        self.assertEqual([cell[0][0].text for cell in header], ['id', 'when', 'amount', 'label'])
+        self.assertEqual(
+            [(cell.get('t'), cell.get('s')) for cell in row_template],
+            [(None, None), (None, '2'), (None, '1'), ('inlineStr', None)],
+        )
+
+    def test_get_encoders(self):
+        self.assertEqual(
+            schema.get_encoders([schema.Column('a', schema.DATE), schema.BOOL, ('b', schema.TEXT)]),
+            [render.encode_datetime, render.encode_bool, render.encode_text],
+        )
+
+    def test_build_template_unknown_type(self):
+        self.assertRaises(ValueError, schema.build_template, ['color'])
@@ -0,0 +1,89 @@
+import io
+import os
+import tempfile
+import unittest
+import zipfile
+
+import openpyxl
+
+from xlsx_streaming import sharding
+from xlsx_streaming import streaming
+
+from .utils import gen_xlsx_template
+
+
+class TestSharding(unittest.TestCase):
+
+    def setUp(self):
+        self.rows = [[i, f'row {i}', i / 2] for i in range(250)]
+
+    def _write_parts(self, size=100, **options):
+        parts = []
+        for offset in range(0, len(self.rows), size):
+            part = io.BytesIO()
+            sharding.write_part(part, self.rows[offset:offset + size], offset=offset, **options)
+            parts.append(part)
+        return parts
+
+    def test_write_part(self):
+        part_file = io.BytesIO()
+        part = sharding.write_part(part_file, self.rows[:100], offset=100, columns=['int', 'text', 'float'])
+        self.assertEqual(part.start_line, 101)
+        self.assertEqual(part.lines, 100)
+        self.assertEqual(sharding.read_part(part_file), part)
+        # the deflate stream ends on a byte boundary, with a sync flush
+        data = part_file.getvalue()[:part.compressed_size]
+        self.assertTrue(data.endswith(b'\x00\x00\xff\xff'))
+        self.assertEqual(len(part_file.getvalue()), part.compressed_size + sharding.PART_TRAILER.size)
+
+    def test_stitch_parts(self):
+        columns = ['int', 'text', 'float']
+        parts = self._write_parts(columns=columns)
+        stream = b''.join(sharding.stitch_parts(list(reversed(parts)), columns=columns))
+        with zipfile.ZipFile(io.BytesIO(stream)) as zip_file:
+            self.assertIsNone(zip_file.testzip())
+        rows = list(openpyxl.load_workbook(io.BytesIO(stream)).active.values)
+        self.assertEqual(rows, [tuple(row) for row in self.rows])
+
+    def test_stitch_parts_same_as_stream(self):
+        for options in ({}, {'compact': True}, {'trusted': True}):
+            with self.subTest(**options):
+                parts = self._write_parts(size=70, xlsx_template=gen_xlsx_template(with_header=True), **options)
+                stitch_options = {key: value for key, value in options.items() if key != 'trusted'}
+                stitched = b''.join(
+                    sharding.stitch_parts(parts, xlsx_template=gen_xlsx_template(with_header=True), **stitch_options)
+                )
+                stream = b''.join(streaming.stream_queryset_as_xlsx(
+                    self.rows, xlsx_template=gen_xlsx_template(with_header=True), batch_size=70, **options,
+                ))
+                with zipfile.ZipFile(io.BytesIO(stitched)) as stitched_file, \
+                        zipfile.ZipFile(io.BytesIO(stream)) as stream_file:
+                    sheet_name = streaming.get_first_sheet_name(stream_file)
+                    self.assertEqual(stitched_file.read(sheet_name), stream_file.read(sheet_name))
+
+    def test_stitch_part_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for i, part in enumerate(self._write_parts()):
+                paths.append(os.path.join(directory, f'part-{i}.bin'))
+                with open(paths[-1], 'wb') as part_file:
+                    part_file.write(part.getvalue())
+            stream = b''.join(sharding.stitch_parts(paths))
+        rows = list(openpyxl.load_workbook(io.BytesIO(stream)).active.values)
+        self.assertEqual(rows[-1], ('249', 'row 249', '124.5'))
+
+    def test_write_part_default_template(self):
+        # a previous document leaves a default template of two columns memoized
+        b''.join(streaming.stream_queryset_as_xlsx([['a', 'b']] * 3))
+        part_file = io.BytesIO()
+        sharding.write_part(part_file, self.rows[100:200], offset=100)
+        stream = b''.join(sharding.stitch_parts([self._write_parts()[0], part_file]))
+        rows = list(openpyxl.load_workbook(io.BytesIO(stream)).active.values)
+        self.assertEqual(rows[150], ('150', 'row 150', '75.0'))
+
+    def test_stitch_missing_part(self):
+        parts = self._write_parts()
+        self.assertRaisesRegex(ValueError, 'consecutive', sharding.stitch_parts, [parts[0], parts[2]])
+
+    def test_invalid_part(self):
+        self.assertRaises(ValueError, sharding.read_part, io.BytesIO(b'\x00' * 100))
@@ -0,0 +1,210 @@
+import io
+import pathlib
+import tempfile
+import threading
+import unittest
+import zipfile
+from unittest import mock
+
+import openpyxl
+
+from xlsx_streaming import sinks
+from xlsx_streaming import streaming
+
+
+class TestMultipartUpload(unittest.TestCase):
+
+    def test_upload(self):
+        uploader = sinks.InMemoryUploader()
+        chunks = [bytes([i]) * 300 for i in range(10)]
+        upload_id = sinks.upload_multipart(iter(chunks), uploader, part_size=1000, max_workers=2)
+        self.assertEqual(uploader.objects[upload_id], b''.join(chunks))
+        self.assertEqual(uploader.uploads, {})
+
+    def test_upload_document(self):
+        uploader = sinks.InMemoryUploader()
+        stream = streaming.stream_queryset_as_xlsx([[i, f'row {i}'] for i in range(5000)], batch_size=100)
+        upload_id = sinks.upload_multipart(stream, uploader, part_size=4096)
+        rows = list(openpyxl.load_workbook(io.BytesIO(uploader.objects[upload_id])).active.values)
+        self.assertEqual(rows[4999], ('4999', 'row 4999'))
+
+    def test_empty_stream(self):
+        uploader = sinks.InMemoryUploader()
+        upload_id = sinks.upload_multipart([], uploader)
+        self.assertEqual(uploader.objects[upload_id], b'')
+
+    def test_retry(self):
+        uploader = sinks.InMemoryUploader(failures={2: 2})
+        upload_id = sinks.upload_multipart([b'a' * 10] * 5, uploader, part_size=10, retry_delay=0)
+        self.assertEqual(uploader.objects[upload_id], b'a' * 50)
+
+    def test_abort(self):
+        uploader = sinks.InMemoryUploader(failures={3: 10})
+        with self.assertRaises(ConnectionError):
+            sinks.upload_multipart([b'a' * 10] * 5, uploader, part_size=10, max_retries=1, retry_delay=0)
+        self.assertEqual(uploader.objects, {})
+        self.assertEqual(len(uploader.aborted), 1)
+
+    def test_complete_error(self):
+        uploader = sinks.InMemoryUploader()
+        with mock.patch.object(uploader, 'complete', side_effect=ConnectionError('complete failed')):
+            self.assertRaises(ConnectionError, sinks.upload_multipart, [b'a' * 10] * 3, uploader, part_size=10)
+        self.assertEqual(len(uploader.aborted), 1)
+        self.assertEqual(uploader.uploads, {})
+
+    def test_stream_error(self):
+        closed = threading.Event()
+
+        def stream():
+            try:
+                yield b'a' * 10
+                raise ValueError('boom')
+            finally:
+                closed.set()
+
+        uploader = sinks.InMemoryUploader()
+        self.assertRaises(ValueError, sinks.upload_multipart, stream(), uploader, part_size=5)
+        self.assertEqual(len(uploader.aborted), 1)
+        self.assertTrue(closed.is_set())
+
+    def test_bounded_memory(self):
+        release = threading.Event()
+        read = []
+        uploader = sinks.InMemoryUploader()
+        upload_part = uploader.upload_part
+
+        def slow_upload_part(*args):
+            release.wait(5)
+            return upload_part(*args)
+
+        def stream():
+            for i in range(20):
+                read.append(i)
+                yield b'a' * 10
+
+        uploader.upload_part = slow_upload_part
+        thread = threading.Thread(
+            target=sinks.upload_multipart, args=(stream(), uploader), kwargs={'part_size': 10, 'max_workers': 2},
+        )
+        thread.start()
+        release.wait(0.2)
+        self.assertLessEqual(len(read), 3)  # the parts being uploaded, and the next part
+        release.set()
+        thread.join()
+        self.assertEqual(list(uploader.objects.values()), [b'a' * 200])
+
+    def test_s3_uploader(self):
+        client = mock.Mock()
+        client.create_multipart_upload.return_value = {'UploadId': 'upload'}
+        client.upload_part.side_effect = lambda PartNumber, **kwargs: {'ETag': f'"{PartNumber}"'}
+        uploader = sinks.S3MultipartUploader(client, 'bucket', 'export.xlsx', {'ContentType': 'application/zip'})
+        sinks.upload_multipart([b'a' * 10] * 3, uploader, part_size=10)
+        client.create_multipart_upload.assert_called_once_with(
+            Bucket='bucket', Key='export.xlsx', ContentType='application/zip',
+        )
+        self.assertEqual(client.upload_part.call_count, 3)
+        client.complete_multipart_upload.assert_called_once_with(
+            Bucket='bucket', Key='export.xlsx', UploadId='upload',
+            MultipartUpload={'Parts': [{'PartNumber': i, 'ETag': f'"{i}"'} for i in (1, 2, 3)]},
+        )
+
+    def test_incomplete_uploader(self):
+        class Uploader(sinks.MultipartUploader):  # pylint: disable=abstract-method
+            def create(self):
+                return 'upload'
+
+        self.assertRaisesRegex(TypeError, 'abort', Uploader)
+
+
+class CountingFile(io.BytesIO):
+
+    def __init__(self, initial_bytes=b''):
+        super().__init__(initial_bytes)
+        self.sizes = []
+
+    def write(self, data):
+        self.sizes.append(len(data))
+        return super().write(data)
+
+
+class UnseekableFile(CountingFile):
+
+    def seekable(self):
+        return False
+
+
+class TestWriteXlsxTo(unittest.TestCase):
+
+    def stream(self, rows=5000):
+        return streaming.stream_queryset_as_xlsx([[i, f'row {i}'] for i in range(rows)], batch_size=100)
+
+    def assertDocument(self, data, rows=5000):  # pylint: disable=invalid-name
+        with zipfile.ZipFile(io.BytesIO(data)) as document:
+            self.assertIsNone(document.testzip())
+        values = list(openpyxl.load_workbook(io.BytesIO(data)).active.values)
+        self.assertEqual(len(values), rows)
+        self.assertEqual(values[-1], (str(rows - 1), f'row {rows - 1}'))
+
+    def test_seekable_file(self):
+        output = io.BytesIO(b'prefix')
+        output.seek(0, io.SEEK_END)
+        size = sinks.write_xlsx_to(output, self.stream())
+        self.assertEqual(output.tell(), len(output.getvalue()))
+        data = output.getvalue()[len(b'prefix'):]
+        self.assertEqual(size, len(data))
+        self.assertDocument(data)
+        with zipfile.ZipFile(io.BytesIO(data)) as document:
+            self.assertEqual([info.flag_bits & 0x08 for info in document.infolist()], [0] * 6)
+        self.assertNotIn(b'PK\x07\x08', data)  # data descriptor signature
+
+    def test_unseekable_file(self):
+        output = UnseekableFile()
+        sinks.write_xlsx_to(output, self.stream())
+        self.assertDocument(output.getvalue())
+        with zipfile.ZipFile(output) as document:
+            self.assertEqual(document.getinfo('xl/worksheets/sheet1.xml').flag_bits & 0x08, 0x08)
+
+    def test_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory) / 'export.xlsx'
+            sinks.write_xlsx_to(path, self.stream())
+            self.assertDocument(path.read_bytes())
+
+    def test_file_descriptor(self):
+        with tempfile.TemporaryFile() as output:
+            sinks.write_xlsx_to(output.fileno(), self.stream())
+            self.assertFalse(output.closed)
+            output.seek(0)
+            self.assertDocument(output.read())
+
+    def test_fsync(self):
+        with tempfile.TemporaryFile() as output, mock.patch('os.fsync') as fsync:
+            sinks.write_xlsx_to(output, self.stream(10), fsync=True)
+            fsync.assert_called_once_with(output.fileno())
+
+    def test_buffered_writes(self):
+        output = UnseekableFile()
+        sinks.write_xlsx_to(output, self.stream(), buffer_size=4096)
+        self.assertEqual(set(output.sizes[:-1]), {4096})
+        self.assertDocument(output.getvalue())
+
+    def test_large_chunks(self):
+        output = CountingFile()
+        sinks.write_xlsx_to(output, [b'a' * 10, b'b' * 25, b'c' * 3], buffer_size=8)
+        self.assertEqual(output.getvalue(), b'a' * 10 + b'b' * 25 + b'c' * 3)
+        self.assertEqual(output.sizes, [8, 8, 8, 8, 6])
+
+
+class TestWsgiFileWrapper(unittest.TestCase):
+
+    def test_server_file_wrapper(self):
+        file_wrapper = mock.Mock()
+        fileobj = io.BytesIO(b'data')
+        body = sinks.wsgi_file_wrapper({'wsgi.file_wrapper': file_wrapper}, fileobj, block_size=2)
+        file_wrapper.assert_called_once_with(fileobj, 2)
+        self.assertIs(body, file_wrapper.return_value)
+
+    def test_fallback(self):
+        fileobj = io.BytesIO(b'abcde')
+        self.assertEqual(list(sinks.wsgi_file_wrapper({}, fileobj, block_size=2)), [b'ab', b'cd', b'e'])
+        self.assertTrue(fileobj.closed)
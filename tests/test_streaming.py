@@ -1,11 +1,15 @@
 import datetime
 import io
 import os
+import sqlite3
 import tempfile
 import unittest
+from unittest import mock
+import zipfile
 
 import openpyxl
 
+import xlsx_streaming
 from xlsx_streaming import streaming
 
 from .utils import gen_xlsx_template
@@ -94,6 +98,23 @@ class TestStreaming(unittest.TestCase):
 
         self.assertRaises(StopIteration, lambda: next(gen))
 
+    def test_serialize_queryset_by_adaptive_batch(self):
+        queries = []
+        values = [[i] for i in range(1000)]
+        sizer = xlsx_streaming.AdaptiveBatchSize(initial_size=100, min_size=10, target_latency=60)
+        batches = list(streaming.serialize_queryset_by_batch(FakeDjangoQuerySet(values, queries), lambda x: x, sizer))
+        self.assertEqual([len(batch) for batch in batches], [100, 200, 400, 300])
+        self.assertEqual([query.stop - query.start for query in queries], [100, 200, 400, 800])
+        self.assertEqual(sizer.sizes, [100, 200, 400, 800])
+
+        sizer = xlsx_streaming.AdaptiveBatchSize(initial_size=100, min_size=10, target_latency=60)
+        batches = list(streaming.serialize_queryset_by_batch(iter(values), lambda x: x, sizer))
+        self.assertEqual(sum(batches, []), values)
+        self.assertEqual([len(batch) for batch in batches], [100, 200, 400, 300])
+
+        batches = list(streaming.serialize_queryset_by_batch([], lambda x: x, 'auto'))
+        self.assertEqual(batches, [[]])
+
     def test_stream_queryset_as_xlsx(self):
         template = gen_xlsx_template(with_header=True)
 
@@ -126,6 +147,106 @@ class TestStreaming(unittest.TestCase):
         self.assertEqual(new_wb.active.cell(row=28, column=3).value, datetime.datetime(1900, 1, 1, 2, 24))
         os.remove(f.name)
 
+    def test_stream_queryset_as_xlsx_compresslevel(self):
+        qs = [[i, f'row {i}'] for i in range(500)]
+        stored = b''.join(streaming.stream_queryset_as_xlsx(qs, compresslevel=0))
+        deflated = b''.join(streaming.stream_queryset_as_xlsx(qs, compresslevel=9))
+        self.assertLess(len(deflated), len(stored))
+        for document in (stored, deflated):
+            new_wb = openpyxl.load_workbook(io.BytesIO(document))
+            self.assertEqual(new_wb.active.cell(row=500, column=2).value, 'row 499')
+
+    def test_stream_queryset_as_xlsx_with_columns(self):
+        columns = [
+            xlsx_streaming.Column('Id', 'int'),
+            xlsx_streaming.Column('Label'),
+            xlsx_streaming.Column('Date', 'date'),
+            xlsx_streaming.Column('Ok', 'bool'),
+        ]
+        qs = [[i, f'<{i}>', datetime.date(2012, 1, 2), i % 2 == 0] for i in range(27)] + [[None, None, None, None]]
+        for trusted in (False, True):
+            with self.subTest(trusted=trusted):
+                stream = streaming.stream_queryset_as_xlsx(qs, columns=columns, batch_size=10, trusted=trusted)
+                new_wb = openpyxl.load_workbook(io.BytesIO(b''.join(stream)))
+                rows = list(new_wb.active.values)
+                self.assertEqual(rows[0], ('Id', 'Label', 'Date', 'Ok'))
+                self.assertEqual(rows[1], (0, '<0>', datetime.datetime(2012, 1, 2), True))
+                self.assertEqual(rows[27], (26, '<26>', datetime.datetime(2012, 1, 2), True))
+                self.assertTrue(new_wb.active.cell(row=2, column=3).is_date)
+                self.assertEqual(len(rows), 29)
+
+    def test_stream_queryset_as_xlsx_columns_and_template(self):
+        self.assertRaises(
+            ValueError,
+            streaming.stream_queryset_as_xlsx, [], xlsx_template=gen_xlsx_template(), columns=['int'],
+        )
+
+    def test_stream_queryset_as_xlsx_trusted_template(self):
+        qs = [[i, f'row {i}', 1.5] for i in range(20)]
+        stream = streaming.stream_queryset_as_xlsx(qs, xlsx_template=gen_xlsx_template(with_header=True), trusted=True)
+        new_wb = openpyxl.load_workbook(io.BytesIO(b''.join(stream)))
+        self.assertEqual(new_wb.active.cell(row=21, column=2).value, 'row 19')
+        self.assertEqual(new_wb.active.cell(row=21, column=3).value, datetime.datetime(1900, 1, 1, 12))
+
+    def test_stream_queryset_as_xlsx_compact(self):
+        qs = [[i, None if i % 2 else f'row {i}', None if i % 3 else 1.5] for i in range(30)]
+        for options in ({}, {'trusted': True}):
+            with self.subTest(**options):
+                template = gen_xlsx_template(with_header=True)
+                expected = b''.join(streaming.stream_queryset_as_xlsx(qs, xlsx_template=template, **options))
+                template = gen_xlsx_template(with_header=True)
+                stream = streaming.stream_queryset_as_xlsx(qs, xlsx_template=template, compact=True, **options)
+                compact = b''.join(stream)
+                # empty cells are left out: empty text cells are read as None instead of ''
+                self.assertEqual(
+                    list(openpyxl.load_workbook(io.BytesIO(compact)).active.values),
+                    [
+                        tuple(None if value == '' else value for value in row)
+                        for row in openpyxl.load_workbook(io.BytesIO(expected)).active.values
+                    ],
+                )
+
+    def test_stream_queryset_as_xlsx_cache(self):
+        qs = [[i % 3, ['FR', 'DE'][i % 2], datetime.datetime(2024, 1, 1 + i % 2)] for i in range(100)]
+        cache = xlsx_streaming.ValueCache()
+        stream = streaming.stream_queryset_as_xlsx(qs, xlsx_template=gen_xlsx_template(), batch_size=30, cache=cache)
+        rows = list(openpyxl.load_workbook(io.BytesIO(b''.join(stream))).active.values)
+        self.assertEqual(rows[:2], [(0, 'FR', datetime.datetime(2024, 1, 1)), (1, 'DE', datetime.datetime(2024, 1, 2))])
+        self.assertEqual(cache.misses, 3 + 2 + 2)
+        self.assertEqual(cache.hits, 300 - cache.misses)
+
+    def test_stream_queryset_as_xlsx_batch_bytes(self):
+        qs = [[i, 'x' * (5000 if i % 10 == 0 else 10), 1.5] for i in range(100)]
+        rendered_batches = []
+        render_rows = streaming.render.render_rows
+
+        def recording_render_rows(rows, *args, **kwargs):
+            rendered = render_rows(rows, *args, **kwargs)
+            rendered_batches.append(rendered[0])
+            return rendered
+
+        with mock.patch.object(streaming.render, 'render_rows', recording_render_rows):
+            stream = streaming.stream_queryset_as_xlsx(
+                qs, xlsx_template=gen_xlsx_template(with_header=True), batch_size=50, batch_bytes=6000,
+            )
+            workbook = openpyxl.load_workbook(io.BytesIO(b''.join(stream)))
+        self.assertEqual(len(list(workbook.active.values)), 101)
+        self.assertGreater(len(rendered_batches), 10)  # the 2 fetched batches are split around the long values
+        self.assertLess(len(rendered_batches), 30)
+        self.assertLessEqual(max(map(len, rendered_batches)), 6000)
+
+    def test_stream_queryset_as_xlsx_pipeline(self):
+        qs = [[i, f'row {i}', 1.5] for i in range(100)]
+        pipeline = xlsx_streaming.Pipeline(maxsize=1)
+        stream = streaming.stream_queryset_as_xlsx(
+            qs, xlsx_template=gen_xlsx_template(with_header=True), batch_size=10, pipeline=pipeline,
+        )
+        rows = list(openpyxl.load_workbook(io.BytesIO(b''.join(stream))).active.values)
+        self.assertEqual(len(rows), 101)
+        self.assertEqual(rows[100], (99, 'row 99', datetime.datetime(1900, 1, 1, 12)))
+        self.assertEqual([stage.name for stage in pipeline.stages], ['serialize', 'render', 'compress'])
+        self.assertEqual(pipeline.stages[0].items, 11)  # with a last empty batch
+
     def test_wrong_template(self):
         template = io.BytesIO()
         queryset = [list(range(10)) for i in range(8)]
@@ -138,3 +259,102 @@ class TestStreaming(unittest.TestCase):
         new_wb = openpyxl.load_workbook(filename=f.name)
         for row in new_wb.active.rows:
             self.assertEqual([c.value for c in row], [str(i) for i in range(10)])
+
+    def test_default_template(self):
+        stream = b''.join(streaming.stream_queryset_as_xlsx([['a', 'b']]))
+        with zipfile.ZipFile(io.BytesIO(stream)) as zip_file:
+            self.assertNotIn('docProps/thumbnail.jpeg', zip_file.namelist())
+            self.assertIsNone(zip_file.testzip())
+        new_wb = openpyxl.load_workbook(io.BytesIO(stream))
+        self.assertEqual([c.value for c in next(new_wb.active.rows)], ['a', 'b'])
+
+    def test_zip_to_zipstream_copies_compressed_members(self):
+        template = gen_xlsx_template()
+        with zipfile.ZipFile(template) as zip_template:
+            stream = io.BytesIO(b''.join(streaming.zip_to_zipstream(zip_template, compressor='zlib')))
+            with zipfile.ZipFile(stream) as zip_file:
+                self.assertEqual(zip_file.namelist(), zip_template.namelist())
+                for name in zip_template.namelist():
+                    info, template_info = zip_file.getinfo(name), zip_template.getinfo(name)
+                    self.assertEqual(info.flag_bits & 0x08, 0)  # sizes in the local header
+                    self.assertEqual(
+                        streaming.read_compressed(zip_file, info),
+                        streaming.read_compressed(zip_template, template_info),
+                    )
+                    self.assertEqual(zip_file.read(name), zip_template.read(name))
+
+    def test_zip_to_zipstream_without_reading_stored_data(self):
+        template = gen_xlsx_template()
+        with mock.patch.object(streaming, '_CAN_READ_STORED_DATA', False), zipfile.ZipFile(template) as zip_template:
+            stream = io.BytesIO(b''.join(streaming.zip_to_zipstream(zip_template)))
+            with zipfile.ZipFile(stream) as zip_file:
+                self.assertIsNone(zip_file.testzip())
+                for name in zip_template.namelist():
+                    self.assertEqual(zip_file.read(name), zip_template.read(name))
+
+
+class TestCursorStreaming(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = sqlite3.connect(':memory:', detect_types=sqlite3.PARSE_DECLTYPES)
+        self.connection.execute('CREATE TABLE item (id INTEGER, name TEXT, created TIMESTAMP, active BOOLEAN)')
+        self.connection.executemany(
+            'INSERT INTO item VALUES (?, ?, ?, ?)',
+            [(i, f'item €{i}', datetime.datetime(2012, 1, 2, 10, i % 60), i % 2 == 0) for i in range(27)],
+        )
+
+    def tearDown(self):
+        self.connection.close()
+
+    def test_serialize_cursor_by_batch(self):
+        cursor = self.connection.execute('SELECT id FROM item ORDER BY id')
+        batches = list(streaming.serialize_cursor_by_batch(cursor, serializer=lambda x: x, batch_size=10))
+        self.assertEqual([len(batch) for batch in batches], [10, 10, 7])
+        self.assertEqual(batches[1][0], (10,))
+
+    def test_stream_cursor_as_xlsx(self):
+        cursor = self.connection.execute('SELECT id, name, created, active FROM item ORDER BY id')
+        stream = streaming.stream_cursor_as_xlsx(cursor, batch_size=10)
+
+        new_wb = openpyxl.load_workbook(io.BytesIO(b''.join(stream)))
+        rows = list(new_wb.active.values)
+        self.assertEqual(rows[0], ('id', 'name', 'created', 'active'))
+        self.assertEqual(len(rows), 28)
+        self.assertEqual(rows[1], (0, 'item €0', datetime.datetime(2012, 1, 2, 10, 0), True))
+        self.assertEqual(rows[27], (26, 'item €26', datetime.datetime(2012, 1, 2, 10, 26), True))
+        self.assertTrue(new_wb.active.cell(row=2, column=3).is_date)
+
+    def test_stream_cursor_as_xlsx_adaptive_batch_size(self):
+        cursor = self.connection.execute('SELECT id, name FROM item ORDER BY id')
+        sizer = xlsx_streaming.AdaptiveBatchSize(initial_size=4, min_size=2, target_latency=60)
+        stream = streaming.stream_cursor_as_xlsx(cursor, batch_size=sizer)
+        rows = list(openpyxl.load_workbook(io.BytesIO(b''.join(stream))).active.values)
+        self.assertEqual(len(rows), 28)
+        self.assertEqual(rows[27], (26, 'item €26'))
+        self.assertEqual(sizer.sizes, [4, 8, 16])
+
+    def test_stream_cursor_as_xlsx_pipeline(self):
+        connection = sqlite3.connect(':memory:', check_same_thread=False)
+        connection.execute('CREATE TABLE item (id INTEGER)')
+        connection.executemany('INSERT INTO item VALUES (?)', [(i,) for i in range(27)])
+        cursor = connection.execute('SELECT id FROM item ORDER BY id')
+        stream = streaming.stream_cursor_as_xlsx(cursor, batch_size=5, pipeline=xlsx_streaming.Pipeline())
+        rows = list(openpyxl.load_workbook(io.BytesIO(b''.join(stream))).active.values)
+        self.assertEqual(rows, [('id',)] + [(i,) for i in range(27)])
+        connection.close()
+
+    def test_stream_cursor_as_xlsx_without_header(self):
+        cursor = self.connection.execute('SELECT id, name FROM item ORDER BY id')
+        stream = streaming.stream_cursor_as_xlsx(cursor, batch_size=100, with_header=False)
+
+        new_wb = openpyxl.load_workbook(io.BytesIO(b''.join(stream)))
+        rows = list(new_wb.active.values)
+        self.assertEqual(len(rows), 27)
+        self.assertEqual(rows[0], (0, 'item €0'))
+
+    def test_stream_empty_cursor_as_xlsx(self):
+        cursor = self.connection.execute('SELECT id, name FROM item WHERE id < 0')
+        stream = streaming.stream_cursor_as_xlsx(cursor, batch_size=10)
+
+        new_wb = openpyxl.load_workbook(io.BytesIO(b''.join(stream)))
+        self.assertEqual(list(new_wb.active.values), [('id', 'name')])
@@ -0,0 +1,108 @@
+import concurrent.futures
+import io
+import mmap
+import os
+import pathlib
+import tempfile
+import unittest
+
+import openpyxl
+
+from xlsx_streaming import streaming
+from xlsx_streaming import templates
+
+from .utils import gen_xlsx_template
+
+
+class TestMappedTemplates(unittest.TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(templates.clear_mappings)
+        self.path = os.path.join(tmp_dir.name, 'template.xlsx')
+        with open(self.path, 'wb') as template_file:
+            template_file.write(gen_xlsx_template(with_header=True).getvalue())
+
+    def export(self, xlsx_template, rows=100):
+        stream = streaming.stream_queryset_as_xlsx([[i, f'row {i}', i] for i in range(rows)], xlsx_template)
+        return b''.join(stream)
+
+    def read_rows(self, document):
+        return list(openpyxl.load_workbook(io.BytesIO(document)).active.values)
+
+    def test_path(self):
+        with open(self.path, 'rb') as template_file:
+            expected = self.read_rows(self.export(template_file))
+        self.assertEqual(self.read_rows(self.export(self.path)), expected)
+        self.assertEqual(self.read_rows(self.export(pathlib.Path(self.path))), expected)
+        self.assertEqual(expected[0], ('Id', 'Description', 'Date'))
+
+    def test_shared_mapping(self):
+        self.assertIs(templates.get_mapping(self.path), templates.get_mapping(pathlib.Path(self.path)))
+
+    def test_modified_template(self):
+        mapping = templates.get_mapping(self.path)
+        with open(self.path, 'wb') as template_file:
+            template_file.write(gen_xlsx_template(with_header=False).getvalue())
+        os.utime(self.path, ns=(0, 0))  # the modification time may not have changed within its resolution
+        self.assertIsNot(templates.get_mapping(self.path), mapping)
+        self.assertEqual(len(self.read_rows(self.export(self.path, rows=3))), 3)
+
+    def test_concurrent_exports(self):
+        expected = self.export(self.path, rows=2000)
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            documents = list(executor.map(lambda _: self.export(self.path, rows=2000), range(8)))
+        self.assertEqual([len(document) for document in documents], [len(expected)] * 8)
+        self.assertEqual(self.read_rows(documents[-1]), self.read_rows(expected))
+
+    def test_invalid_template(self):
+        with open(self.path, 'wb') as template_file:
+            template_file.write(b'not an xlsx file')
+        self.assertEqual(self.read_rows(self.export(self.path, rows=2)), [('0', 'row 0', '0'), ('1', 'row 1', '1')])
+
+
+class TestMappedFile(unittest.TestCase):
+
+    def setUp(self):
+        with tempfile.TemporaryFile() as data_file:
+            data_file.write(b'0123456789')
+            data_file.flush()
+            self.mapping = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.addCleanup(self.mapping.close)
+
+    def test_read(self):
+        with templates.MappedFile(self.mapping) as mapped_file:
+            self.assertEqual(mapped_file.read(3), b'012')
+            self.assertEqual(mapped_file.tell(), 3)
+            self.assertEqual(mapped_file.read(), b'3456789')
+            self.assertEqual(mapped_file.read(), b'')
+
+    def test_seek(self):
+        with templates.MappedFile(self.mapping) as mapped_file:
+            self.assertEqual(mapped_file.seek(-2, io.SEEK_END), 8)
+            self.assertEqual(mapped_file.read(5), b'89')
+            mapped_file.seek(-4, io.SEEK_CUR)
+            self.assertEqual(mapped_file.read(2), b'67')
+            mapped_file.seek(20)
+            self.assertEqual(mapped_file.read(1), b'')
+            self.assertRaises(ValueError, mapped_file.seek, -1)
+
+    def test_readinto(self):
+        buffer = bytearray(4)
+        with templates.MappedFile(self.mapping) as mapped_file:
+            mapped_file.seek(8)
+            self.assertEqual(mapped_file.readinto(buffer), 2)
+        self.assertEqual(buffer, b'89\x00\x00')
+
+    def test_independent_positions(self):
+        first, second = templates.MappedFile(self.mapping), templates.MappedFile(self.mapping)
+        first.seek(5)
+        self.assertEqual(second.read(2), b'01')
+        self.assertEqual(first.read(2), b'56')
+
+    def test_closed(self):
+        mapped_file = templates.MappedFile(self.mapping)
+        mapped_file.close()
+        self.assertRaises(ValueError, mapped_file.read)
+        self.assertEqual(self.mapping[:2], b'01')
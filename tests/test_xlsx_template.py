@@ -0,0 +1,30 @@
+import concurrent.futures
+import unittest
+import zipfile
+
+from xlsx_streaming import xlsx_template
+
+
+class TestDefaultTemplate(unittest.TestCase):
+
+    def test_default_template(self):
+        with zipfile.ZipFile(xlsx_template.DEFAULT_TEMPLATE) as zip_file:
+            self.assertEqual(zip_file.namelist(), list(xlsx_template.MEMBERS))
+            for info in zip_file.infolist():
+                self.assertEqual(info.compress_type, zipfile.ZIP_DEFLATED)
+            self.assertEqual(zip_file.read(xlsx_template.SHEET_PATH).decode(), xlsx_template.SHEET_XML)
+
+    def test_default_template_is_not_shared(self):
+        template = xlsx_template.DEFAULT_TEMPLATE
+        template.read()
+        self.assertIsNot(xlsx_template.DEFAULT_TEMPLATE, template)
+        self.assertEqual(xlsx_template.DEFAULT_TEMPLATE.tell(), 0)
+
+    def test_default_template_is_built_once(self):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            templates = list(executor.map(lambda _: xlsx_template.get_default_template_bytes(), range(8)))
+        self.assertTrue(all(template is templates[0] for template in templates))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            xlsx_template.UNKNOWN  # pylint: disable=pointless-statement
@@ -1,4 +1,29 @@
+from .batching import AdaptiveBatchSize
+from .converters import register_converter
+from .errors import DataError
+from .errors import ErrorReport
+from .memo import ValueCache
+from .multisheet import stream_sheets_as_xlsx
+from .pipeline import Pipeline
+from .profiling import Profiler
+from .progress import Progress
 from .render import set_export_timezone
+from .schema import Column
+from .streaming import stream_cursor_as_xlsx
 from .streaming import stream_queryset_as_xlsx
 
-__ALL__ = ['set_export_timezone', 'stream_queryset_as_xlsx']
+__ALL__ = [
+    'AdaptiveBatchSize',
+    'Column',
+    'DataError',
+    'ErrorReport',
+    'Pipeline',
+    'Profiler',
+    'Progress',
+    'ValueCache',
+    'register_converter',
+    'set_export_timezone',
+    'stream_cursor_as_xlsx',
+    'stream_queryset_as_xlsx',
+    'stream_sheets_as_xlsx',
+]
@@ -0,0 +1,168 @@
+import time
+import zipfile
+
+import zipstream
+
+from . import compression
+
+
+# Compression methods of the members written by ``ZipStream`` itself
+COMPRESS_TYPES = (zipstream.ZIP_STORED, zipstream.ZIP_DEFLATED)
+
+
+class ZipStream(zipstream.ZipFile):
+    """
+    A ``zipstream.ZipFile`` whose deflated members are compressed with a configurable
+    deflate implementation and compression level.
+
+    Members added with ``write_iter`` or ``write_compressed`` are written by this class, other
+    members (added with ``write``) are left to ``zipstream``.
+    """
+
+    def __init__(self, compresslevel=None, compressor=None):
+        super().__init__(mode='w', compression=zipstream.ZIP_DEFLATED)
+        self.compresslevel = compresslevel
+        self.compressor = compression.get_compressor(compressor)
+        self.header_patches = None
+
+    def defer_headers(self):
+        """
+        Write the members of unknown size (added with ``write_iter``) without data descriptor, for
+        an output which can seek: the local header of each member, with its CRC and sizes, is
+        queued in ``header_patches`` as an (offset, header) pair, to be written over the header
+        of the stream once the member is written. Members too large for a local header without
+        ZIP64 extension keep their data descriptor. To be called before iterating the stream.
+        """
+        self.header_patches = []
+
+    def __iter__(self):
+        for kwargs in self.paths_to_write:
+            if 'get_member' in kwargs:
+                compressed, crc, file_size, compress_size = kwargs['get_member']()
+                yield from self._write_compressed(
+                    kwargs['arcname'], compressed, crc, file_size, compress_size, zipstream.ZIP_DEFLATED,
+                )
+                continue
+            if 'compressed' in kwargs:
+                yield from self._write_compressed(**kwargs)
+                continue
+            compress_type = self._get_compress_type(kwargs.get('compress_type'))
+            if kwargs.get('iterable') is not None and compress_type in COMPRESS_TYPES:
+                yield from self._write_iter(**kwargs)
+            else:
+                yield from self._ZipFile__write(**kwargs)
+        yield from self._ZipFile__close()
+
+    def follow(self, offset, zinfos=()):
+        """
+        Make the stream follow data written by other means (e.g. the beginning of a resumed
+        document): its members are written from ``offset``, and the members already written
+        (``zinfos``) are listed in its central directory. To be called before iterating the stream.
+        """
+        self.fp.data_pointer = offset
+        for zinfo in zinfos:
+            self.filelist.append(zinfo)
+            self.NameToInfo[zinfo.filename] = zinfo
+
+    def write_compressed(
+            self, arcname, compressed, crc, file_size, compress_size=None, compress_type=zipstream.ZIP_DEFLATED,
+        ):
+        """
+        Add a member whose data is already compressed (e.g. copied from another archive).
+
+        The data (bytes, or an iterable of bytes whose total size is ``compress_size``) is written
+        as is, with its CRC and sizes in the local header.
+        """
+        if isinstance(compressed, bytes):
+            compress_size = len(compressed)
+            compressed = [compressed]
+        elif compress_size is None:
+            raise ValueError('`compress_size` is required when the data is not bytes')
+        self.paths_to_write.append({
+            'arcname': arcname,
+            'compressed': compressed,
+            'crc': crc,
+            'file_size': file_size,
+            'compress_size': compress_size,
+            'compress_type': compress_type,
+        })
+
+    def write_pending(self, arcname, get_member):
+        """
+        Add a deflated member which is being compressed elsewhere (e.g. in another thread).
+
+        ``get_member`` is called when the member is written, and returns its compressed data (an
+        iterable of bytes), its CRC, size and compressed size (see ``write_compressed``).
+        """
+        self.paths_to_write.append({'arcname': arcname, 'get_member': get_member})
+
+    def _get_compress_type(self, compress_type):
+        return self.compression if compress_type is None else compress_type
+
+    def _get_compressor(self, compress_type):
+        if compress_type == zipstream.ZIP_DEFLATED:
+            return self.compressor.compressobj(self.compresslevel)
+        return None
+
+    def _write_iter(self, arcname, iterable, compress_type=None):
+        zinfo = zipstream.ZipInfo(arcname, time.localtime()[0:6])
+        zinfo.external_attr = 0o600 << 16     # ?rw-------
+        zinfo.compress_type = self._get_compress_type(compress_type)
+        zinfo.file_size = 0
+        zinfo.flag_bits = 0x08                # bit 3: sizes and CRC are written in a data descriptor
+        zinfo.header_offset = self.fp.tell()
+        self._writecheck(zinfo)
+        self._didModify = True
+
+        yield self.fp.write(zinfo.FileHeader(False))
+
+        compressor = self._get_compressor(zinfo.compress_type)
+        crc32 = self.compressor.crc32
+        crc = file_size = compress_size = 0
+        for buf in iterable:
+            file_size += len(buf)
+            crc = crc32(buf, crc)
+            if compressor is not None:
+                buf = compressor.compress(buf)
+                compress_size += len(buf)
+            if buf:
+                yield self.fp.write(buf)
+        if compressor is not None:
+            buf = compressor.flush()
+            compress_size += len(buf)
+            yield self.fp.write(buf)
+        else:
+            compress_size = file_size
+
+        zinfo.CRC = crc
+        zinfo.file_size = file_size
+        zinfo.compress_size = compress_size
+        if self.header_patches is not None and max(file_size, compress_size) <= zipfile.ZIP64_LIMIT:
+            zinfo.flag_bits = 0x00            # the header of the stream is overwritten by the output
+            self.header_patches.append((zinfo.header_offset, zinfo.FileHeader(False)))
+        else:
+            yield self.fp.write(zinfo.DataDescriptor())
+        self.filelist.append(zinfo)
+        self.NameToInfo[zinfo.filename] = zinfo
+
+    def _write_compressed(self, arcname, compressed, crc, file_size, compress_size, compress_type):
+        zinfo = zipstream.ZipInfo(arcname, time.localtime()[0:6])
+        zinfo.external_attr = 0o600 << 16     # ?rw-------
+        zinfo.compress_type = compress_type
+        zinfo.flag_bits = 0x00                # no data descriptor, sizes and CRC are known
+        zinfo.CRC = crc
+        zinfo.file_size = file_size
+        zinfo.compress_size = compress_size
+        zinfo.header_offset = self.fp.tell()
+        self._writecheck(zinfo)
+        self._didModify = True
+
+        yield self.fp.write(zinfo.FileHeader(False))
+        written = 0
+        for buf in compressed:
+            written += len(buf)
+            yield self.fp.write(buf)
+        if written != compress_size:
+            raise ValueError(f'{arcname}: {written} compressed bytes written, {compress_size} expected')
+        self.filelist.append(zinfo)
+        self.NameToInfo[zinfo.filename] = zinfo
@@ -0,0 +1,170 @@
+"""
+Batch sizes adapted to the measured fetch time and size of the rows.
+
+Small batches make many queries whose overhead dominates for narrow rows, large batches
+of wide rows use a lot of memory: ``AdaptiveBatchSize`` chooses the size of each batch
+from the measures of the previous ones, and ``split_batches`` bounds the estimated rendered
+size of each batch.
+"""
+import collections
+import logging
+
+from . import render
+
+
+logger = logging.getLogger(__name__)
+
+# Estimated size of the markup of a cell (``<c r="AB123" t="inlineStr"><is><t></t></is></c>``)
+CELL_SIZE = 40
+# Estimated size of a value which is not a string (number, date, …)
+VALUE_SIZE = 16
+# Size of the markup of a row, and of a line number
+ROW_SIZE = len('<row r=""></row>\n')
+LINE_SIZE = 7
+# The size of a batch is at most multiplied by this factor from one batch to the next
+MAX_GROWTH = 2
+
+BatchStats = collections.namedtuple('BatchStats', ['size', 'rows', 'fetch_time', 'row_bytes'])
+BatchStats.__doc__ = """
+    The measures of a batch: the requested ``size``, the number of ``rows`` fetched, the time
+    spent fetching and serializing them (in seconds) and the estimated rendered size of a row.
+"""
+
+
+class AdaptiveBatchSize:
+    """
+        Choose the size of each batch from the fetch time and the size of the previous batches.
+
+        The size of the next batch is the largest one which is expected to be fetched within
+        ``target_latency`` and to be rendered within ``max_batch_bytes``, between ``min_size`` and
+        ``max_size`` (and at most twice the previous size). The measures of each batch are kept
+        in ``batches``, and the chosen sizes are logged (debug level).
+
+        args:
+            initial_size (int): the size of the first batch
+            min_size (int): the smallest batch size
+            max_size (int): the largest batch size
+            target_latency (float): the time (in seconds) fetching a batch should take
+            max_batch_bytes (int): the estimated rendered size of a batch should not exceed this budget
+                (None for no budget)
+    """
+
+    def __init__(
+            self,
+            initial_size=1000,
+            min_size=100,
+            max_size=50000,
+            target_latency=0.5,
+            max_batch_bytes=32 * 1024 * 1024,
+        ):
+        if not 0 < min_size <= initial_size <= max_size:
+            raise ValueError('Batch sizes must satisfy 0 < min_size <= initial_size <= max_size')
+        self.size = initial_size
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.max_batch_bytes = max_batch_bytes
+        self.batches = []
+        self._row_time = None
+        self._row_bytes = None
+
+    def __repr__(self):
+        return f'<AdaptiveBatchSize: {self.size} rows, {len(self.batches)} batches>'
+
+    @property
+    def sizes(self):
+        """The sizes chosen for each batch."""
+        return [batch.size for batch in self.batches]
+
+    def record(self, rows, fetch_time):
+        """Account for a batch of rows and choose the size of the next batch."""
+        count = len(rows)
+        row_bytes = sum(map(estimate_row_size, rows)) / count if count else 0
+        self.batches.append(BatchStats(self.size, count, fetch_time, row_bytes))
+        if not count:
+            return
+        self._row_time = _average(self._row_time, fetch_time / count)
+        self._row_bytes = _average(self._row_bytes, row_bytes)
+        self.size = self._get_next_size()
+        logger.debug(
+            'Batch of %s rows fetched in %.3fs (%.0f bytes per row), next batch size: %s',
+            count, fetch_time, row_bytes, self.size,
+        )
+
+    def _get_next_size(self):
+        candidates = [self.size * MAX_GROWTH]
+        if self._row_time:
+            candidates.append(self.target_latency / self._row_time)
+        if self._row_bytes and self.max_batch_bytes is not None:
+            candidates.append(self.max_batch_bytes / self._row_bytes)
+        return max(self.min_size, min(self.max_size, int(min(candidates))))
+
+
+def _average(previous, value):
+    # exponential moving average, the measures of a single batch are noisy
+    return value if previous is None else (previous + value) / 2
+
+
+def estimate_row_size(row, row_overhead=None):
+    """
+        Return the estimated size (in bytes) of the rendered row.
+
+        args:
+            row (list): the values of the row
+            row_overhead (int): the size of the markup of the row (see ``get_row_overhead``),
+                estimated from the number of values if None
+    """
+    if row_overhead is None:
+        row_overhead = ROW_SIZE + CELL_SIZE * len(row)
+    return row_overhead + sum(len(value) if isinstance(value, str) else VALUE_SIZE for value in row)
+
+
+def get_row_overhead(row_template):
+    """Return the size of the markup of the rows rendered from ``row_template`` (None if it is None)."""
+    if row_template is None:
+        return None
+    overhead = ROW_SIZE + LINE_SIZE
+    for column, attributes, encoder in render.compile_row_template(row_template):
+        value_markup = '<is><t></t></is>' if encoder is render.encode_text else '<v></v>'
+        overhead += len(f'<c r="{column}"{attributes}>{value_markup}</c>') + LINE_SIZE
+    return overhead
+
+
+def split_batches(batches, max_bytes, row_overhead=None):
+    """
+        Split the batches of rows so that the estimated rendered size of each batch does
+        not exceed ``max_bytes`` (a batch has at least one row).
+
+        args:
+            batches (iterable): the batches of rows
+            max_bytes (int): the estimated rendered size of a batch
+            row_overhead (int): the size of the markup of a row (see ``estimate_row_size``)
+    """
+    for rows in batches:
+        batch, size = [], 0
+        for row in rows:
+            row_size = estimate_row_size(row, row_overhead)
+            if batch and size + row_size > max_bytes:
+                yield batch
+                batch, size = [], 0
+            batch.append(row)
+            size += row_size
+        if batch:
+            yield batch
+
+
+def get_batch_sizer(batch_size):
+    """
+        Return the ``AdaptiveBatchSize`` of ``batch_size``, or None if it is a fixed number of rows.
+
+        args:
+            batch_size (Union[int, str, AdaptiveBatchSize]): a number of rows, 'auto' (adaptive
+                batch size with the default settings) or an ``AdaptiveBatchSize``
+    """
+    if isinstance(batch_size, AdaptiveBatchSize):
+        return batch_size
+    if batch_size == 'auto':
+        return AdaptiveBatchSize()
+    if isinstance(batch_size, int) and batch_size > 0:
+        return None
+    raise ValueError(f"Invalid batch size {batch_size!r}, expected a positive int, 'auto' or an AdaptiveBatchSize")
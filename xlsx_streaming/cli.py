@@ -0,0 +1,287 @@
+"""
+Convert CSV, TSV or JSON Lines files to xlsx documents::
+
+    python -m xlsx_streaming data.csv -o data.xlsx --types number,text,date
+
+Rows are read lazily and the document is streamed to the output, so that memory usage
+does not depend on the size of the input.
+"""
+import argparse
+import concurrent.futures
+import contextlib
+import csv
+import datetime
+import io
+import itertools
+import json
+import os
+import sys
+import time
+
+from . import compression
+from . import schema
+from . import streaming
+
+
+FORMATS = ('csv', 'tsv', 'jsonl')
+
+FORMAT_EXTENSIONS = {
+    '.csv': 'csv',
+    '.tsv': 'tsv',
+    '.tab': 'tsv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+}
+
+TRUE_VALUES = ('1', 'true', 't', 'yes', 'y')
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m xlsx_streaming',
+        description='Convert a CSV, TSV or JSON Lines file to an xlsx document.',
+    )
+    parser.add_argument(
+        'input', nargs='?', default='-',
+        help='the input file (defaults to the standard input)',
+    )
+    parser.add_argument(
+        '-o', '--output', default='-',
+        help='the output xlsx file (defaults to the standard output)',
+    )
+    parser.add_argument(
+        '-f', '--format', choices=FORMATS,
+        help='the input format (guessed from the input file extension, defaults to csv)',
+    )
+    types = parser.add_mutually_exclusive_group()
+    types.add_argument(
+        '-t', '--template',
+        help='an xlsx template containing the header (optional) and an example row',
+    )
+    types.add_argument(
+        '--types',
+        help=f'a comma separated list of column types, among: {", ".join(schema.COLUMN_TYPES)}',
+    )
+    parser.add_argument(
+        '--no-header', action='store_true',
+        help='the first line of the input is a data line, not the column names',
+    )
+    parser.add_argument('--delimiter', help='the CSV delimiter (defaults to "," for csv and tab for tsv)')
+    parser.add_argument('--input-encoding', default='utf-8', help='the encoding of the input file')
+    parser.add_argument(
+        '--batch-size', type=parse_batch_size, default=1000,
+        help='the number of rows rendered at once, or "auto" to adapt it to the size of the rows',
+    )
+    parser.add_argument(
+        '--batch-bytes', type=int,
+        help='split the batches so that their estimated rendered size does not exceed this number of bytes',
+    )
+    parser.add_argument(
+        '--compression-level', type=int, choices=range(0, 10), metavar='{0-9}',
+        help='the deflate compression level (defaults to the compressor default level)',
+    )
+    parser.add_argument(
+        '--compressor', choices=['auto'] + [compressor.name for compressor in compression.COMPRESSORS],
+        help='the deflate implementation (defaults to zlib, "auto" for the fastest installed one)',
+    )
+    parser.add_argument(
+        '-j', '--workers', type=int, default=1,
+        help='the number of processes used to render rows (defaults to 1: no parallelism)',
+    )
+    parser.add_argument(
+        '--compact', action='store_true',
+        help='write the worksheet without newlines, optional references and empty cells',
+    )
+    parser.add_argument('-q', '--quiet', action='store_true', help='do not report throughput when finished')
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+
+    input_format = args.format or FORMAT_EXTENSIONS.get(os.path.splitext(args.input)[1].lower(), 'csv')
+    types = args.types.split(',') if args.types else None
+    if types is not None:
+        unknown_types = set(types) - set(schema.COLUMN_TYPES)
+        if unknown_types:
+            raise SystemExit(f'Unknown column types: {", ".join(sorted(unknown_types))}')
+
+    if args.template is not None and not os.path.isfile(args.template):
+        raise SystemExit(f'Template not found: {args.template}')
+
+    try:
+        compression.get_compressor(args.compressor)
+    except ValueError as e:
+        raise SystemExit(str(e)) from e
+
+    started_at = time.monotonic()
+    with _open_input(args.input, args.input_encoding) as input_file, _open_output(args.output) as output_file:
+        if input_format == 'jsonl':
+            header, rows = read_jsonl(input_file, with_header=not args.no_header)
+        else:
+            delimiter = args.delimiter or ('\t' if input_format == 'tsv' else ',')
+            header, rows = read_csv(input_file, delimiter=delimiter, with_header=not args.no_header)
+
+        counter = RowCounter(rows)
+        rows, template = _get_rows_and_template(counter, header, types, args.template, input_format)
+        executor = concurrent.futures.ProcessPoolExecutor(args.workers) if args.workers > 1 else None
+        try:
+            stream = streaming.stream_queryset_as_xlsx(
+                rows,
+                xlsx_template=template,
+                batch_size=args.batch_size,
+                batch_bytes=args.batch_bytes,
+                compresslevel=args.compression_level,
+                compressor=args.compressor,
+                executor=executor,
+                max_pending=2 * args.workers,
+                compact=args.compact,
+            )
+            written = 0
+            for chunk in stream:
+                output_file.write(chunk)
+                written += len(chunk)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    if not args.quiet:
+        elapsed = max(time.monotonic() - started_at, 1e-9)
+        print(
+            f'{counter.count} rows, {written / 1e6:.1f} MB written in {elapsed:.2f}s '
+            f'({counter.count / elapsed:.0f} rows/s, {written / 1e6 / elapsed:.1f} MB/s)',
+            file=sys.stderr,
+        )
+
+
+class RowCounter:
+    """Count the rows read from the input while they are consumed."""
+
+    def __init__(self, rows):
+        self.rows = iter(rows)
+        self.count = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        row = next(self.rows)
+        self.count += 1
+        return row
+
+
+def read_csv(input_file, delimiter=',', with_header=True):
+    reader = csv.reader(input_file, delimiter=delimiter)
+    header = next(reader, None) if with_header else None
+    return header, reader
+
+
+def read_jsonl(input_file, with_header=True):
+    """
+        Read a JSON Lines file, each line being either a list of values or an object.
+
+        The keys of the first object are used as the column names.
+    """
+    lines = (json.loads(line) for line in input_file if line.strip())
+    first_line = next(lines, None)
+    if first_line is None:
+        return None, iter([])
+    if not isinstance(first_line, dict):
+        return None, itertools.chain([first_line], lines)
+
+    keys = list(first_line)
+    rows = ([line.get(key) for key in keys] for line in itertools.chain([first_line], lines))
+    return (keys if with_header else None), rows
+
+
+def _get_rows_and_template(rows, header, types, template_path, input_format):
+    if template_path is not None:
+        return rows, template_path
+
+    if types is None and input_format == 'jsonl':
+        # JSON values are typed, infer the column types from the first rows
+        first_rows = list(itertools.islice(rows, 100))
+        if first_rows:
+            types = schema.types_from_description([(None, None)] * len(first_rows[0]), first_rows)
+            return itertools.chain(first_rows, rows), schema.build_template(types, header=header)
+        return rows, None
+    if types is None:
+        if header is None:
+            return rows, None
+        types = [schema.TEXT] * len(header)
+    else:
+        rows = map(RowParser(types), rows)
+    return rows, schema.build_template(types, header=header)
+
+
+def parse_batch_size(value):
+    if value == 'auto':
+        return value
+    try:
+        batch_size = int(value)
+    except ValueError:
+        batch_size = 0
+    if batch_size <= 0:
+        raise argparse.ArgumentTypeError(f'invalid batch size: {value!r} (expected a positive int or "auto")')
+    return batch_size
+
+
+def parse_number(value):
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def parse_bool(value):
+    return value.strip().lower() in TRUE_VALUES
+
+
+PARSERS = {
+    schema.NUMBER: parse_number,
+    schema.INT: int,
+    schema.FLOAT: float,
+    schema.BOOL: parse_bool,
+    schema.DATE: datetime.date.fromisoformat,
+    schema.DATETIME: datetime.datetime.fromisoformat,
+    schema.TIME: datetime.time.fromisoformat,
+}
+
+
+class RowParser:
+    """
+        Convert the text values of a row to the python types of the columns.
+
+        Empty values of typed columns are converted to None, and values which cannot be
+        converted are kept as is (they are then logged as not matching the template).
+    """
+
+    def __init__(self, types):
+        self.parsers = [PARSERS.get(column_type) for column_type in types]
+
+    def __call__(self, row):
+        parsed = [self._parse(parser, value) for parser, value in zip(self.parsers, row)]
+        return parsed + list(row[len(parsed):])
+
+    @staticmethod
+    def _parse(parser, value):
+        if parser is None or not isinstance(value, str):
+            return value
+        if value == '':
+            return None
+        try:
+            return parser(value)
+        except ValueError:
+            return value
+
+
+def _open_input(path, encoding):
+    if path == '-':
+        return io.TextIOWrapper(sys.stdin.buffer, encoding=encoding, newline='')
+    return open(path, 'r', encoding=encoding, newline='')  # pylint: disable=consider-using-with
+
+
+def _open_output(path):
+    if path == '-':
+        return contextlib.nullcontext(sys.stdout.buffer)
+    return open(path, 'wb')  # pylint: disable=consider-using-with
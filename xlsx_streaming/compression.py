@@ -0,0 +1,144 @@
+"""
+Deflate implementations used to compress the members of the xlsx document.
+
+The standard ``zlib`` module is used by default. The faster ``isal`` and ``zlib-ng`` packages
+(``pip install isal`` or ``pip install zlib-ng``) are opt-in: by name, or with 'auto' for the
+fastest installed one.
+"""
+import importlib
+import zlib
+
+# The (reversed) CRC-32 polynomial
+CRC32_POLYNOMIAL = 0xedb88320
+
+
+class Compressor:
+    """
+        A deflate implementation with a ``zlib`` compatible API.
+
+        args:
+            name (str): the name of the backend
+            module_name (str): the module providing ``compressobj`` and ``crc32``
+            max_level (int): the highest compression level supported by the module
+    """
+
+    def __init__(self, name, module_name, max_level=9):
+        self.name = name
+        self.module_name = module_name
+        self.max_level = max_level
+        self._module = None
+        self._import_error = None
+
+    def __repr__(self):
+        return f'<Compressor {self.name}>'
+
+    @property
+    def module(self):
+        if self._module is None:
+            if self._import_error is not None:  # not installed, the import is not tried again
+                raise ImportError(self._import_error)
+            try:
+                self._module = importlib.import_module(self.module_name)
+            except ImportError as e:
+                self._import_error = str(e)
+                raise
+        return self._module
+
+    def is_available(self):
+        try:
+            self.module  # pylint: disable=pointless-statement
+        except ImportError:
+            return False
+        return True
+
+    def compressobj(self, level=None):
+        """Return a raw deflate (no zlib header) compression object."""
+        level = self.module.Z_DEFAULT_COMPRESSION if level is None or level < 0 else min(level, self.max_level)
+        return self.module.compressobj(level, zlib.DEFLATED, -15)
+
+    def crc32(self, data, value=0):
+        return self.module.crc32(data, value)
+
+
+# Fastest first
+COMPRESSORS = (
+    Compressor('isal', 'isal.isal_zlib', max_level=3),
+    Compressor('zlib-ng', 'zlib_ng.zlib_ng'),
+    Compressor('zlib', 'zlib'),
+)
+
+ZLIB = COMPRESSORS[-1]
+
+
+def available_compressors():
+    return [compressor for compressor in COMPRESSORS if compressor.is_available()]
+
+
+def get_compressor(compressor=None):
+    """
+        Return a ``Compressor``.
+
+        args:
+            compressor (Optional[Union[str, Compressor]]): a compressor or the name of a compressor
+                ('isal', 'zlib-ng' or 'zlib'). If None, ``zlib`` is returned. If 'auto', the fastest
+                installed compressor is returned (``isal`` compresses less, its highest level is 3).
+    """
+    if isinstance(compressor, Compressor):
+        return compressor
+    if compressor is None:
+        return ZLIB
+    if compressor == 'auto':
+        return available_compressors()[0]
+    try:
+        found = next(candidate for candidate in COMPRESSORS if candidate.name == compressor)
+    except StopIteration:
+        raise ValueError(
+            f'Unknown compressor {compressor!r}, expected one of {[c.name for c in COMPRESSORS]}'
+        ) from None
+    if not found.is_available():
+        raise ValueError(f'Compressor {compressor!r} is not installed')
+    return found
+
+
+def crc32_combine(crc1, crc2, len2):
+    """
+        Return the CRC-32 of the concatenation of two byte strings from their CRCs (``crc1`` and
+        ``crc2``) and the length of the second one (``len2``), as ``crc32_combine`` of zlib
+        (which the ``zlib`` module does not expose).
+    """
+    if len2 <= 0:
+        return crc1
+    # operator appending one zero bit to a CRC, then two, then four
+    odd = [CRC32_POLYNOMIAL] + [1 << n for n in range(31)]
+    even = _gf2_matrix_square(odd)
+    odd = _gf2_matrix_square(even)
+    # apply len2 zero bytes to crc1 (the first squaring gives the operator of one zero byte)
+    while True:
+        even = _gf2_matrix_square(odd)
+        if len2 & 1:
+            crc1 = _gf2_matrix_times(even, crc1)
+        len2 >>= 1
+        if not len2:
+            break
+        odd = _gf2_matrix_square(even)
+        if len2 & 1:
+            crc1 = _gf2_matrix_times(odd, crc1)
+        len2 >>= 1
+        if not len2:
+            break
+    return crc1 ^ crc2
+
+
+def _gf2_matrix_times(matrix, vector):
+    result = 0
+    for row in matrix:
+        if not vector:
+            break
+        if vector & 1:
+            result ^= row
+        vector >>= 1
+    return result
+
+
+def _gf2_matrix_square(matrix):
+    return [_gf2_matrix_times(matrix, row) for row in matrix]
@@ -0,0 +1,90 @@
+"""
+Conversion of python values to the text of xlsx cells.
+
+The converter of a value is looked up by its type, and the result of the lookup is cached
+for each concrete type: converting a value costs a dictionary lookup and a function call.
+"""
+import decimal
+import sys
+import uuid
+
+
+class ConverterRegistry:
+    """
+        A mapping of python types to converters.
+
+        A converter is a function taking a value and returning the text of the cell (for numeric
+        cells, the text must be a valid number). The converter of a type is the converter registered
+        for the first class of its MRO having one.
+    """
+
+    def __init__(self):
+        self._converters = {}
+        self._cache = {}
+
+    def register(self, python_type, converter=None):
+        """
+            Register ``converter`` for ``python_type`` and its subclasses.
+
+            Can also be used as a decorator: ``@registry.register(MyType)``.
+        """
+        if converter is None:
+            def decorator(function):
+                self.register(python_type, function)
+                return function
+            return decorator
+        self._converters[python_type] = converter
+        self._cache.clear()
+        return converter
+
+    def unregister(self, python_type):
+        del self._converters[python_type]
+        self._cache.clear()
+
+    def get(self, python_type):
+        """Return the converter of ``python_type`` (None if there is none)."""
+        try:
+            return self._cache[python_type]
+        except KeyError:
+            converter = self._cache[python_type] = self._resolve(python_type)
+            return converter
+
+    def _resolve(self, python_type):
+        for klass in python_type.__mro__:
+            if klass in self._converters:
+                return self._converters[klass]
+        numpy = sys.modules.get('numpy')  # numpy types only exist if numpy has been imported
+        if numpy is not None and issubclass(python_type, numpy.generic):
+            return self._convert_item
+        return None
+
+    def convert(self, value):
+        """Return the text of ``value`` (defaults to ``str(value)``, strings are returned as is)."""
+        if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+            return value
+        converter = self.get(type(value))
+        return str(value) if converter is None else converter(value)
+
+    def _convert_item(self, value):
+        return self.convert(value.item())
+
+
+registry = ConverterRegistry()
+registry.register(bool, str)
+registry.register(int, int.__repr__)  # ``int.__repr__`` and not ``str``, for int subclasses (IntEnum, …)
+registry.register(float, float.__repr__)
+registry.register(decimal.Decimal, str)
+registry.register(uuid.UUID, str)
+
+register_converter = registry.register
+get_converter = registry.get
+convert = registry.convert
+
+
+def convert_enum_value(value):
+    """
+        Convert an ``Enum`` member as its value, instead of ``str(member)``.
+
+        Not registered by default, to opt in: ``register_converter(enum.Enum, convert_enum_value)``.
+    """
+    return convert(value.value)
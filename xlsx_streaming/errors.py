@@ -0,0 +1,90 @@
+import collections
+
+
+class DataError(ValueError):
+    """Raised in strict mode when a value does not match the type of its cell."""
+
+    def __init__(self, column, line, value, reason):
+        super().__init__(f"(column '{column}', line '{line}') data does not match template: {reason}")
+        self.column = column
+        self.line = line
+        self.value = value
+        self.reason = reason
+
+    def __reduce__(self):
+        # the error may be raised in a worker process (see ``executor``) and unpickled in the parent
+        return type(self), (self.column, self.line, self.value, self.reason)
+
+
+class InvalidValue(AttributeError):
+    """
+        Raised when a value does not match the type of its cell.
+
+        Raised for each invalid value, its message is only formatted when it is read (e.g. for the
+        samples of an ``ErrorReport``).
+    """
+
+    def __init__(self, expected, value):
+        super().__init__()
+        self.expected = expected
+        self.value = value
+
+    def __str__(self):
+        return f'expected {self.expected} got {self.value}.'
+
+    def __reduce__(self):
+        return type(self), (self.expected, self.value)
+
+
+class ErrorReport:
+    """
+        Account for the values which do not match the type of their cell.
+
+        Invalid values are counted per column, and the first ``max_samples`` invalid values
+        of each column are kept (with their line and the reason of the error). The report can
+        be read once the document has been streamed.
+
+        args:
+            strict (bool): if True, raise a ``DataError`` on the first invalid value instead
+            max_samples (int): the number of invalid values kept for each column
+    """
+
+    def __init__(self, strict=False, max_samples=5):
+        self.strict = strict
+        self.max_samples = max_samples
+        self.counts = collections.Counter()
+        self.samples = collections.defaultdict(list)
+
+    def __repr__(self):
+        return f'<ErrorReport: {self.total} invalid values>'
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    def add(self, column, line, value, error):
+        if self.strict:
+            raise DataError(column, line, value, _get_reason(error)) from error
+        self.counts[column] += 1
+        samples = self.samples[column]
+        if len(samples) < self.max_samples:
+            samples.append((line, value, _get_reason(error)))
+
+    def merge(self, other):
+        """Add the errors of another report (e.g. of a batch rendered in another process)."""
+        self.counts.update(other.counts)
+        for column, samples in other.samples.items():
+            self.samples[column].extend(samples[:self.max_samples - len(self.samples[column])])
+
+    def summary(self):
+        if not self.total:
+            return 'All the values match the template.'
+        lines = [f'{self.total} values do not match the template:']
+        for column in sorted(self.counts, key=lambda column: (len(column), column)):
+            examples = ', '.join(f'{value!r} (line {line})' for line, value, _ in self.samples[column])
+            lines.append(f'  column {column}: {self.counts[column]} invalid values, e.g. {examples}')
+        return '\n'.join(lines)
+
+
+def _get_reason(error):
+    return str(error.args[0]) if error.args else str(error)
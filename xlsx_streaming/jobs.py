@@ -0,0 +1,288 @@
+"""
+Many documents streamed from the same template, in a pool of processes::
+
+    exports = [(f'exports/{customer.pk}.xlsx', functools.partial(get_rows, customer.pk)) for customer in customers]
+    report = jobs.run_jobs(exports, columns=columns, max_workers=8)
+    print(report.summary())
+
+The template is opened, parsed and its static members compressed once (``PreparedTemplate``),
+then sent once to each worker process, instead of once per document.
+"""
+import collections
+import concurrent.futures
+import copy
+import logging
+import os
+import tempfile
+import time
+import zipfile
+
+import zipstream
+
+from . import archive
+from . import compression
+from . import render
+from . import streaming
+
+
+logger = logging.getLogger(__name__)
+
+# A member of the template, as it is stored in the documents
+Member = collections.namedtuple('Member', ['name', 'compressed', 'crc', 'file_size', 'compress_type'])
+
+JobResult = collections.namedtuple('JobResult', ['target', 'rows', 'size', 'elapsed', 'error'])
+JobResult.__doc__ = """
+    The result of a job: its ``target``, the number of ``rows`` and the ``size`` (in bytes) of its
+    document, the time spent streaming it (in seconds) and its ``error`` (None if it succeeded).
+"""
+
+
+class PreparedTemplate:
+    """
+        A template opened and parsed once, to stream many documents.
+
+        The members of the template other than the sheet are kept compressed, and copied as is in
+        each document. Prepared templates can be pickled (e.g. sent to worker processes).
+
+        args:
+            xlsx_template, columns, compresslevel, compressor: see ``stream_queryset_as_xlsx``
+    """
+
+    def __init__(self, xlsx_template=None, columns=None, compresslevel=None, compressor=None):
+        xlsx_template, self.encoders = streaming.get_template_and_encoders(xlsx_template, columns)
+        self.compresslevel = compresslevel
+        self.compressor = compression.get_compressor(compressor).name  # modules cannot be pickled
+        zip_template, self.sheet_name, self.template_elements = streaming.open_template(xlsx_template)
+        with zip_template:
+            self.members = [
+                self._get_member(zip_template, zinfo)
+                for zinfo in zip_template.infolist() if zinfo.filename != self.sheet_name
+            ]
+
+    def __repr__(self):
+        return f'<PreparedTemplate: {self.sheet_name}, {len(self.members)} other members>'
+
+    def _get_member(self, zip_template, zinfo):
+        if zinfo.compress_type in archive.COMPRESS_TYPES and not zinfo.flag_bits & 0x01:  # not encrypted
+            compressed = streaming.read_compressed(zip_template, zinfo)
+            return Member(zinfo.filename, compressed, zinfo.CRC, zinfo.file_size, zinfo.compress_type)
+        data = zip_template.read(zinfo)
+        compressor = compression.get_compressor(self.compressor)
+        compressobj = compressor.compressobj(self.compresslevel)
+        compressed = compressobj.compress(data) + compressobj.flush()
+        return Member(zinfo.filename, compressed, compressor.crc32(data), len(data), zipstream.ZIP_DEFLATED)
+
+    def stream(self, batches, encoding='utf-8', **render_options):
+        """
+            Return the streamable xlsx document of batches of rows.
+
+            ``render_options`` are passed to ``render.render_worksheet`` (e.g. ``trusted``). Documents
+            can be streamed concurrently from the same prepared template (e.g. in threads).
+        """
+        header_tree, views, row_template = self.template_elements
+        # the row template is updated with the values of each row: each document needs its own
+        template_elements = (header_tree, views, copy.deepcopy(row_template))
+        zipped_stream = archive.ZipStream(compresslevel=self.compresslevel, compressor=self.compressor)
+        for member in self.members:
+            zipped_stream.write_compressed(
+                arcname=member.name,
+                compressed=member.compressed,
+                crc=member.crc,
+                file_size=member.file_size,
+                compress_type=member.compress_type,
+            )
+        render_options.setdefault('encoders', self.encoders)
+        zipped_stream.write_iter(
+            arcname=self.sheet_name,
+            iterable=render.render_worksheet(batches, template_elements, encoding, **render_options),
+            compress_type=zipstream.ZIP_DEFLATED,
+        )
+        return zipped_stream
+
+
+class JobsReport:
+    """
+        The results of ``run_jobs``, in the order the jobs completed.
+
+        attributes:
+            results (list): a ``JobResult`` for each job
+            elapsed (float): the time (in seconds) spent running the jobs
+    """
+
+    def __init__(self):
+        self.results = []
+        self.elapsed = 0.
+
+    def __repr__(self):
+        return f'<JobsReport: {len(self.results)} jobs, {len(self.failed)} failed>'
+
+    @property
+    def failed(self):
+        return [result for result in self.results if result.error is not None]
+
+    @property
+    def rows(self):
+        return sum(result.rows for result in self.results)
+
+    @property
+    def size(self):
+        return sum(result.size for result in self.results)
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.elapsed if self.elapsed else 0.
+
+    def summary(self):
+        lines = [
+            f'{len(self.results)} documents ({self.rows} rows, {self.size} bytes) in {self.elapsed:.1f}s: '
+            f'{self.rows_per_second:.0f} rows/s, {self.size / (self.elapsed or 1) / 2 ** 20:.1f} MiB/s'
+        ]
+        for result in self.failed:
+            lines.append(f'  {result.target}: {result.error}')
+        return '\n'.join(lines)
+
+
+def run_jobs(
+        jobs,
+        xlsx_template=None,
+        columns=None,
+        max_workers=None,
+        output=None,
+        serializer=None,
+        batch_size=1000,
+        encoding='utf-8',
+        compresslevel=None,
+        compressor=None,
+        trusted=False,
+        compact=False,
+    ):
+    """
+        Stream a document for each job, from the same template, in a pool of processes.
+
+        A job is a pair of a target and the rows of its document. The target is the path of the
+        document, or its name in the ``output`` archive. The rows are an iterable, or a callable
+        returning them, called in the worker process (e.g. to query a database, whose connections
+        cannot be shared between processes). The jobs and the serializer must be picklable.
+
+        At most ``2 * max_workers`` jobs are submitted ahead of the results being collected,
+        so that ``jobs`` can be a generator of many jobs. A failed job does not stop the other
+        ones: its error is logged and kept in its ``JobResult``.
+
+        args:
+            jobs (Iterable): the (target, rows) pairs of the documents
+            xlsx_template, columns: the template of all the documents (see ``stream_queryset_as_xlsx``)
+            max_workers (int): the number of worker processes (defaults to the number of CPUs),
+                0 to stream the documents in the current process
+            output: the path or binary file object of a zip archive in which the documents are
+                stored (not recompressed), instead of being written to their own files
+            serializer, batch_size, encoding, compresslevel, compressor, trusted, compact: see
+                ``stream_queryset_as_xlsx``
+
+        return (JobsReport):
+            the results of the jobs
+    """
+    prepared = PreparedTemplate(xlsx_template, columns, compresslevel=compresslevel, compressor=compressor)
+    options = {
+        'serializer': serializer,
+        'batch_size': batch_size,
+        'encoding': encoding,
+        'trusted': trusted,
+        'compact': compact,
+    }
+    report = JobsReport()
+    started_at = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix='xlsx-streaming-') as directory:
+        outer = None if output is None else zipfile.ZipFile(output, 'w', zipfile.ZIP_STORED)  # pylint: disable=consider-using-with
+        try:
+            for (target, path), result in _run(prepared, jobs, max_workers, directory if outer else None, options):
+                if outer is not None and result.error is None:
+                    outer.write(path, arcname=target)
+                if outer is not None and os.path.exists(path):
+                    os.remove(path)
+                report.results.append(result)
+        finally:
+            if outer is not None:
+                outer.close()
+    report.elapsed = time.perf_counter() - started_at
+    return report
+
+
+def _run(prepared, jobs, max_workers, directory, options):
+    if max_workers == 0:
+        for index, (target, rows) in enumerate(jobs):
+            path = _get_path(target, index, directory)
+            yield (target, path), _run_job(prepared, target, rows, path, options)
+        return
+
+    max_workers = max_workers or os.cpu_count() or 1
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers, initializer=_init_worker, initargs=(prepared,),
+    ) as executor:
+        pending = {}
+        for index, (target, rows) in enumerate(jobs):
+            if len(pending) >= 2 * max_workers:
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    job = pending.pop(future)
+                    yield job, _get_result(future, job[0])
+            path = _get_path(target, index, directory)
+            pending[executor.submit(_run_job_in_worker, target, rows, path, options)] = (target, path)
+        for future in concurrent.futures.as_completed(pending):
+            job = pending[future]
+            yield job, _get_result(future, job[0])
+
+
+def _get_path(target, index, directory):
+    # in an archive, documents are written to temporary files until they are stored
+    return os.fspath(target) if directory is None else os.path.join(directory, f'{index}.xlsx')
+
+
+def _get_result(future, target):
+    try:
+        return future.result()
+    except Exception as e:  # pylint: disable=broad-except
+        # the worker process died, or the job could not be sent to it
+        logger.error('Job %s failed: %r', target, e)
+        return JobResult(target, 0, 0, 0., repr(e))
+
+
+_worker_template = None
+
+
+def _init_worker(prepared):
+    global _worker_template  # pylint: disable=global-statement
+    _worker_template = prepared
+
+
+def _run_job_in_worker(target, rows, path, options):
+    return _run_job(_worker_template, target, rows, path, options)
+
+
+def _run_job(prepared, target, rows, path, options):
+    started_at = time.perf_counter()
+    serializer = options['serializer'] or (lambda x: x)
+    lines = size = 0
+
+    def count_rows(batch):
+        nonlocal lines
+        batch = list(serializer(batch))
+        lines += len(batch)
+        return batch
+
+    try:
+        if callable(rows):
+            rows = rows()
+        batches = streaming.serialize_queryset_by_batch(rows, count_rows, options['batch_size'])
+        stream = prepared.stream(
+            batches, options['encoding'], trusted=options['trusted'], compact=options['compact'],
+        )
+        with open(path, 'wb') as output:
+            for chunk in stream:
+                output.write(chunk)
+                size += len(chunk)
+    except Exception as e:  # pylint: disable=broad-except
+        logger.exception('Job %s failed', target)
+        if os.path.exists(path):
+            os.remove(path)
+        return JobResult(target, lines, 0, time.perf_counter() - started_at, repr(e))
+    return JobResult(target, lines, size, time.perf_counter() - started_at, None)
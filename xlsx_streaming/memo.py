@@ -0,0 +1,84 @@
+import datetime
+import decimal
+import functools
+
+# Equal values of these types are not always encoded the same way (``Decimal('1.0')`` and
+# ``Decimal('1.00')``, ``0.0`` and ``-0.0``, aware datetimes in other timezones): they are cached
+# by their value and their representation
+REPR_KEYED_TYPES = (float, decimal.Decimal)
+AWARE_TYPES = (datetime.datetime, datetime.time)
+
+
+class ValueCache:
+    """
+        Memoize the encoding of the values of each column.
+
+        Each column keeps its most recently used values and their encoding (the content of their
+        cell) in a LRU cache of at most ``maxsize`` values: in columns with few distinct values
+        (country codes, statuses, round amounts, …), encoding a value is then a dictionary lookup.
+        Values of different types are cached separately (``1``, ``1.0`` and ``True`` are not
+        encoded the same way), and floats, decimals and timezone aware datetimes by their
+        representation as well (``Decimal('1.0')`` and ``Decimal('1.00')`` are equal but are not
+        encoded the same way). Unhashable values are not cached. The hits and misses of each column
+        can be read once the document has been streamed.
+
+        args:
+            maxsize (int): the number of values cached for each column
+    """
+
+    def __init__(self, maxsize=1024):
+        if maxsize < 1:
+            raise ValueError('The size of the cache must be at least 1')
+        self.maxsize = maxsize
+        self._encoders = {}
+
+    def __repr__(self):
+        return f'<ValueCache: {self.hits} hits, {self.misses} misses>'
+
+    @property
+    def hits(self):
+        return sum(info.hits for info in self.info().values())
+
+    @property
+    def misses(self):
+        return sum(info.misses for info in self.info().values())
+
+    def info(self):
+        """Return the ``functools.lru_cache`` statistics (hits, misses, size) of each column."""
+        infos = {}
+        for (column, _), (memoized, _) in self._encoders.items():
+            info = memoized.cache_info()
+            if column in infos:  # the column has been encoded with several encoders
+                previous = infos[column]
+                info = info._replace(
+                    hits=previous.hits + info.hits,
+                    misses=previous.misses + info.misses,
+                    currsize=previous.currsize + info.currsize,
+                )
+            infos[column] = info
+        return infos
+
+    def get_encoder(self, column, encoder):
+        """Return the memoized version of the ``encoder`` of a column (a function of the value)."""
+        key = (column, encoder)
+        try:
+            return self._encoders[key][1]
+        except KeyError:
+            memoized = functools.lru_cache(self.maxsize, typed=True)(
+                lambda value, representation=None: encoder(value)
+            )
+            self._encoders[key] = (memoized, _memoize(memoized, encoder))
+            return self._encoders[key][1]
+
+
+def _memoize(memoized, encoder):
+    def encode(value):
+        if isinstance(value, REPR_KEYED_TYPES) or isinstance(value, AWARE_TYPES) and value.tzinfo is not None:
+            # the representation tells equal values apart (the value itself tells ``1.0`` and ``1`` apart)
+            return memoized(value, repr(value))
+        try:
+            hash(value)
+        except TypeError:
+            return encoder(value)
+        return memoized(value)
+    return encode
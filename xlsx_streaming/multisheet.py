@@ -0,0 +1,203 @@
+"""
+Workbooks of several sheets, each filled with rows of its own::
+
+    stream = stream_sheets_as_xlsx(
+        [summary_rows, detail_qs, Sheet(audit_qs, serializer=serialize_audit)],
+        'report-template.xlsx',
+    )
+
+The sheets are members of the document which are written one after the other. The first sheet is
+streamed as it is rendered, while the next ones are rendered and compressed at the same time by
+background threads, each into a spill file (kept in memory up to ``spill_size`` bytes, then on
+disk). Once a sheet is written, the next one is copied from its spill file, without being
+recompressed: the export takes about as long as its slowest sheet rather than the sum of all the
+sheets when fetching the rows (e.g. database queries) or compressing them dominates. Rendering
+itself holds the GIL, and does not run in parallel.
+"""
+import collections
+import concurrent.futures
+import functools
+import os
+import tempfile
+import threading
+import zipfile
+
+import zipstream
+
+from . import compression
+from . import render
+from . import streaming
+from . import templates
+
+# The size up to which a spill file is kept in memory
+DEFAULT_SPILL_SIZE = 8 * 1024 * 1024
+READ_SIZE = 64 * 1024
+
+Sheet = collections.namedtuple('Sheet', ['rows', 'serializer'], defaults=[None])
+Sheet.__doc__ = """
+    The rows of a sheet (see ``stream_queryset_as_xlsx``) and the serializer applied to each batch of
+    them, if any (the ``serializer`` of ``stream_sheets_as_xlsx`` by default).
+"""
+
+
+def stream_sheets_as_xlsx(
+        sheets,
+        xlsx_template,
+        serializer=None,
+        batch_size=1000,
+        encoding='utf-8',
+        compresslevel=None,
+        compressor=None,
+        trusted=False,
+        compact=False,
+        max_workers=None,
+        spill_size=DEFAULT_SPILL_SIZE,
+        spill_dir=None,
+    ):
+    """
+        Stream the bytes of an xlsx document of several sheets, filled from a row source each.
+
+        Each sheet of the template gives the header (optional) and the types of the columns of its rows,
+        like the template of ``stream_queryset_as_xlsx``. The sheets after the first one are rendered in
+        background threads, which start when the stream is first iterated.
+
+        args:
+            sheets (list): the rows of each sheet of the template, in the order of the workbook (an iterable
+                of rows, or a ``Sheet`` with a serializer of its own). The sheets of the template without
+                rows are kept as they are in the template.
+            xlsx_template (Union[BinaryIO, str, os.PathLike]): an xlsx template with at least as many sheets
+                as ``sheets`` (a binary file object or a path)
+            serializer, batch_size, encoding, compresslevel, compressor, trusted, compact:
+                see ``stream_queryset_as_xlsx``
+            max_workers (int): the number of sheets rendered at the same time in the background
+                (all of them by default)
+            spill_size (int): the size (in bytes) up to which a sheet rendered in the background is kept
+                in memory before being written to a temporary file
+            spill_dir (str): the directory of the temporary files (the default temporary directory by default)
+
+        return (Iterable):
+            a streamable xlsx file
+    """
+    sheets = [sheet if isinstance(sheet, Sheet) else Sheet(sheet) for sheet in sheets]
+    if not sheets:
+        raise ValueError('At least one sheet is required')
+    if isinstance(xlsx_template, (str, os.PathLike)):
+        xlsx_template = templates.open_mapped_template(xlsx_template)
+    zip_template = zipfile.ZipFile(xlsx_template, mode='r')  # pylint: disable=consider-using-with
+    try:
+        sheet_names = streaming.get_sheet_names(zip_template)
+        if len(sheets) > len(sheet_names):
+            raise ValueError(f'{len(sheets)} sheets of rows given, the template has {len(sheet_names)} sheets')
+        template_elements = []
+        for sheet_name in sheet_names[:len(sheets)]:
+            with zip_template.open(sheet_name) as sheet_file:
+                template_elements.append(render.get_elements_from_template(sheet_file))
+    except BaseException:
+        zip_template.close()
+        raise
+
+    options = {
+        'serializer': serializer or (lambda x: x),
+        'batch_size': batch_size,
+        'encoding': encoding,
+        'trusted': trusted,
+        'compact': compact,
+    }
+    return _stream_sheets(
+        zip_template, list(zip(sheet_names, sheets, template_elements)), options,
+        compresslevel, compressor, max_workers, spill_size, spill_dir,
+    )
+
+
+def _stream_sheets(zip_template, sheets, options, compresslevel, compressor, max_workers, spill_size, spill_dir):
+    stop = threading.Event()
+    background_sheets = sheets[1:]
+    futures = []
+    executor = None
+    try:
+        if background_sheets:
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers or len(background_sheets), thread_name_prefix='xlsx_streaming-sheet',
+            )
+            futures = [
+                executor.submit(
+                    _spill_sheet, sheet, template_elements, options, compresslevel, compressor, spill_size,
+                    spill_dir, stop,
+                )
+                for _, sheet, template_elements in background_sheets
+            ]
+
+        zipped_stream = streaming.zip_to_zipstream(
+            zip_template, exclude=[sheet_name for sheet_name, _, _ in sheets],
+            compresslevel=compresslevel, compressor=compressor,
+        )
+        sheet_name, sheet, template_elements = sheets[0]
+        zipped_stream.write_iter(
+            arcname=sheet_name,
+            iterable=_render_sheet(sheet, template_elements, options),
+            compress_type=zipstream.ZIP_DEFLATED,
+        )
+        for (sheet_name, _, _), future in zip(background_sheets, futures):
+            zipped_stream.write_pending(sheet_name, functools.partial(_get_spilled_sheet, future))
+        yield from zipped_stream
+    finally:
+        stop.set()  # the background sheets stop at their next batch
+        for future in futures:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for future in futures:
+            if not future.cancelled() and future.exception() is None:
+                future.result()[0].close()
+        zip_template.close()
+
+
+def _render_sheet(sheet, template_elements, options, stop=None):
+    batches = streaming.serialize_queryset_by_batch(
+        sheet.rows, sheet.serializer or options['serializer'], options['batch_size'],
+    )
+    if stop is not None:
+        batches = _until(batches, stop)
+    return render.render_worksheet(
+        batches, template_elements, options['encoding'], trusted=options['trusted'], compact=options['compact'],
+    )
+
+
+def _until(batches, stop):
+    for batch in batches:
+        if stop.is_set():
+            return
+        yield batch
+
+
+def _spill_sheet(sheet, template_elements, options, compresslevel, compressor, spill_size, spill_dir, stop):
+    """Render and compress a sheet to a spill file, and return the file, the CRC and the sizes of the sheet."""
+    spill = tempfile.SpooledTemporaryFile(spill_size, dir=spill_dir)  # pylint: disable=consider-using-with
+    try:
+        compressor = compression.get_compressor(compressor)
+        compressobj = compressor.compressobj(compresslevel)
+        crc = size = compress_size = 0
+        for chunk in _render_sheet(sheet, template_elements, options, stop):
+            crc = compressor.crc32(chunk, crc)
+            size += len(chunk)
+            data = compressobj.compress(chunk)
+            if data:
+                spill.write(data)
+                compress_size += len(data)
+        data = compressobj.flush()
+        spill.write(data)
+        spill.seek(0)
+    except BaseException:
+        spill.close()
+        raise
+    return spill, crc, size, compress_size + len(data)
+
+
+def _get_spilled_sheet(future):
+    spill, crc, size, compress_size = future.result()
+    return _iter_spill(spill), crc, size, compress_size
+
+
+def _iter_spill(spill):
+    with spill:
+        yield from iter(functools.partial(spill.read, READ_SIZE), b'')
@@ -0,0 +1,160 @@
+"""
+Stages of an export running in threads of their own, connected by bounded queues.
+
+Each stage iterates the output of the previous stage and puts its items in a queue of at most
+``maxsize`` items, read by the next stage: a slow consumer holds back every stage, so that
+memory usage stays bounded however fast the stages are. Closing the output of a stage (e.g. when
+the client of a streaming response disconnects) stops it and, in turn, the stages before it.
+"""
+import queue
+import threading
+import time
+
+_DONE = object()
+
+
+class PipelineCancelled(Exception):
+    """Raised by the stages of a cancelled pipeline."""
+
+
+class StageMetrics:
+    """
+        The queue metrics of a pipeline stage.
+
+        attributes:
+            name (str): the name of the stage
+            maxsize (int): the size of the queue of the stage
+            items (int): the number of items produced by the stage
+            max_depth (int): the largest number of items waiting in the queue
+            put_wait (float): the time (in seconds) the stage waited for the next stage to read its
+                items (backpressure)
+            get_wait (float): the time (in seconds) the next stage waited for the items of the stage
+    """
+
+    def __init__(self, name, maxsize):
+        self.name = name
+        self.maxsize = maxsize
+        self.items = 0
+        self.max_depth = 0
+        self.put_wait = 0.
+        self.get_wait = 0.
+        self._queue = None
+
+    def __repr__(self):
+        return (
+            f'<StageMetrics {self.name}: {self.items} items, depth {self.depth}/{self.maxsize}'
+            f' (max {self.max_depth}), put wait {self.put_wait:.3f}s, get wait {self.get_wait:.3f}s>'
+        )
+
+    @property
+    def depth(self):
+        """The number of items currently waiting in the queue."""
+        return 0 if self._queue is None else self._queue.qsize()
+
+
+class Pipeline:
+    """
+        Run the stages of an export in threads connected by bounded queues.
+
+        ``stage()`` wraps an iterable: the iterable is iterated in a thread of its own (started
+        when the returned generator is first iterated) and its items are read from a queue of
+        at most ``maxsize`` items. Each stage is expected to consume the output of the previous
+        one: when a stage is closed, the previous stage is closed too. The metrics of each stage
+        are kept in ``stages``.
+
+        args:
+            maxsize (int): the number of items a stage can produce ahead of the next stage
+            poll_interval (float): how often (in seconds) a blocked stage checks whether it is cancelled
+    """
+
+    def __init__(self, maxsize=2, poll_interval=0.1):
+        if maxsize < 1:
+            raise ValueError('The size of the queues must be at least 1')
+        self.maxsize = maxsize
+        self.poll_interval = poll_interval
+        self.stages = []
+        self._outputs = []
+        self._cancelled = threading.Event()
+
+    def __repr__(self):
+        return f'<Pipeline: {", ".join(stage.name for stage in self.stages)}>'
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """Stop all the stages (their output then raises ``PipelineCancelled``)."""
+        self._cancelled.set()
+
+    def stage(self, name, iterable):
+        """Iterate ``iterable`` in a thread and return a generator of its items."""
+        metrics = StageMetrics(name, self.maxsize)
+        self.stages.append(metrics)
+        output = self._consume(iterable, metrics, len(self._outputs))
+        self._outputs.append(output)
+        return output
+
+    def _consume(self, iterable, metrics, index):
+        items = queue.Queue(self.maxsize)
+        metrics._queue = items
+        stopped = threading.Event()
+        thread = threading.Thread(
+            target=self._produce, args=(iterable, items, stopped, metrics), name=f'xlsx-streaming-{metrics.name}',
+        )
+        thread.daemon = True
+        thread.start()
+        try:
+            while True:
+                started_at = time.perf_counter()
+                item, error = self._get(items)
+                metrics.get_wait += time.perf_counter() - started_at
+                if error is not None:
+                    raise error
+                if item is _DONE:
+                    break
+                yield item
+        finally:
+            # the producer stops at its next item (or when blocked on a full queue), and closes its iterable
+            stopped.set()
+            thread.join()
+            if index:
+                self._outputs[index - 1].close()
+
+    def _produce(self, iterable, items, stopped, metrics):
+        iterator = None
+        try:
+            iterator = iter(iterable)
+            for item in iterator:
+                metrics.items += 1
+                if not self._put(items, (item, None), stopped, metrics):
+                    return
+            self._put(items, (_DONE, None), stopped, metrics)
+        except BaseException as error:  # pylint: disable=broad-except
+            self._put(items, (None, error), stopped, metrics)
+        finally:
+            close = getattr(iterator, 'close', None)  # e.g. the generator of the previous stage
+            if close is not None:
+                close()
+
+    def _put(self, items, item, stopped, metrics):
+        started_at = time.perf_counter()
+        try:
+            while not stopped.is_set() and not self._cancelled.is_set():
+                try:
+                    items.put(item, timeout=self.poll_interval)
+                except queue.Full:
+                    continue
+                metrics.max_depth = max(metrics.max_depth, items.qsize())
+                return True
+            return False
+        finally:
+            metrics.put_wait += time.perf_counter() - started_at
+
+    def _get(self, items):
+        while True:
+            try:
+                return items.get(timeout=self.poll_interval)
+            except queue.Empty:
+                if self._cancelled.is_set():
+                    return None, PipelineCancelled('The export pipeline has been cancelled')
@@ -0,0 +1,179 @@
+import collections
+import collections.abc
+import cProfile
+import io
+import pstats
+import time
+
+
+# The stages of an export, in order: each stage pulls its input from the previous one
+STAGES = ('fetch', 'serialize', 'render', 'compress')
+
+
+class Profiler:
+    """
+        Timings of a streamed document, per stage and per encoder, reported once it is streamed.
+
+        The time spent in each stage of the export is measured in the thread consuming the stream:
+        fetching the rows, the ``serializer``, rendering the worksheet (including the encoding of
+        the values) and compressing the document. The time spent by the consumer of the stream
+        (e.g. sending it to the client) is not counted. The encoding of the values is also timed
+        per encoder (e.g. ``encode_datetime``, ``_get_text`` for text cells), which slows down the
+        export: profile an export in which you are looking for the slow part, not all of them.
+        The encoders are not timed when rendering in an ``executor``, and the stages overlap
+        in a ``pipeline``.
+
+        attributes:
+            stages (dict): the time (in seconds) spent in each stage (see ``STAGES``)
+            encoders (dict): the number of values encoded and the time (in seconds) spent by each encoder
+            stats (pstats.Stats): the ``cProfile`` statistics, if enabled
+            finished (bool): whether the whole document has been streamed
+
+        args:
+            path (str): if provided, the report (see ``report``) is written to this file once the
+                document has been streamed (or has failed)
+            cprofile (bool): if True, the export is also profiled by ``cProfile`` (only the code run
+                in the thread consuming the stream) and the most expensive functions are reported
+            limit (int): the number of functions reported from the ``cProfile`` statistics
+    """
+
+    def __init__(self, path=None, cprofile=False, limit=30):
+        self.path = path
+        self.limit = limit
+        self.encoders = collections.defaultdict(lambda: [0, 0.])
+        self.stats = None
+        self.finished = False
+        self._cprofile = cProfile.Profile() if cprofile else None
+        self._times = dict.fromkeys(('fetch', 'serialize', 'render', 'document'), 0.)
+
+    def __repr__(self):
+        stages = ', '.join(f'{stage} {elapsed:.3f}s' for stage, elapsed in self.stages.items())
+        return f'<Profiler: {stages}>'
+
+    @property
+    def stages(self):
+        times = self._times
+        return {
+            'fetch': max(times['fetch'] - times['serialize'], 0.),
+            'serialize': times['serialize'],
+            'render': max(times['render'] - times['fetch'], 0.),
+            'compress': max(times['document'] - times['render'], 0.),
+        }
+
+    @property
+    def elapsed(self):
+        """The time (in seconds) spent streaming the document, not counting the consumer of the stream."""
+        return self._times['document']
+
+    def time_serializer(self, serializer):
+        def serialize(rows):
+            started_at = time.perf_counter()
+            try:
+                batch = serializer(rows)
+                if not isinstance(batch, collections.abc.Sized):
+                    # the serializer may return an iterator, serialized when the batch is rendered
+                    batch = list(batch)
+                return batch
+            finally:
+                self._times['serialize'] += time.perf_counter() - started_at
+        return serialize
+
+    def time_batches(self, batches):
+        """Time the fetching (and serialization) of the batches of rows."""
+        return self._time('fetch', batches)
+
+    def time_worksheet(self, chunks):
+        """Time the rendering of the worksheet (including fetching its rows)."""
+        return self._time('render', chunks)
+
+    def time_document(self, chunks):
+        """Time the whole stream, and write the report once it has been streamed."""
+        try:
+            if self._cprofile is None:
+                yield from self._time('document', chunks)
+            else:
+                yield from self._time('document', chunks, enable=self._cprofile.enable, disable=self._cprofile.disable)
+            self.finished = True
+        finally:
+            if self._cprofile is not None:
+                self.stats = pstats.Stats(self._cprofile)
+            if self.path is not None:
+                with open(self.path, 'w', encoding='utf-8') as report_file:
+                    report_file.write(self.report())
+
+    def timed_cache(self, cache=None):
+        """Return a ``ValueCache`` replacement timing the encoders (memoized by ``cache``, if provided)."""
+        return _TimedCache(self, cache)
+
+    def get_encoder(self, name, encoder):
+        """Return the timed version of an ``encoder`` (a function of the value), accounted as ``name``."""
+        timings = self.encoders[name]
+
+        def encode(value):
+            started_at = time.perf_counter()
+            try:
+                return encoder(value)
+            finally:
+                timings[0] += 1
+                timings[1] += time.perf_counter() - started_at
+        return encode
+
+    def report(self):
+        """Return the report of the timings, as text."""
+        elapsed = self.elapsed
+        lines = [f'Export profile ({"complete" if self.finished else "incomplete"}): {elapsed:.3f}s', '']
+        lines.append(f'{"stage":<20} {"seconds":>10} {"%":>6}')
+        for stage, stage_elapsed in self.stages.items():
+            lines.append(f'{stage:<20} {stage_elapsed:>10.3f} {_percent(stage_elapsed, elapsed):>6.1f}')
+        if self.encoders:
+            lines += ['', f'{"encoder":<32} {"values":>10} {"seconds":>10} {"ns/value":>10}']
+            for name, (calls, encoder_elapsed) in sorted(self.encoders.items(), key=lambda item: -item[1][1]):
+                lines.append(f'{name:<32} {calls:>10} {encoder_elapsed:>10.3f} {encoder_elapsed / calls * 1e9:>10.0f}')
+        if self.stats is not None:
+            output = io.StringIO()
+            self.stats.stream = output
+            self.stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.limit)
+            lines += ['', output.getvalue().strip('\n')]
+        return '\n'.join(lines) + '\n'
+
+    def _time(self, name, iterable, enable=None, disable=None):
+        times = self._times
+        iterator = iter(iterable)
+        while True:
+            started_at = time.perf_counter()
+            if enable is not None:
+                enable()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                if disable is not None:
+                    disable()
+                times[name] += time.perf_counter() - started_at
+            yield item
+
+
+class _TimedCache:
+    """Time the encoders of the values of each column (see ``ValueCache.get_encoder``)."""
+
+    def __init__(self, profiler, cache):
+        self.profiler = profiler
+        self.cache = cache
+        self._encoders = {}
+
+    def get_encoder(self, column, encoder):
+        key = (column, encoder)
+        try:
+            return self._encoders[key]
+        except KeyError:
+            # built once, the timing itself would otherwise be slowed down by building it for each cell
+            name = getattr(encoder, '__name__', repr(encoder))
+            if self.cache is not None:
+                encoder = self.cache.get_encoder(column, encoder)
+            timed = self._encoders[key] = self.profiler.get_encoder(name, encoder)
+            return timed
+
+
+def _percent(part, total):
+    return part / total * 100 if total else 0.
@@ -0,0 +1,95 @@
+import time
+
+
+class Progress:
+    """
+        The progress of a streamed document, updated once per batch.
+
+        The progress can be polled while the document is streamed (e.g. from another thread), or
+        reported by ``callback``, called with the progress each time a batch is handed to the
+        renderer and once the document has been streamed.
+
+        attributes:
+            rows (int): the number of rows handed to the renderer
+            batches (int): the number of batches handed to the renderer
+            size (int): the size of the rendered worksheet (uncompressed, in bytes)
+            compressed_size (int): the size of the streamed document so far (in bytes)
+            finished (bool): whether the whole document has been streamed
+
+        args:
+            total (int): the number of rows of the document, if known (to compute an ETA)
+            callback (Callable): a function called with the progress after each batch (see above)
+    """
+
+    def __init__(self, total=None, callback=None):
+        self.total = total
+        self.callback = callback
+        self.rows = 0
+        self.batches = 0
+        self.size = 0
+        self.compressed_size = 0
+        self.finished = False
+        self._started_at = None
+        self._finished_at = None
+
+    def __repr__(self):
+        total = '' if self.total is None else f'/{self.total}'
+        eta = '' if self.eta is None else f', ETA {self.eta:.0f}s'
+        return (
+            f'<Progress: {self.rows}{total} rows, {self.batches} batches, {self.compressed_size} bytes'
+            f' in {self.elapsed:.1f}s{eta}>'
+        )
+
+    @property
+    def elapsed(self):
+        """The time (in seconds) since the document started being streamed."""
+        if self._started_at is None:
+            return 0.
+        return (self._finished_at or time.perf_counter()) - self._started_at
+
+    @property
+    def rows_per_second(self):
+        elapsed = self.elapsed
+        return self.rows / elapsed if elapsed else 0.
+
+    @property
+    def bytes_per_second(self):
+        """The throughput of the streamed document (compressed bytes per second)."""
+        elapsed = self.elapsed
+        return self.compressed_size / elapsed if elapsed else 0.
+
+    @property
+    def fraction(self):
+        """The fraction of the rows already rendered (None if the total is not known)."""
+        if self.finished:
+            return 1.
+        if not self.total:
+            return None
+        return min(self.rows / self.total, 1.)
+
+    @property
+    def eta(self):
+        """The estimated time (in seconds) left (None if the total or the throughput is not known)."""
+        if self.finished:
+            return 0.
+        rows_per_second = self.rows_per_second
+        if self.total is None or not rows_per_second:
+            return None
+        return max(self.total - self.rows, 0) / rows_per_second
+
+    def start(self):
+        if self._started_at is None:
+            self._started_at = time.perf_counter()
+
+    def add_batch(self, rows):
+        self.start()
+        self.batches += 1
+        self.rows += rows
+        if self.callback is not None:
+            self.callback(self)
+
+    def finish(self):
+        self._finished_at = time.perf_counter()
+        self.finished = True
+        if self.callback is not None:
+            self.callback(self)
@@ -1,7 +1,19 @@
+import collections
+import copy
 import datetime
+import decimal
 import logging
+import math
+import os
 import re
 from xml.etree import ElementTree as ETree
+from xml.sax.saxutils import escape as xml_escape
+from xml.sax.saxutils import quoteattr
+
+from . import columnar
+from . import converters
+from .errors import ErrorReport
+from .errors import InvalidValue
 
 
 logger = logging.getLogger(__name__)
@@ -11,6 +23,10 @@ OPENXML_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
 OPENXML_NS_R = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
 OPENXML_COLUMN_RE = re.compile(r'([A-Z]+)[0-9]+')
 
+# The number of batches submitted to an executor ahead of the consumer: twice the default number
+# of workers of a ``ProcessPoolExecutor``
+DEFAULT_MAX_PENDING = 2 * (os.cpu_count() or 1)
+
 
 def _timezone_helper():
     _timezone_helper.timezone = None
@@ -24,36 +40,200 @@ def _timezone_helper():
 get_export_timezone, set_export_timezone = _timezone_helper()
 
 
-def render_worksheet(rows_batches, openxml_sheet_string, encoding='utf-8'):
+def render_worksheet(
+        rows_batches,
+        openxml_sheet_string,
+        encoding='utf-8',
+        executor=None,
+        trusted=False,
+        encoders=None,
+        errors=None,
+        compact=False,
+        cache=None,
+        max_pending=None,
+    ):
     """
         Render a collection of row batches to open xml.
 
         args:
             rows_batches (iterable): each element is a list of lists containing the row values
             openxml_sheet_string (str): a template for the final sheet containing the header and an example row
+                (a string, a file object, or the elements already extracted with ``get_elements_from_template``)
+            executor (concurrent.futures.Executor): if provided, the batches are rendered concurrently
+                in this executor (the output order is preserved)
+            trusted (bool): if True, the values are not checked against the cell types of the template
+                (see ``render_rows_trusted``)
+            encoders (list): in trusted mode, the function used to encode the values of each column
+                (see ``compile_row_template``)
+            errors (ErrorReport): if provided, the values which do not match the cell types of the
+                template are accounted in this report instead of being logged
+            compact (bool): if True, the rows are written without newlines, without the optional ``r``
+                (reference) attributes and without their empty cells (see ``render_row``)
+            cache (ValueCache): if provided, the encoding of the values of each column is memoized
+                in this cache (not used when rendering in an executor)
+            max_pending (int): the number of batches submitted to the ``executor`` ahead of the consumer
+                (``DEFAULT_MAX_PENDING`` by default), typically twice its number of workers
     """
-    header_tree, views, row_template = get_elements_from_template(openxml_sheet_string)
-
-    yield f'<worksheet xmlns="{OPENXML_NS}" xmlns:r="{OPENXML_NS_R}">\n'.encode(encoding)
-
+    if isinstance(openxml_sheet_string, tuple):
+        header_tree, views, row_template = openxml_sheet_string
+    else:
+        header_tree, views, row_template = get_elements_from_template(openxml_sheet_string)
+
+    yield from _iter_worksheet_start(header_tree, views, encoding, compact)
+    yield from render_worksheet_rows(
+        rows_batches,
+        row_template,
+        get_first_line(header_tree),
+        encoding,
+        executor=executor,
+        trusted=trusted,
+        encoders=encoders,
+        errors=errors,
+        compact=compact,
+        cache=cache,
+        max_pending=max_pending,
+    )
+    yield render_worksheet_end(encoding, compact)
+
+
+def get_first_line(header_tree):
+    """Return the line of the first rendered row (the line after the header row if there is one)."""
+    return 1 if header_tree is None else 2
+
+
+def render_worksheet_start(header_tree, views, encoding='utf-8', compact=False):
+    """Return the beginning of the sheet, up to the header row (included), as bytes."""
+    return b''.join(_iter_worksheet_start(header_tree, views, encoding, compact))
+
+
+def _iter_worksheet_start(header_tree, views, encoding, compact):
+    newline = '' if compact else '\n'
+    yield f'<worksheet xmlns="{OPENXML_NS}" xmlns:r="{OPENXML_NS_R}">{newline}'.encode(encoding)
     if views is not None:
         yield ETree.tostring(views, encoding=encoding)
-
-    yield '<sheetData>\n'.encode(encoding)
-
-    current_line = 1
+    yield f'<sheetData>{newline}'.encode(encoding)
     if header_tree is not None:
         yield ETree.tostring(header_tree, encoding=encoding)
-        current_line += 1
-    for rows in rows_batches:
-        rendered_rows, lines = render_rows(rows, row_template, start_line=current_line, encoding=encoding)
-        yield rendered_rows
-        current_line += lines
 
-    yield " </sheetData>\n" "</worksheet>\n".encode(encoding)
 
+def render_worksheet_end(encoding='utf-8', compact=False):
+    """Return the end of the sheet, after the last row, as bytes."""
+    if compact:
+        return '</sheetData></worksheet>'.encode(encoding)
+    return " </sheetData>\n" "</worksheet>\n".encode(encoding)
+
+
+def render_worksheet_rows(
+        rows_batches,
+        row_template,
+        start_line,
+        encoding='utf-8',
+        executor=None,
+        trusted=False,
+        encoders=None,
+        errors=None,
+        compact=False,
+        cache=None,
+        max_pending=None,
+    ):
+    """
+        Render a collection of row batches to open xml rows, the first row being at ``start_line``.
+
+        See ``render_worksheet`` for the arguments.
+    """
+    render_function = render_rows
+    if trusted:
+        render_function = render_rows_trusted
+        errors = None  # values are not checked
+        if row_template is not None:
+            row_template = compile_row_template(row_template, encoders)
+
+    if executor is not None:
+        # the cache is not used by the workers, it cannot be shared with worker processes
+        yield from _render_rows_in_executor(
+            render_function, rows_batches, row_template, start_line, encoding, executor, errors, compact,
+            max_pending or DEFAULT_MAX_PENDING,
+        )
+    else:
+        current_line = start_line
+        options = _get_render_options(errors, compact, cache)
+        for rows in rows_batches:
+            if row_template is None and render_function is render_rows:
+                rows = list(rows)
+                if rows:
+                    # the memoized default template is shared by all the documents (and threads), and only
+                    # reset on their first line: the rows of a document starting further get a template of their own
+                    row_template = _build_default_template(len(rows[0]))
+            rendered_rows, lines = render_function(
+                rows, row_template, start_line=current_line, encoding=encoding, **options,
+            )
+            yield rendered_rows
+            current_line += lines
+
+    if errors is not None and errors.total:
+        logger.info(errors.summary())
+
+
+def _get_render_options(errors, compact, cache=None):
+    options = {}
+    if errors is not None:
+        options['errors'] = errors
+    if compact:
+        options['compact'] = True
+    if cache is not None:
+        options['cache'] = cache
+    return options
+
+
+def _render_rows_in_executor(
+        render_function, rows_batches, row_template, start_line, encoding, executor, errors, compact=False,
+        max_pending=DEFAULT_MAX_PENDING,
+    ):
+    """
+        Render the batches in ``executor`` and yield them in order.
 
-def render_rows(rows, row_template, start_line, encoding='utf-8'):
+        At most ``max_pending`` batches are submitted ahead of the consumer, so that memory usage
+        stays bounded. The errors of each batch are accounted in a report of their own, which is
+        merged in ``errors`` when the batch is yielded.
+    """
+    pending = collections.deque()
+    current_line = start_line
+    try:
+        for rows in rows_batches:
+            rows = list(rows)
+            if row_template is None and rows and render_function is render_rows:
+                # the memoized default template of each worker cannot be reset, give them the template
+                row_template = _build_default_template(len(rows[0]))
+            batch_errors = None if errors is None else ErrorReport(errors.strict, errors.max_samples)
+            # ``render_rows`` updates the template: batches rendered in threads each need their own
+            batch_template = copy.deepcopy(row_template) if render_function is render_rows else row_template
+            pending.append(executor.submit(
+                _render_batch, render_function, rows, batch_template, current_line, encoding, batch_errors, compact,
+            ))
+            current_line += len(rows)
+            if len(pending) >= max_pending:
+                yield _get_batch_result(pending.popleft(), errors)
+        while pending:
+            yield _get_batch_result(pending.popleft(), errors)
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _render_batch(render_function, rows, row_template, start_line, encoding, errors, compact=False):
+    options = _get_render_options(errors, compact)
+    rendered_rows, _ = render_function(rows, row_template, start_line, encoding, **options)
+    return rendered_rows, errors
+
+
+def _get_batch_result(future, errors):
+    rendered_rows, batch_errors = future.result()
+    if errors is not None:
+        errors.merge(batch_errors)
+    return rendered_rows
+
+
+def render_rows(rows, row_template, start_line, encoding='utf-8', errors=None, compact=False, cache=None):
     """
         Return a collection of open xml rows as bytes.
 
@@ -67,18 +247,23 @@ def render_rows(rows, row_template, start_line, encoding='utf-8'):
             rows (list): a list of list containing the row values
             row_template (xml.ElementTree): a template used for each row
             start_line (int): the line of the first row in the returned xml
+            errors (ErrorReport): the report accounting for invalid values (see ``update_cell``)
+            compact (bool): if True, the rows are not separated by newlines (see ``render_row``)
+            cache (ValueCache): the cache of the encoded values of each column (see ``update_cell``)
 
         ..note: This function updates row_template each time it is called.
     """
     lines = 0
     rendered_rows = []
+    # the column and the encoder of the cells are resolved once for all the rows, not for each cell
+    encoders = None if row_template is None else _get_cell_encoders(row_template, cache)
     for i, row in enumerate(rows, start_line):
-        rendered_rows.append(render_row(row, row_template, i, encoding))
+        rendered_rows.append(_render_row(row, row_template, i, encoding, errors, compact, cache, encoders))
         lines += 1
-    return b'\n'.join(rendered_rows), lines
+    return (b'' if compact else b'\n').join(rendered_rows), lines
 
 
-def render_row(row_values, row_template, line, encoding='utf-8'):
+def render_row(row_values, row_template, line, encoding='utf-8', errors=None, compact=False, cache=None):
     """
         Return an openxml row as bytes using row_template as a model, and row_values for the values.
 
@@ -86,69 +271,301 @@ def render_row(row_values, row_template, line, encoding='utf-8'):
             row_values (list): the list of values to update the row
             row_template (xml.ElementTree): a template for the current row
             line (int): the line of the current row
+            errors (ErrorReport): the report accounting for invalid values (see ``update_cell``)
+            compact (bool): if True, the row is written without its ``r`` attribute and without its
+                empty (None) cells. The ``r`` attribute of a cell is only kept after an empty cell,
+                since a cell without reference is the one following the previous cell.
+            cache (ValueCache): the cache of the encoded values of each column (see ``update_cell``)
 
         ..note: This function updates row_template each time it is called.
     """
+    return _render_row(row_values, row_template, line, encoding, errors, compact, cache)
+
+
+def _render_row(row_values, row_template, line, encoding, errors, compact, cache, encoders=None):
     reset_memory = line < 3  # with a header, the first call to render_row can be with line = 2
     if row_template is None:
         row_template = get_default_template(row_values, reset_memory)
+        encoders = None
     cells = list(row_template)
     if len(cells) != len(row_values):
         logger.debug(
             '``len(row_values)`` do not match the number of cells in ``row_template``. '
             'Ignoring template (all cells will be stored as text).'
         )
-        row_template = get_default_template(row_values, reset_memory)
+        # not the memoized default template, which may be the one of other rows (or of another thread)
+        row_template = _build_default_template(len(row_values))
         cells = list(row_template)
+        encoders = None
 
-    for value, cell_template in zip(row_values, cells):
-        update_cell(cell_template, line, value)
+    if encoders is None:
+        for value, cell_template in zip(row_values, cells):
+            update_cell(cell_template, line, value, errors, cache)
+    else:
+        for value, cell_template, (column, update_function, get_text) in zip(row_values, cells, encoders):
+            _update_cell(cell_template, column, line, value, update_function, get_text, errors)
     row_template.set('r', str(line))
+    if compact:
+        return _render_compact_row(row_template, row_values, cells, encoding)
     return ETree.tostring(row_template, encoding=encoding)
 
 
-def update_cell(cell, line, value):
+def _render_compact_row(row_template, row_values, cells, encoding):
+    row = ETree.Element('row', {key: value for key, value in row_template.attrib.items() if key != 'r'})
+    attributes = []
+    next_index = 0
+    for index, (value, cell) in enumerate(zip(row_values, cells)):
+        if value is None:
+            continue
+        if index == next_index:
+            attributes.append((cell, dict(cell.attrib)))
+            del cell.attrib['r']
+        row.append(cell)
+        next_index = index + 1
+    try:
+        return ETree.tostring(row, encoding=encoding)
+    finally:
+        for cell, attrib in attributes:  # the template cells are reused for the next rows
+            cell.attrib.clear()
+            cell.attrib.update(attrib)
+
+
+def render_rows_trusted(rows, cells, start_line, encoding='utf-8', compact=False, cache=None):
+    """
+        Return a collection of open xml rows as bytes, without checking the values.
+
+        Contrary to ``render_rows``, the values are encoded directly with the encoder of their
+        column: they are not checked against the cell types, and the rows are rendered without
+        using ElementTree. The values must match the column types, extra values are ignored.
+
+        args:
+            rows (Union[list, ColumnBatch]): a list of list containing the row values, or the values
+                of each column (a ``columnar.ColumnBatch``, encoded column by column)
+            cells (list): the compiled row template (see ``compile_row_template``), if None
+                all the values are rendered as text
+            start_line (int): the line of the first row in the returned xml
+            compact (bool): if True, the rows are written without newlines, without the optional ``r``
+                attributes and without their empty cells (see ``render_row``)
+            cache (ValueCache): if provided, the encoding of the values of each column is memoized
+    """
+    if cells is not None and cache is not None:
+        cells = _memoize_cells(cells, cache)
+    if cells is not None and not compact and isinstance(rows, columnar.ColumnBatch):
+        return _render_columns_trusted(rows, cells, start_line).encode(encoding), len(rows)
+    rendered_rows = []
+    for line, row in enumerate(rows, start_line):
+        if cells is None:
+            cells = compile_row_template(_build_default_template(len(row)))
+            if cache is not None:
+                cells = _memoize_cells(cells, cache)
+        if compact:
+            rendered_rows.append(_render_compact_row_trusted(row, cells, line))
+            continue
+        rendered_cells = [f'<row r="{line}">']
+        for value, (column, attributes, encoder) in zip(row, cells):
+            if value is None:
+                rendered_cells.append(f'<c r="{column}{line}"{attributes}/>')
+            else:
+                rendered_cells.append(f'<c r="{column}{line}"{attributes}>{encoder(value)}</c>')
+        rendered_cells.append('</row>')
+        rendered_rows.append(''.join(rendered_cells))
+    return ('' if compact else '\n').join(rendered_rows).encode(encoding), len(rendered_rows)
+
+
+def _render_columns_trusted(batch, cells, start_line):
+    rendered_columns = [
+        [
+            f'<c r="{column}{line}"{attributes}/>' if value is None
+            else f'<c r="{column}{line}"{attributes}>{encoder(value)}</c>'
+            for line, value in enumerate(values, start_line)
+        ]
+        for values, (column, attributes, encoder) in zip(batch.columns, cells)
+    ]
+    if not rendered_columns:
+        return '\n'.join(f'<row r="{line}"></row>' for line in range(start_line, start_line + len(batch)))
+    return '\n'.join(
+        f'<row r="{line}">{"".join(row_cells)}</row>'
+        for line, row_cells in enumerate(zip(*rendered_columns), start_line)
+    )
+
+
+def _memoize_cells(cells, cache):
+    return [(column, attributes, cache.get_encoder(column, encoder)) for column, attributes, encoder in cells]
+
+
+def _render_compact_row_trusted(row, cells, line):
+    rendered_cells = ['<row>']
+    next_index = 0
+    for index, (value, (column, attributes, encoder)) in enumerate(zip(row, cells)):
+        if value is None:
+            continue
+        if index == next_index:
+            rendered_cells.append(f'<c{attributes}>{encoder(value)}</c>')
+        else:
+            rendered_cells.append(f'<c r="{column}{line}"{attributes}>{encoder(value)}</c>')
+        next_index = index + 1
+    rendered_cells.append('</row>')
+    return ''.join(rendered_cells)
+
+
+def compile_row_template(row_template, encoders=None):
+    """
+        Compile a row template for ``render_rows_trusted``.
+
+        args:
+            row_template (xml.ElementTree): a template for the rows
+            encoders (list): the function used to encode the values of each column (a function
+                returning the content of the cell as an xml string, e.g. ``encode_text``). When
+                None (for the whole list or for a column), the encoder is chosen from the cell type.
+
+        return (list):
+            a (column, attributes, encoder) tuple for each cell
+    """
+    cells = []
+    for i, cell in enumerate(child for child in row_template if child.tag == 'c'):
+        encoder = encoders[i] if encoders is not None and i < len(encoders) else None
+        cell_type = cell.get('t', 'n')
+        if encoder is None:
+            encoder = {'n': encode_number_or_datetime, 'b': encode_bool}.get(cell_type, encode_text)
+        attributes = {key: value for key, value in cell.attrib.items() if key not in ('r', 't')}
+        if encoder is encode_text:
+            attributes['t'] = 'inlineStr'
+        elif encoder is encode_bool:
+            attributes['t'] = 'b'
+        cells.append((
+            get_column(cell),
+            ''.join(f' {key}={quoteattr(value)}' for key, value in attributes.items()),
+            encoder,
+        ))
+    return cells
+
+
+DATETIME_TYPES = (datetime.date, datetime.time, datetime.timedelta)
+
+
+def encode_number(value):
+    number_format = NUMBER_FORMATS.get(type(value))
+    if number_format is not None and converters.get_converter(type(value)) is number_format[0]:
+        return f'<v>{number_format[1](value)}</v>'
+    return f'<v>{converters.convert(value)}</v>'
+
+
+def encode_int(value):
+    return f'<v>{int(value)}</v>'
+
+
+def encode_float(value):
+    return f'<v>{_format_float(float(value))}</v>'
+
+
+def encode_datetime(value):
+    return f'<v>{datetime_to_excel_datetime(value)}</v>'
+
+
+def encode_number_or_datetime(value):
+    if isinstance(value, DATETIME_TYPES):
+        return encode_datetime(value)
+    return encode_number(value)
+
+
+def encode_bool(value):
+    return '<v>1</v>' if value else '<v>0</v>'
+
+
+def encode_text(value):
+    if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+        return f'<is><t>{xml_escape(escape(value))}</t></is>'
+    return f'<is><t>{xml_escape(escape(converters.convert(value)))}</t></is>'
+
+
+def update_cell(cell, line, value, errors=None, cache=None):
     """
         Update cell with a new line and a new value.
 
         The value must be compatible with the cell type (numeric, boolean or text).
-        The function raises if this is not the case.
+        If this is not the case, the cell value is left unchanged and the error is accounted
+        in ``errors`` (an ``ErrorReport``, which raises in strict mode) or logged if no report
+        is provided.
         Updating a cell with a None value sets cell.text to the empty string.
+        If a ``ValueCache`` is provided, the text of the values is memoized per column.
     """
     column = get_column(cell)
-    cell_type = cell.attrib.get('t', 'n')
-    update_function = {
-        'n': _update_numeric_cell,
-        'b': _update_boolean_cell,
-    }.get(cell_type, _update_text_cell)
+    update_function, get_text = _get_cell_encoder(cell, column, cache)
+    _update_cell(cell, column, line, value, update_function, get_text, errors)
+
 
+def _get_cell_encoder(cell, column, cache=None):
+    update_function, get_text = UPDATE_FUNCTIONS.get(cell.attrib.get('t', 'n'), (_update_text_cell, _get_text))
+    if cache is not None:
+        get_text = cache.get_encoder(column, get_text)
+    return update_function, get_text
+
+
+def _get_cell_encoders(row_template, cache=None):
+    """Return the column, the update function and the encoder of each cell of a row template."""
+    encoders = []
+    for cell in row_template:
+        column = get_column(cell)
+        encoders.append((column, *_get_cell_encoder(cell, column, cache)))
+    return encoders
+
+
+def _update_cell(cell, column, line, value, update_function, get_text, errors):
     try:
-        update_function(cell, value)
+        update_function(cell, get_text(value))
     except Exception as e:  # pylint: disable=broad-except
-        args = e.args or ['']
-        msg = f"(column '{column}', line '{line}') data does not match template: {args[0]}"
-        logger.debug(msg)
+        if errors is not None:
+            errors.add(column, line, value, e)
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "(column '%s', line '%s') data does not match template: %s", column, line, e.args[0] if e.args else e,
+            )
     cell.set('r', f'{column}{line}')
 
 
-def _update_boolean_cell(cell, value):
+def _get_boolean_text(value):
     if value is not None and not isinstance(value, bool):
-        raise AttributeError(f"expected a boolean got {value}.")
-    next(child for child in cell if child.tag == 'v').text = '' if value is None else str(int(value))
+        raise InvalidValue('a boolean', value)
+    return '' if value is None else str(int(value))
+
+
+def _format_float(value):
+    # there is no NaN nor infinity in xlsx documents, the cell is left empty
+    return float.__repr__(value) if math.isfinite(value) else ''
 
 
-def _update_numeric_cell(cell, value):
+def _format_decimal(value):
+    return str(value) if value.is_finite() else ''
+
+
+# The default converter of the number types which are formatted directly, and their formatting function
+NUMBER_FORMATS = {
+    int: (int.__repr__, int.__repr__),
+    float: (float.__repr__, _format_float),
+    decimal.Decimal: (str, _format_decimal),
+}
+
+
+def _get_numeric_text(value):
     if value is None:
-        cell_text = ''
+        return ''
+    # fast path: the text of the exact number types (not bool) is a valid number, unless a
+    # converter has been registered for them
+    number_format = NUMBER_FORMATS.get(type(value))
+    if number_format is not None and converters.get_converter(type(value)) is number_format[0]:
+        return number_format[1](value)
+    if isinstance(value, DATETIME_TYPES):
+        cell_text = str(datetime_to_excel_datetime(value))
     else:
-        try:
-            cell_text = str(datetime_to_excel_datetime(value))
-        except TypeError:
-            cell_text = str(value)
-        try:
-            float(cell_text)
-        except Exception as e:  # pylint: disable=broad-except
-            raise AttributeError(f"expected a numeric or date like value got {cell_text}.") from e
+        cell_text = converters.convert(value)
+    try:
+        number = float(cell_text)
+    except Exception as e:  # pylint: disable=broad-except
+        raise InvalidValue('a numeric or date like value', cell_text) from e
+    return cell_text if math.isfinite(number) else ''
+
+
+def _update_value_cell(cell, cell_text):
     next(child for child in cell if child.tag == 'v').text = cell_text
 
 
@@ -170,15 +587,27 @@ def escape(value):
     return CHAR_REGEX.sub(_sub, value)
 
 
-def _update_text_cell(cell, value):
+def _get_text(value):
+    if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+        return escape(value)
+    return '' if value is None else escape(converters.convert(value))
+
+
+def _update_text_cell(cell, cell_text):
     if cell.get('t') != 'inlineStr':
         # write all the strings 'inline' to avoid messing up with
         # a string reference file in the final xlsx file
         cell.clear()
         cell.set('t', 'inlineStr')
         ETree.SubElement(ETree.SubElement(cell, 'is'), 't')
-    updated_text = '' if value is None else str(value)
-    next(child for child in cell.iter() if child.tag == 't').text = escape(updated_text)
+    next(child for child in cell.iter() if child.tag == 't').text = cell_text
+
+
+# The function updating the cells of each type, and the function returning the text of their value
+UPDATE_FUNCTIONS = {
+    'n': (_update_value_cell, _get_numeric_text),
+    'b': (_update_value_cell, _get_boolean_text),
+}
 
 
 def datetime_to_excel_datetime(dt_obj, date_1904=False):
@@ -281,45 +710,39 @@ def _get_column_letter(col_idx):
     return ''.join(reversed(letters))
 
 
-def _get_header_and_row_template(tree):
+def _get_header_and_row_template(rows):
     """
         Extract the header (potentially None) and the first row from
-        the provided tree
+        the first rows of the template
         args:
-            tree (ElementTree.Element): root element of the template
+            rows (list): the first two rows (at most) of the template
         return (tuple):
             a tuple of (header_tree, row_template_tree) ElementTree objects
     """
-    header_tree = None
-    row_template_tree = None
-
-    for child in tree.find('sheetData').iterfind('row'):
-        if header_tree is None:
-            header_tree = child
-        else:
-            row_template_tree = child
-            if count_cells(header_tree) != count_cells(row_template_tree):
-                logger.debug(
-                    'Header and row template do not have the same number of cells. '
-                    'Ignoring template (all cells will be stored as text).'
-                )
-                return None, None
-            return header_tree, row_template_tree
-
-    # There were only single row, so it's not header, it's a row template
-    return None, header_tree
+    if not rows:
+        return None, None
+    if len(rows) == 1:
+        # There were only single row, so it's not header, it's a row template
+        return None, rows[0]
+
+    header_tree, row_template_tree = rows[:2]
+    if count_cells(header_tree) != count_cells(row_template_tree):
+        logger.debug(
+            'Header and row template do not have the same number of cells. '
+            'Ignoring template (all cells will be stored as text).'
+        )
+        return None, None
+    return header_tree, row_template_tree
 
 
-def _get_sheet_views(tree):
+def _get_sheet_views(pane):
     """
-        Extract sheet views (potentially None) from the provided tree
+        Build sheet views (potentially None) from the pane of the template
         args:
-            tree (ElementTree.Element): root element of the template
+            pane (ElementTree.Element): the pane of the template sheet view (potentially None)
         return (ElementTree.Element):
             Constructed sheetViews ElementTree.Element object
     """
-    pane = tree.find('sheetViews/sheetView/pane')
-
     # Currently we only support panes with fronzen state
     if pane is None or pane.get('state') != 'frozen':
         return None
@@ -333,17 +756,65 @@ def _get_sheet_views(tree):
     return sheet_views
 
 
+TEMPLATE_CHUNK_SIZE = 64 * 1024
+
+
 def get_elements_from_template(openxml_sheet):
-    tree = ETree.fromstring(openxml_sheet)
-    rm_namespace(tree)
+    """
+        Extract the header row, the sheet views and the row template of a template sheet.
 
-    header, row_template = _get_header_and_row_template(tree)
+        The sheet is parsed incrementally, and parsing stops as soon as the first two rows have
+        been found: the time and memory needed do not depend on the size of the template sheet.
 
-    views = _get_sheet_views(tree)
+        args:
+            openxml_sheet (str, bytes or file object): the template sheet (a binary or text file object)
+        return (tuple):
+            a tuple of (header, views, row_template) ElementTree objects (potentially None)
+    """
+    rows, pane = [], None
+    for element in _iter_parsed_elements(openxml_sheet):
+        tag = element.tag.rsplit('}', 1)[-1]
+        if tag == 'pane' and pane is None:
+            pane = element
+        elif tag == 'row':
+            rows.append(element)
+            if len(rows) == 2:
+                break
+        elif tag == 'sheetData':
+            break
+
+    for element in rows + [pane]:
+        if element is not None:
+            rm_namespace(element)
+
+    header, row_template = _get_header_and_row_template(rows)
+
+    views = _get_sheet_views(pane)
 
     return header, views, row_template
 
 
+def _iter_parsed_elements(openxml_sheet):
+    """Yield the elements of the sheet as soon as they are parsed (on their closing tag)."""
+    parser = ETree.XMLPullParser(events=('end',))
+    for chunk in _iter_chunks(openxml_sheet):
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            yield element
+
+
+def _iter_chunks(openxml_sheet):
+    if isinstance(openxml_sheet, (str, bytes)):
+        for start in range(0, len(openxml_sheet), TEMPLATE_CHUNK_SIZE):
+            yield openxml_sheet[start:start + TEMPLATE_CHUNK_SIZE]
+    else:
+        # binary or text file objects: the end of the file is b'' or ''
+        chunk = openxml_sheet.read(TEMPLATE_CHUNK_SIZE)
+        while chunk:
+            yield chunk
+            chunk = openxml_sheet.read(TEMPLATE_CHUNK_SIZE)
+
+
 def get_default_template(row_values, reset_memory=False):
     """
         Return the default template row.
@@ -353,8 +824,14 @@ def get_default_template(row_values, reset_memory=False):
     if get_default_template._memoized:
         return get_default_template._memoized[0]
 
+    root = _build_default_template(len(row_values))
+    get_default_template._memoized.append(root)
+    return root
+
+
+def _build_default_template(cells_count):
     root = ETree.Element('row', {'r': '1'})
-    for i in range(1, len(row_values) + 1):
+    for i in range(1, cells_count + 1):
         el_t = ETree.Element('t')
         el_t.text = 'Default'
         el_is = ETree.Element('is')
@@ -362,6 +839,4 @@ def get_default_template(row_values, reset_memory=False):
         cell = ETree.Element('c', {'r': '%s%s' % (_get_column_letter(i), 1), 't': 'inlineStr'})  # pylint: disable=consider-using-f-string
         cell.append(el_is)
         root.append(cell)
-
-    get_default_template._memoized.append(root)
     return root
@@ -0,0 +1,213 @@
+"""
+Exports written to a local file, which can be resumed after a failure::
+
+    def get_rows(after):
+        qs = Transaction.objects.order_by('pk')
+        return qs if after is None else qs.filter(pk__gt=after)
+
+    resumable.export_to_file('export.xlsx', get_rows, key=lambda row: row.pk, serializer=serialize)
+
+Every ``checkpoint_every`` batches, the deflate stream of the sheet is flushed with ``Z_FULL_FLUSH``,
+which ends the data written so far on a byte boundary and resets the compressor: the data which
+follows does not depend on the compressor state. A checkpoint is then saved next to the document,
+with the key of the last written row, the next line, the CRC-32 and sizes of the sheet so far and
+the offset of the end of the flushed data. If the export fails, calling ``export_to_file`` again
+truncates the document at the last checkpoint and resumes from the row following its key.
+
+The sheet is the first member of the document, the other members of the template are written
+once the sheet is complete.
+"""
+import collections
+import json
+import os
+import time
+import zlib
+
+import zipstream
+
+from . import compression
+from . import render
+from . import streaming
+
+
+CHECKPOINT_SUFFIX = '.checkpoint'
+
+Checkpoint = collections.namedtuple(
+    'Checkpoint',
+    ['key', 'line', 'crc', 'size', 'compress_size', 'offset', 'sheet_name', 'date_time', 'encoding', 'compact'],
+)
+Checkpoint.__doc__ = """
+    The state of an export at a deflate sync point: the ``key`` of the last written row, the next
+    ``line``, the CRC-32 and the sizes of the sheet so far, the ``offset`` in the document where
+    the export resumes, and the sheet member and rendering options of the document.
+"""
+
+
+def export_to_file(
+        path,
+        get_rows,
+        key,
+        xlsx_template=None,
+        columns=None,
+        serializer=None,
+        batch_size=1000,
+        checkpoint_every=10,
+        checkpoint_path=None,
+        encoding='utf-8',
+        compresslevel=None,
+        compressor=None,
+        trusted=False,
+        compact=False,
+    ):
+    """
+        Write an xlsx document to a file, saving checkpoints from which a failed export is resumed.
+
+        If a checkpoint of a previous export of the document exists, the export resumes from it.
+        The checkpoint is removed once the document is complete.
+
+        args:
+            path (str): the path of the document
+            get_rows (Callable): a function returning the rows (see ``stream_queryset_as_xlsx``) which
+                follow the row of a key, in order, or all the rows if the key is None
+            key (Callable): a function returning the key of a row (before serialization), which must
+                be JSON serializable
+            checkpoint_every (int): the number of batches between two checkpoints
+            checkpoint_path (str): the path of the checkpoint (the document path followed
+                by ``.checkpoint`` by default)
+            xlsx_template, columns, serializer, batch_size, encoding, compresslevel, compressor, trusted,
+            compact: see ``stream_queryset_as_xlsx``. The template and options of a resumed export
+                must be the ones of the failed export.
+
+        return (int):
+            the number of rows of the document
+    """
+    checkpoint_path = checkpoint_path or os.fspath(path) + CHECKPOINT_SUFFIX
+    checkpoint = load_checkpoint(checkpoint_path)
+    serializer = serializer or (lambda x: x)
+    xlsx_template, encoders = streaming.get_template_and_encoders(xlsx_template, columns)
+    zip_template, sheet_name, (header_tree, views, row_template) = streaming.open_template(xlsx_template)
+    if checkpoint is not None and (checkpoint.sheet_name, checkpoint.encoding, checkpoint.compact) != (
+            sheet_name, encoding, compact):
+        raise ValueError('The export cannot be resumed with another template, encoding or compact option')
+    compressor = compression.get_compressor(compressor)
+
+    with zip_template, open(path, 'wb' if checkpoint is None else 'r+b') as output:
+        if checkpoint is None:
+            checkpoint = Checkpoint(
+                None, render.get_first_line(header_tree), 0, 0, 0, 0, sheet_name, time.localtime()[0:6],
+                encoding, compact,
+            )
+            output.write(_get_sheet_info(checkpoint).FileHeader(False))
+            sheet = _SheetWriter(output, checkpoint, compressor, compresslevel)
+            sheet.write(render.render_worksheet_start(header_tree, views, encoding, compact))
+        else:
+            output.seek(checkpoint.offset)
+            output.truncate()
+            sheet = _SheetWriter(output, checkpoint, compressor, compresslevel)
+
+        last_key, line = checkpoint.key, checkpoint.line
+
+        def serialize(rows):
+            nonlocal last_key, line
+            rows = list(rows)
+            if rows:
+                last_key = key(rows[-1])
+            batch = list(serializer(rows))
+            line += len(batch)
+            return batch
+
+        batches = streaming.serialize_queryset_by_batch(get_rows(checkpoint.key), serialize, batch_size)
+        chunks = render.render_worksheet_rows(
+            batches, row_template, checkpoint.line, encoding, trusted=trusted, encoders=encoders, compact=compact,
+        )
+        # a chunk is rendered from the last serialized batch
+        for count, chunk in enumerate(chunks, 1):
+            sheet.write(chunk)
+            if count % checkpoint_every == 0:
+                save_checkpoint(checkpoint_path, sheet.checkpoint(last_key, line))
+        sheet.write(render.render_worksheet_end(encoding, compact))
+        zinfo = sheet.close()
+
+        zipped_stream = streaming.zip_to_zipstream(
+            zip_template, exclude=[sheet_name], compresslevel=compresslevel, compressor=compressor,
+        )
+        zipped_stream.follow(output.tell(), [zinfo])
+        for chunk in zipped_stream:
+            output.write(chunk)
+
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return line - render.get_first_line(header_tree)
+
+
+def load_checkpoint(checkpoint_path):
+    """Return the ``Checkpoint`` saved at ``checkpoint_path``, or None if there is none."""
+    try:
+        with open(checkpoint_path, encoding='utf-8') as checkpoint_file:
+            values = json.load(checkpoint_file)
+    except FileNotFoundError:
+        return None
+    values['date_time'] = tuple(values['date_time'])
+    return Checkpoint(**values)
+
+
+def save_checkpoint(checkpoint_path, checkpoint):
+    """Save a ``Checkpoint`` atomically (a failure leaves the previous checkpoint)."""
+    temporary_path = f'{checkpoint_path}.tmp'
+    with open(temporary_path, 'w', encoding='utf-8') as checkpoint_file:
+        json.dump(checkpoint._asdict(), checkpoint_file)
+        checkpoint_file.flush()
+        os.fsync(checkpoint_file.fileno())
+    os.replace(temporary_path, checkpoint_path)
+
+
+def _get_sheet_info(checkpoint):
+    zinfo = zipstream.ZipInfo(checkpoint.sheet_name, checkpoint.date_time)
+    zinfo.external_attr = 0o600 << 16     # ?rw-------
+    zinfo.compress_type = zipstream.ZIP_DEFLATED
+    zinfo.flag_bits = 0x08                # bit 3: sizes and CRC are written in a data descriptor
+    zinfo.header_offset = 0
+    return zinfo
+
+
+class _SheetWriter:
+    """Compress the sheet to the document, from a checkpoint."""
+
+    def __init__(self, output, checkpoint, compressor, compresslevel):
+        self.output = output
+        self.compressor = compressor
+        self.compressobj = compressor.compressobj(compresslevel)
+        self.start = checkpoint
+        self.crc = checkpoint.crc
+        self.size = checkpoint.size
+        self.compress_size = checkpoint.compress_size
+
+    def write(self, data):
+        self.crc = self.compressor.crc32(data, self.crc)
+        self.size += len(data)
+        self._write(self.compressobj.compress(data))
+
+    def checkpoint(self, key, line):
+        # the data written so far can be decompressed without the compressor state
+        self._write(self.compressobj.flush(zlib.Z_FULL_FLUSH))
+        self.output.flush()
+        os.fsync(self.output.fileno())
+        return self.start._replace(
+            key=key, line=line, crc=self.crc, size=self.size, compress_size=self.compress_size,
+            offset=self.output.tell(),
+        )
+
+    def close(self):
+        """Write the end of the deflate stream and the data descriptor of the sheet, and return its ``ZipInfo``."""
+        self._write(self.compressobj.flush())
+        zinfo = _get_sheet_info(self.start)
+        zinfo.CRC = self.crc
+        zinfo.file_size = self.size
+        zinfo.compress_size = self.compress_size
+        self.output.write(zinfo.DataDescriptor())
+        return zinfo
+
+    def _write(self, data):
+        if data:
+            self.output.write(data)
+            self.compress_size += len(data)
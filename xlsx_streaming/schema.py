@@ -0,0 +1,185 @@
+import collections
+import datetime
+import decimal
+import io
+from xml.etree import ElementTree as ETree
+
+from . import render
+from . import xlsx_template
+
+
+NUMBER = 'number'
+INT = 'int'
+FLOAT = 'float'
+BOOL = 'bool'
+DATE = 'date'
+DATETIME = 'datetime'
+TIME = 'time'
+TEXT = 'text'
+
+COLUMN_TYPES = (NUMBER, INT, FLOAT, BOOL, DATE, DATETIME, TIME, TEXT)
+
+# Encoders used to render the values of each column type in trusted mode
+ENCODERS = {
+    NUMBER: render.encode_number,
+    INT: render.encode_int,
+    FLOAT: render.encode_float,
+    BOOL: render.encode_bool,
+    DATE: render.encode_datetime,
+    DATETIME: render.encode_datetime,
+    TIME: render.encode_datetime,
+    TEXT: render.encode_text,
+}
+
+
+Column = collections.namedtuple('Column', ['name', 'type', 'style'], defaults=[TEXT, None])
+Column.__doc__ = """
+    A column of the exported document.
+
+    args:
+        name (str): the name of the column, written in the header row
+        type (str): the type of the column values (one of ``COLUMN_TYPES``)
+        style (int): the index of the cell format of the column in the ``cellXfs`` of the template
+            styles, overriding the format of the column type. The styles of the built templates are:
+            0 (General), 1 (date), 2 (date and time) and 3 (time).
+"""
+
+# Index of the cell format used for each column type in ``STYLES_XML``
+# (``cellXfs``), 0 being the default "General" format.
+STYLE_IDS = {DATE: 1, DATETIME: 2, TIME: 3}
+
+# the date (14), date and time (22) and time (21) built-in number formats
+STYLES_XML = xlsx_template.get_styles_xml((14, 22, 21))
+
+STYLES_PATH = xlsx_template.STYLES_PATH
+
+# PostgreSQL type OIDs, as found in ``cursor.description`` with psycopg
+PG_TYPE_OIDS = {
+    16: BOOL,
+    20: NUMBER, 21: NUMBER, 23: NUMBER, 26: NUMBER, 700: NUMBER, 701: NUMBER, 1700: NUMBER,
+    1082: DATE,
+    1083: TIME,
+    1114: DATETIME, 1184: DATETIME,
+}
+
+
+PYTHON_TYPES = (
+    (bool, BOOL),
+    ((int, float, decimal.Decimal), NUMBER),
+    (datetime.datetime, DATETIME),
+    (datetime.date, DATE),
+    (datetime.time, TIME),
+)
+
+
+def type_from_value(value):
+    """Return the column type matching a python value (``None`` if it cannot be guessed)."""
+    if value is None:
+        return None
+    return type_from_python_type(type(value)) or TEXT
+
+
+def type_from_python_type(python_type):
+    for python_types, column_type in PYTHON_TYPES:
+        if issubclass(python_type, python_types):
+            return column_type
+    return None
+
+
+def type_from_type_code(type_code):
+    """
+        Return the column type matching a DB-API ``type_code`` (``None`` if unknown).
+
+        Both PostgreSQL OIDs (psycopg) and python types (used as type codes by some drivers)
+        are supported.
+    """
+    if isinstance(type_code, type):
+        return type_from_python_type(type_code)
+    return PG_TYPE_OIDS.get(type_code)
+
+
+def types_from_description(description, rows=()):
+    """
+        Infer the column types of a DB-API cursor.
+
+        The ``type_code`` of each column in ``description`` is used when it is known, otherwise
+        the type is inferred from the first non null value of the column in ``rows``.
+        Columns whose type cannot be inferred are exported as text.
+    """
+    types = [type_from_type_code(column[1]) for column in description]
+    for i, column_type in enumerate(types):
+        if column_type is None:
+            values = (row[i] for row in rows if row[i] is not None)
+            types[i] = type_from_value(next(values, None)) or TEXT
+    return types
+
+
+def get_columns(columns):
+    """Return a list of ``Column`` from a list of columns or column types."""
+    columns = [Column(None, column) if isinstance(column, str) else Column(*column) for column in columns]
+    for column in columns:
+        if column.type not in COLUMN_TYPES:
+            raise ValueError(f'Unknown column type {column.type!r}, expected one of {COLUMN_TYPES}')
+    return columns
+
+
+def get_encoders(columns):
+    """Return the trusted mode encoders of a list of columns or column types."""
+    return [ENCODERS[column.type] for column in get_columns(columns)]
+
+
+def build_template(columns, header=None):
+    """
+        Build an in memory xlsx template whose row template has the given columns.
+
+        args:
+            columns (list): a ``Column`` or a column type (one of ``COLUMN_TYPES``) for each column
+            header (Optional[list]): the header row values. Defaults to the names of the columns,
+                no header row is written if no column has a name.
+
+        return (BytesIO):
+            an xlsx file which can be used as ``xlsx_template`` in ``stream_queryset_as_xlsx``
+    """
+    columns = get_columns(columns)
+    if header is None and any(column.name is not None for column in columns):
+        header = ['' if column.name is None else column.name for column in columns]
+
+    sheet_data = ETree.Element('sheetData')
+    line = 1
+    if header is not None:
+        header_row = ETree.SubElement(sheet_data, 'row', r=str(line))
+        for i, value in enumerate(header, 1):
+            cell = ETree.SubElement(header_row, 'c', r=f'{render._get_column_letter(i)}{line}', t='inlineStr')
+            ETree.SubElement(ETree.SubElement(cell, 'is'), 't').text = render.escape(str(value))
+        line += 1
+    sheet_data.append(build_row_template(columns, line))
+
+    sheet_xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<worksheet xmlns="{render.OPENXML_NS}" xmlns:r="{render.OPENXML_NS_R}">'
+    ).encode() + ETree.tostring(sheet_data, encoding='utf-8', xml_declaration=False) + b'</worksheet>'
+
+    members = dict(xlsx_template.MEMBERS)
+    members[xlsx_template.SHEET_PATH] = sheet_xml
+    members[STYLES_PATH] = STYLES_XML
+    return io.BytesIO(xlsx_template.build_template(members))
+
+
+def build_row_template(columns, line=1):
+    """Return an openxml row (xml.ElementTree) with one cell per column (or column type)."""
+    row = ETree.Element('row', r=str(line))
+    for i, column in enumerate(get_columns(columns), 1):
+        attrib = {'r': f'{render._get_column_letter(i)}{line}'}
+        if column.type == BOOL:
+            attrib['t'] = 'b'
+        elif column.type == TEXT:
+            attrib['t'] = 'inlineStr'
+        style = STYLE_IDS.get(column.type) if column.style is None else column.style
+        if style is not None:
+            attrib['s'] = str(style)
+        cell = ETree.SubElement(row, 'c', attrib)
+        if column.type == TEXT:
+            ETree.SubElement(ETree.SubElement(cell, 'is'), 't')
+        else:
+            ETree.SubElement(cell, 'v').text = '0'
+    return row
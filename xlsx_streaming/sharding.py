@@ -0,0 +1,220 @@
+"""
+Sharded exports: the rows of one document are rendered and compressed in parts (e.g. by
+several processes or machines), then the parts are stitched into the document without being
+recompressed::
+
+    # on each worker, for rows 0 to 99999, 100000 to 199999, …
+    with open(f'part-{offset}.bin', 'wb') as part_file:
+        sharding.write_part(part_file, rows, offset=offset, columns=columns)
+
+    # once all the parts are written
+    stream = sharding.stitch_parts(sorted(glob.glob('part-*.bin')), columns=columns)
+
+Each part holds a raw deflate stream flushed with ``Z_SYNC_FLUSH``: it ends on a byte boundary
+and without final block, so that the deflate streams of the parts can be concatenated. The
+CRC-32 of the sheet is combined from the CRCs of the parts.
+"""
+import collections
+import io
+import struct
+import zlib
+
+import zipstream
+
+from . import compression
+from . import render
+from . import streaming
+
+PART_MAGIC = b'XLSXPRT1'
+# magic, CRC-32, size, compressed size, first line and number of lines of the part
+PART_TRAILER = struct.Struct('<8sIQQQQ')
+# An empty final block (with fixed Huffman codes), which ends the concatenated deflate streams
+FINAL_BLOCK = b'\x03\x00'
+READ_SIZE = 64 * 1024
+
+Part = collections.namedtuple('Part', ['crc', 'size', 'compressed_size', 'start_line', 'lines'])
+Part.__doc__ = """
+    The trailer of a part: the CRC-32 and the size of the rendered rows, the size of their deflate
+    stream, the line of the first row of the part and its number of rows.
+"""
+
+
+def write_part(
+        fileobj,
+        rows,
+        offset=0,
+        xlsx_template=None,
+        columns=None,
+        serializer=None,
+        batch_size=1000,
+        encoding='utf-8',
+        compresslevel=None,
+        compressor=None,
+        trusted=False,
+        errors=None,
+        compact=False,
+    ):
+    """
+        Render and compress rows of a document into a part file.
+
+        args:
+            fileobj: a binary file object in which the part is written
+            rows (Iterable): the rows of the part (see ``stream_queryset_as_xlsx``)
+            offset (int): the number of rows of the document before the rows of this part
+            xlsx_template, columns, serializer, batch_size, encoding, compresslevel, compressor, trusted,
+            errors, compact: see ``stream_queryset_as_xlsx``. The template (or the columns)
+                and the ``encoding`` and ``compact`` options must be the same for all the parts
+                and when stitching them.
+
+        return (Part):
+            the trailer of the part
+    """
+    xlsx_template, encoders = streaming.get_template_and_encoders(xlsx_template, columns)
+    zip_template, _, (header_tree, _, row_template) = streaming.open_template(xlsx_template)
+    zip_template.close()
+
+    lines = 0
+
+    def count_rows(batches):
+        nonlocal lines
+        for batch in batches:
+            batch = list(batch)
+            lines += len(batch)
+            yield batch
+
+    batches = streaming.serialize_queryset_by_batch(rows, serializer or (lambda x: x), batch_size)
+    start_line = render.get_first_line(header_tree) + offset
+    chunks = render.render_worksheet_rows(
+        count_rows(batches), row_template, start_line, encoding,
+        trusted=trusted, encoders=encoders, errors=errors, compact=compact,
+    )
+    crc, size, compressed_size = _write_segment(fileobj, chunks, compresslevel, compressor)
+    part = Part(crc, size, compressed_size, start_line, lines)
+    fileobj.write(PART_TRAILER.pack(PART_MAGIC, *part))
+    return part
+
+
+def read_part(fileobj):
+    """Return the trailer (``Part``) of a part file, which is left at the beginning of the part."""
+    fileobj.seek(-PART_TRAILER.size, io.SEEK_END)
+    magic, *trailer = PART_TRAILER.unpack(fileobj.read(PART_TRAILER.size))
+    if magic != PART_MAGIC:
+        raise ValueError('Not an xlsx_streaming part file')
+    fileobj.seek(0)
+    return Part(*trailer)
+
+
+def stitch_parts(
+        parts,
+        xlsx_template=None,
+        columns=None,
+        encoding='utf-8',
+        compresslevel=None,
+        compressor=None,
+        compact=False,
+    ):
+    """
+        Return the streamable xlsx document made of the parts (see ``write_part``), without
+        recompressing them.
+
+        args:
+            parts (list): the paths or binary file objects of the parts, covering consecutive
+                ranges of rows (in any order)
+            xlsx_template, columns, encoding, compresslevel, compressor, compact: see ``write_part``
+                (``compresslevel`` and ``compressor`` are used for the other members of the document)
+
+        return (Iterable):
+            a streamable xlsx file
+
+        ..note: the part files are read when the document is streamed.
+    """
+    xlsx_template, _ = streaming.get_template_and_encoders(xlsx_template, columns)
+    zip_template, sheet_name, (header_tree, views, _) = streaming.open_template(xlsx_template)
+
+    segments = []
+    for part in parts:
+        if _is_path(part):
+            with open(part, 'rb') as part_file:
+                segments.append((part, read_part(part_file)))
+        else:
+            segments.append((part, read_part(part)))
+    segments.sort(key=lambda segment: segment[1].start_line)
+
+    line = render.get_first_line(header_tree)
+    for _, part in segments:
+        if part.start_line != line:
+            raise ValueError(f'The parts do not cover consecutive rows: line {line} expected, {part.start_line} found')
+        line += part.lines
+
+    start = _compress(render.render_worksheet_start(header_tree, views, encoding, compact), compresslevel, compressor)
+    end = _compress(render.render_worksheet_end(encoding, compact), compresslevel, compressor)
+    crc, size, compressed_size = start[:3]
+    for _, part in segments:
+        crc = compression.crc32_combine(crc, part.crc, part.size)
+        size += part.size
+        compressed_size += part.compressed_size
+    crc = compression.crc32_combine(crc, end[0], end[1])
+    size += end[1]
+    compressed_size += end[2] + len(FINAL_BLOCK)
+
+    zipped_stream = streaming.zip_to_zipstream(
+        zip_template, exclude=[sheet_name], compresslevel=compresslevel, compressor=compressor,
+    )
+    zipped_stream.write_compressed(
+        arcname=sheet_name,
+        compressed=_iter_sheet(start[3], segments, end[3]),
+        crc=crc,
+        file_size=size,
+        compress_size=compressed_size,
+        compress_type=zipstream.ZIP_DEFLATED,
+    )
+    return zipped_stream
+
+
+def _write_segment(fileobj, chunks, compresslevel, compressor):
+    compressor = compression.get_compressor(compressor)
+    compressobj = compressor.compressobj(compresslevel)
+    crc = size = compressed_size = 0
+    for chunk in chunks:
+        crc = compressor.crc32(chunk, crc)
+        size += len(chunk)
+        data = compressobj.compress(chunk)
+        if data:
+            fileobj.write(data)
+            compressed_size += len(data)
+    # a sync flush ends the deflate stream on a byte boundary, without final block
+    data = compressobj.flush(zlib.Z_SYNC_FLUSH)
+    fileobj.write(data)
+    return crc, size, compressed_size + len(data)
+
+
+def _is_path(part):
+    return isinstance(part, (str, bytes)) or hasattr(part, '__fspath__')
+
+
+def _compress(data, compresslevel, compressor):
+    segment = io.BytesIO()
+    crc, size, compressed_size = _write_segment(segment, [data], compresslevel, compressor)
+    return crc, size, compressed_size, segment.getvalue()
+
+
+def _iter_sheet(start, segments, end):
+    yield start
+    for part, trailer in segments:
+        if _is_path(part):
+            with open(part, 'rb') as part_file:
+                yield from _iter_part(part_file, trailer)
+        else:
+            part.seek(0)
+            yield from _iter_part(part, trailer)
+    yield end + FINAL_BLOCK
+
+
+def _iter_part(part_file, trailer):
+    remaining = trailer.compressed_size
+    while remaining:
+        data = part_file.read(min(READ_SIZE, remaining))
+        if not data:
+            raise ValueError('Truncated part file')
+        remaining -= len(data)
+        yield data
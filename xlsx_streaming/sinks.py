@@ -0,0 +1,333 @@
+"""
+Outputs of streamed documents: files and object storages.
+
+``write_xlsx_to`` writes a document to a file through a large buffer, and ``wsgi_file_wrapper``
+serves the written file. ``upload_multipart`` uploads a document to an object storage by parts:
+the stream is cut into parts of ``part_size`` bytes which are uploaded concurrently while the
+rest of the document is rendered, with a bounded number of parts in memory. The storage is
+accessed through a ``MultipartUploader``: ``S3MultipartUploader`` wraps an S3 compatible client
+(e.g. ``boto3.client('s3')``) and ``InMemoryUploader`` keeps the uploads in memory (for tests).
+"""
+import abc
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+import uuid
+
+from . import archive
+
+
+logger = logging.getLogger(__name__)
+
+# S3 rejects parts smaller than 5 MiB (except the last one)
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+# A multiple of the page and file system block sizes
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+
+def write_xlsx_to(target, stream, buffer_size=DEFAULT_BUFFER_SIZE, fsync=False):
+    """
+        Write a streamed document to a file.
+
+        The chunks of the stream are gathered in a buffer of ``buffer_size`` bytes, written at
+        once: the writes are aligned on ``buffer_size`` (from the start of the document). If the
+        file can seek and the stream is the ``ZipStream`` returned by ``stream_queryset_as_xlsx``
+        (not wrapped by a ``pipeline`` or ``progress``), the sizes and CRC of the worksheet are
+        written in its local header once it is written, instead of in a data descriptor.
+
+        args:
+            target (Union[str, int, BinaryIO]): a path, a file descriptor or a binary file object
+                (left open), written from its current position
+            stream (Iterable): the document (e.g. the result of ``stream_queryset_as_xlsx``)
+            buffer_size (int): the size of the writes
+            fsync (bool): if True, the file is flushed to disk before returning
+
+        return (int):
+            the size of the document
+    """
+    if isinstance(target, int):
+        with open(target, 'wb', buffering=0, closefd=False) as fileobj:
+            return _write_to_file(fileobj, stream, buffer_size, fsync)
+    if isinstance(target, (str, bytes)) or hasattr(target, '__fspath__'):
+        with open(target, 'wb', buffering=0) as fileobj:
+            return _write_to_file(fileobj, stream, buffer_size, fsync)
+    return _write_to_file(target, stream, buffer_size, fsync)
+
+
+def _write_to_file(fileobj, stream, buffer_size, fsync):
+    start = fileobj.tell() if _is_seekable(fileobj) else None
+    if start is not None and isinstance(stream, archive.ZipStream):
+        stream.defer_headers()
+    buffer = _AlignedBuffer(fileobj, buffer_size)
+    for chunk in stream:
+        buffer.write(chunk)
+    buffer.flush()
+    for offset, header in getattr(stream, 'header_patches', None) or []:
+        fileobj.seek(start + offset)
+        fileobj.write(header)
+    if start is not None:
+        fileobj.seek(start + buffer.size)
+    fileobj.flush()
+    if fsync:
+        os.fsync(fileobj.fileno())
+    return buffer.size
+
+
+def _is_seekable(fileobj):
+    try:
+        return fileobj.seekable()
+    except (AttributeError, ValueError):
+        return False
+
+
+class _AlignedBuffer:
+    """Write the data to ``fileobj`` by blocks of ``size`` bytes."""
+
+    def __init__(self, fileobj, size):
+        self.fileobj = fileobj
+        self.buffer = memoryview(bytearray(size))
+        self.used = 0
+        self.size = 0  # written to the buffer
+
+    def write(self, data):
+        data = memoryview(data)
+        self.size += len(data)
+        capacity = len(self.buffer)
+        if not self.used and len(data) >= capacity:  # large chunks are written without being copied
+            blocks = len(data) - len(data) % capacity
+            self._write(data[:blocks])
+            data = data[blocks:]
+        while data:
+            count = min(len(data), capacity - self.used)
+            self.buffer[self.used:self.used + count] = data[:count]
+            self.used += count
+            data = data[count:]
+            if self.used == capacity:
+                self._write(self.buffer)
+                self.used = 0
+
+    def flush(self):
+        if self.used:
+            self._write(self.buffer[:self.used])
+            self.used = 0
+
+    def _write(self, data):
+        while data:  # raw files may write less than asked
+            written = self.fileobj.write(data)
+            if written is None or written == len(data):
+                return
+            data = data[written:]
+
+
+def wsgi_file_wrapper(environ, fileobj, block_size=DEFAULT_BUFFER_SIZE):
+    """
+        Return the WSGI response body of a written document (e.g. with ``write_xlsx_to``).
+
+        The server's ``wsgi.file_wrapper`` is used if it provides one, which sends a regular file
+        with ``sendfile`` (without copying it in user space). The file is read by blocks otherwise.
+
+        args:
+            environ (dict): the WSGI environment of the request
+            fileobj: a binary file object, read from its current position (and closed by the server)
+            block_size (int): the size of the blocks read
+    """
+    file_wrapper = environ.get('wsgi.file_wrapper')
+    if file_wrapper is not None:
+        return file_wrapper(fileobj, block_size)
+    return _iter_file(fileobj, block_size)
+
+
+def _iter_file(fileobj, block_size):
+    try:
+        yield from iter(lambda: fileobj.read(block_size), b'')
+    finally:
+        fileobj.close()
+
+
+class MultipartUploader(abc.ABC):
+    """
+        The interface of the storage for ``upload_multipart``.
+
+        ``upload_part`` is called concurrently from several threads.
+    """
+
+    @abc.abstractmethod
+    def create(self):
+        """Start an upload and return its identifier."""
+
+    @abc.abstractmethod
+    def upload_part(self, upload_id, part_number, data):
+        """Upload a part (numbered from 1) and return its identifier (e.g. its ETag)."""
+
+    @abc.abstractmethod
+    def complete(self, upload_id, parts):
+        """Assemble the parts, a list of (part number, part identifier) in order, and return the result."""
+
+    @abc.abstractmethod
+    def abort(self, upload_id):
+        """Discard the parts of an upload."""
+
+
+class S3MultipartUploader(MultipartUploader):
+    """
+        Upload to an S3 compatible storage.
+
+        args:
+            client: an S3 client (e.g. ``boto3.client('s3')``)
+            bucket (str): the bucket of the object
+            key (str): the key of the object
+            create_options (dict): additional arguments of ``create_multipart_upload``
+                (e.g. ``{'ContentType': …}``)
+    """
+
+    def __init__(self, client, bucket, key, create_options=None):
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.create_options = create_options or {}
+
+    def create(self):
+        response = self.client.create_multipart_upload(Bucket=self.bucket, Key=self.key, **self.create_options)
+        return response['UploadId']
+
+    def upload_part(self, upload_id, part_number, data):
+        response = self.client.upload_part(
+            Bucket=self.bucket, Key=self.key, UploadId=upload_id, PartNumber=part_number, Body=data,
+        )
+        return response['ETag']
+
+    def complete(self, upload_id, parts):
+        return self.client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=upload_id,
+            MultipartUpload={'Parts': [{'PartNumber': number, 'ETag': etag} for number, etag in parts]},
+        )
+
+    def abort(self, upload_id):
+        self.client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=upload_id)
+
+
+class InMemoryUploader(MultipartUploader):
+    """
+        Keep the uploads in memory: a stand-in for an object storage in tests.
+
+        Completed uploads are kept in ``objects`` (upload id → bytes), aborted ones in ``aborted``.
+
+        args:
+            failures (dict): the number of times the upload of each part number fails
+                before succeeding
+    """
+
+    def __init__(self, failures=None):
+        self.failures = dict(failures or {})
+        self.uploads = {}
+        self.objects = {}
+        self.aborted = set()
+        self._lock = threading.Lock()
+
+    def create(self):
+        upload_id = uuid.uuid4().hex
+        self.uploads[upload_id] = {}
+        return upload_id
+
+    def upload_part(self, upload_id, part_number, data):
+        with self._lock:
+            if self.failures.get(part_number):
+                self.failures[part_number] -= 1
+                raise ConnectionError(f'Upload of part {part_number} failed')
+            self.uploads[upload_id][part_number] = bytes(data)
+        return f'etag-{part_number}'
+
+    def complete(self, upload_id, parts):
+        uploaded = self.uploads.pop(upload_id)
+        self.objects[upload_id] = b''.join(uploaded[number] for number, _ in parts)
+        return upload_id
+
+    def abort(self, upload_id):
+        self.uploads.pop(upload_id, None)
+        self.aborted.add(upload_id)
+
+
+def upload_multipart(
+        stream,
+        uploader,
+        part_size=DEFAULT_PART_SIZE,
+        max_workers=4,
+        max_retries=3,
+        retry_delay=1.,
+    ):
+    """
+        Upload a stream (e.g. the result of ``stream_queryset_as_xlsx``) by parts.
+
+        At most ``max_workers`` parts are uploaded at once, and the stream is not read further
+        while they are all in progress: at most ``max_workers + 1`` parts are kept in memory.
+        The upload is completed once all the parts are uploaded, and aborted if a part cannot
+        be uploaded (or if reading the stream or completing the upload fails).
+
+        args:
+            stream (Iterable): the chunks of bytes to upload
+            uploader (MultipartUploader): the storage
+            part_size (int): the minimal size of a part (except the last one)
+            max_workers (int): the number of parts uploaded concurrently
+            max_retries (int): the number of times the upload of a part is retried
+            retry_delay (float): the delay (in seconds) before the first retry, doubled at each retry
+
+        return:
+            the result of ``uploader.complete``
+    """
+    upload_id = uploader.create()
+    parts = []
+    pending = set()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers, thread_name_prefix='xlsx-streaming-upload')
+    iterator = iter(stream)
+    try:
+        for part_number, data in enumerate(_cut_parts(iterator, part_size), 1):
+            if len(pending) >= max_workers:
+                done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                parts.extend(future.result() for future in done)
+            pending.add(executor.submit(
+                _upload_part, uploader, upload_id, part_number, data, max_retries, retry_delay,
+            ))
+        parts.extend(future.result() for future in concurrent.futures.as_completed(pending))
+        return uploader.complete(upload_id, sorted(parts))
+    except BaseException:
+        for future in pending:
+            future.cancel()
+        executor.shutdown()  # the parts being uploaded are finished before aborting
+        uploader.abort(upload_id)
+        raise
+    finally:
+        executor.shutdown()
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            close()
+
+
+def _cut_parts(chunks, part_size):
+    buffer = bytearray()
+    parts = 0
+    for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= part_size:
+            yield bytes(buffer)
+            buffer.clear()
+            parts += 1
+    if buffer or not parts:  # an upload has at least one part
+        yield bytes(buffer)
+
+
+def _upload_part(uploader, upload_id, part_number, data, max_retries, retry_delay):
+    attempt = 0
+    while True:
+        try:
+            return part_number, uploader.upload_part(upload_id, part_number, data)
+        except Exception as e:  # pylint: disable=broad-except
+            if attempt >= max_retries:
+                raise
+            delay = retry_delay * 2 ** attempt
+            logger.warning('Upload of part %s failed (%s), retrying in %.1fs', part_number, e, delay)
+            time.sleep(delay)
+            attempt += 1
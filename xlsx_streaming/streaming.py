@@ -1,17 +1,30 @@
 import collections.abc
 from itertools import chain, islice
 import logging
+import os
+import posixpath
+import struct
+import time
 import zipfile
+import zlib
+from xml.etree import ElementTree as ETree
 
 import zipstream
 
+from . import archive
+from . import batching
+from . import columnar
 from . import render
-from .xlsx_template import DEFAULT_TEMPLATE
+from . import schema
+from . import templates
+from . import xlsx_template as default_template
 
 
 logger = logging.getLogger(__name__)
 
 EXCEL_WORKSHEETS_PATH = 'xl/worksheets/'
+WORKBOOK_PATH = 'xl/workbook.xml'
+WORKBOOK_RELS_PATH = 'xl/_rels/workbook.xml.rels'
 
 
 def stream_queryset_as_xlsx(
@@ -20,6 +33,20 @@ def stream_queryset_as_xlsx(
         serializer=None,
         batch_size=1000,
         encoding='utf-8',
+        compresslevel=None,
+        executor=None,
+        compressor=None,
+        columns=None,
+        trusted=False,
+        errors=None,
+        compact=False,
+        batch_bytes=None,
+        pipeline=None,
+        cache=None,
+        progress=None,
+        profiler=None,
+        fields=None,
+        max_pending=None,
     ):
     """
     Iterate over qs by batch (typically a Django queryset) and stream the bytes of the
@@ -30,13 +57,65 @@ def stream_queryset_as_xlsx(
 
     Args:
         qs (Iterable): an iterable containing the rows (typically a Django queryset)
-        xlsx_template (Optional[BytesIO]): an in memory xlsx file template containing
-            the header (optional) and the first row used to infer data types for each column.
-            If not provided, all cells will be formatted as text.
+        xlsx_template (Optional[Union[BinaryIO, str, os.PathLike]]): an xlsx file template (a binary
+            file object or a path) containing the header (optional) and the first row used to infer
+            data types for each column. A template given as a path is memory mapped once and shared
+            by the exports (see ``xlsx_streaming.templates``). If not provided, all cells will be
+            formatted as text.
         serializer (Optional[Callable]): a function applied to each batch of rows to transform
             them before saving them to the xlsx document (defaults to identity).
-        batch_size (Optional[int]): the size of each batch of rows
+        batch_size (Optional[Union[int, str, AdaptiveBatchSize]]): the size of each batch of rows. With
+            'auto' or an ``xlsx_streaming.AdaptiveBatchSize``, the size of each batch is adapted to
+            the fetch time and the size of the previous batches (see ``AdaptiveBatchSize``).
         encoding (Optional[str]): the file encoding
+        compresslevel (Optional[int]): the deflate compression level, from 0 (no compression)
+            to 9 (slowest, best compression). Defaults to the compressor's default level. It only
+            applies to the worksheet: the other members of the template are copied as they are
+            compressed in the template.
+        executor (Optional[concurrent.futures.Executor]): if provided, batches of rows are rendered
+            concurrently in this executor (typically a ``ProcessPoolExecutor``, the serialized rows
+            must then be picklable).
+        max_pending (Optional[int]): the number of batches submitted to the ``executor`` ahead of the
+            stream, which bounds memory usage. Defaults to twice the number of CPUs, set it to twice the
+            number of workers of the executor.
+        compressor (Optional[Union[str, Compressor]]): the deflate implementation ('isal', 'zlib-ng'
+            or 'zlib', see ``xlsx_streaming.compression``), or 'auto' for the fastest installed one.
+            Defaults to 'zlib'. Like
+            ``compresslevel``, it does not apply to the members of the template copied as is.
+        columns (Optional[list]): the columns of the document, as ``xlsx_streaming.Column`` objects
+            or column types ('number', 'int', 'float', 'bool', 'date', 'datetime', 'time' or 'text').
+            The template is then built from the columns (``xlsx_template`` must not be provided),
+            with a header row if the columns have names.
+        trusted (Optional[bool]): if True, the values are written without checking that they match the
+            column types, which is much faster. Invalid values may then produce an invalid document.
+        errors (Optional[ErrorReport]): a report accounting for the values which do not match the
+            column types (per column counts and samples), to be read once the document has been
+            streamed. With ``ErrorReport(strict=True)``, the stream raises a ``DataError`` on the first
+            invalid value. If not provided, invalid values are logged (debug level) and skipped.
+        compact (Optional[bool]): if True, the worksheet is written without newlines, without the optional
+            row and cell references and without the empty (None) cells, which makes it smaller
+            and faster to compress.
+        batch_bytes (Optional[int]): if provided, the batches are split so that the estimated rendered
+            size of each batch (from the row template and the length of the values) does not exceed
+            this budget. This bounds memory usage with rows of very variable width, ``batch_size`` then
+            being the number of rows fetched at once.
+        pipeline (Optional[Pipeline]): if provided, fetching (and serializing), rendering and
+            compressing run in threads of their own, connected by bounded queues (see
+            ``xlsx_streaming.Pipeline``). The queryset must then support being iterated in another thread.
+        cache (Optional[ValueCache]): if provided, the encoding of the values of each column is memoized
+            in this LRU cache (see ``xlsx_streaming.ValueCache``), which is faster for columns with
+            few distinct values. Not used with an ``executor``.
+        progress (Optional[Progress]): if provided, this ``xlsx_streaming.Progress`` is updated once per
+            batch (rows, batches, uncompressed and compressed bytes, elapsed time), and gives an ETA
+            if it is created with the total number of rows.
+        profiler (Optional[Profiler]): if provided, the time spent fetching, serializing, rendering
+            and compressing, and encoding the values of each type, is measured by this
+            ``xlsx_streaming.Profiler``, which writes its report once the document has been streamed.
+        fields (Optional[list]): if provided, the field of each column, taken from the rows (returned by
+            the serializer, if any): an attribute name or a dotted path of attributes (e.g.
+            ``'customer.name'``), an index in the row or a function of the row. The values of each
+            column are then gathered in a ``columnar.ColumnBatch``, which is encoded column by column in
+            trusted mode. The serializer may also return a ``ColumnBatch`` itself.
 
     Returns:
         Iterable: A streamable xlsx file
@@ -45,38 +124,241 @@ def stream_queryset_as_xlsx(
         If the xlsx template contains more than one row, the first row is kept as is in the final
         xlsx file (header row), and the second one is used as a template for all the generated rows.
     """
+    if fields is not None:
+        serializer = columnar.fields_serializer(fields, serializer)
     serializer = serializer or (lambda x: x)
+    if profiler is not None:
+        serializer = profiler.time_serializer(serializer)
+
+    xlsx_template, encoders = get_template_and_encoders(xlsx_template, columns)
 
     batches = serialize_queryset_by_batch(qs, serializer=serializer, batch_size=batch_size)
+    if profiler is not None:
+        batches = profiler.time_batches(batches)
+    return _stream_batches_as_xlsx(
+        batches, xlsx_template, encoding, compresslevel=compresslevel, compressor=compressor,
+        batch_bytes=batch_bytes, pipeline=pipeline, progress=progress, profiler=profiler, executor=executor,
+        max_pending=max_pending, trusted=trusted, encoders=encoders, errors=errors, compact=compact, cache=cache,
+    )
 
-    try:
-        zip_template = zipfile.ZipFile(xlsx_template, mode='r')
-    except Exception:  # pylint: disable=broad-except
-        logger.debug('Template is not a valid Excel file, ignoring it. Every cell will be saved as text.')
-        zip_template = zipfile.ZipFile(DEFAULT_TEMPLATE, mode='r')  # pylint: disable=consider-using-with
 
-    sheet_name = get_first_sheet_name(zip_template)
-    if sheet_name is None:
-        logger.debug('Template is not a valid Excel file, ignoring it. Every cell will be saved as text.')
-        zip_template = zipfile.ZipFile(DEFAULT_TEMPLATE, mode='r')  # pylint: disable=consider-using-with
-        sheet_name = get_first_sheet_name(zip_template)
+def stream_cursor_as_xlsx(
+        cursor,
+        xlsx_template=None,
+        serializer=None,
+        batch_size=1000,
+        encoding='utf-8',
+        with_header=True,
+        compresslevel=None,
+        executor=None,
+        compressor=None,
+        trusted=False,
+        errors=None,
+        compact=False,
+        batch_bytes=None,
+        pipeline=None,
+        cache=None,
+        progress=None,
+        profiler=None,
+        max_pending=None,
+    ):
+    """
+    Fetch the rows of a DB-API cursor by batch and stream the bytes of the xlsx document
+    generated from the data.
 
-    xlsx_sheet_string = zip_template.read(sheet_name).decode(encoding)
+    Rows are fetched with ``cursor.fetchmany(batch_size)`` and handed over to the renderer
+    as the driver delivers them. With a server-side cursor (e.g. a named psycopg cursor),
+    the result set is never fully loaded in memory.
+
+    Args:
+        cursor: a DB-API cursor on which a query has been executed
+        xlsx_template (Optional[Union[BinaryIO, str, os.PathLike]]): an xlsx file template or its path
+            (see ``stream_queryset_as_xlsx``). If not provided, a template is built from
+            ``cursor.description``: the column types are taken from the ``type_code`` of each column
+            when it is known, or inferred from the values of the first batch.
+        serializer (Optional[Callable]): a function applied to each batch of rows to transform
+            them before saving them to the xlsx document (defaults to identity).
+        batch_size (Optional[Union[int, str, AdaptiveBatchSize]]): the number of rows fetched at once
+            (see ``stream_queryset_as_xlsx``)
+        encoding (Optional[str]): the file encoding
+        with_header (Optional[bool]): whether the column names are written as a header row
+            (only used if ``xlsx_template`` is not provided)
+        compresslevel (Optional[int]): the deflate compression level (see ``stream_queryset_as_xlsx``)
+        executor (Optional[concurrent.futures.Executor]): if provided, batches of rows are rendered
+            concurrently in this executor (see ``stream_queryset_as_xlsx``)
+        max_pending (Optional[int]): the number of batches submitted to the ``executor`` ahead of the
+            stream (see ``stream_queryset_as_xlsx``)
+        compressor (Optional[Union[str, Compressor]]): the deflate implementation
+            (see ``stream_queryset_as_xlsx``)
+        trusted (Optional[bool]): if True, the values are written without checking that they match
+            the column types (see ``stream_queryset_as_xlsx``)
+        errors (Optional[ErrorReport]): a report accounting for the values which do not match the
+            column types (see ``stream_queryset_as_xlsx``)
+        compact (Optional[bool]): if True, the worksheet is written in a more compact form
+            (see ``stream_queryset_as_xlsx``)
+        batch_bytes (Optional[int]): the estimated rendered size of a batch should not exceed this
+            budget (see ``stream_queryset_as_xlsx``)
+        pipeline (Optional[Pipeline]): if provided, the stages of the export run in threads of their
+            own (see ``stream_queryset_as_xlsx``). The cursor must then support being used in another
+            thread (e.g. ``check_same_thread=False`` with sqlite3).
+        cache (Optional[ValueCache]): if provided, the encoding of the values of each column is memoized
+            (see ``stream_queryset_as_xlsx``)
+        progress (Optional[Progress]): if provided, the progress of the export is reported in this object
+            (see ``stream_queryset_as_xlsx``)
+        profiler (Optional[Profiler]): if provided, the export is profiled by this object
+            (see ``stream_queryset_as_xlsx``)
 
-    zipped_stream = zip_to_zipstream(zip_template, exclude=[sheet_name])
+    Returns:
+        Iterable: A streamable xlsx file
+
+    Note:
+        The first batch is fetched when this function is called, to infer the column types.
+    """
+    serializer = serializer or (lambda x: x)
+    if profiler is not None:
+        serializer = profiler.time_serializer(serializer)
+
+    batches = serialize_cursor_by_batch(cursor, serializer=serializer, batch_size=batch_size)
+    if profiler is not None:
+        batches = profiler.time_batches(batches)
+    first_batch = next(batches, None)
+    if first_batch is None:
+        first_batch = serializer([])
+    encoders = None
+    if xlsx_template is None:
+        header = [column[0] for column in cursor.description] if with_header else None
+        types = schema.types_from_description(cursor.description, first_batch)
+        xlsx_template = schema.build_template(types, header=header)
+        encoders = schema.get_encoders(types)
+
+    batches = chain([first_batch], batches)
+    return _stream_batches_as_xlsx(
+        batches, xlsx_template, encoding, compresslevel=compresslevel, compressor=compressor,
+        batch_bytes=batch_bytes, pipeline=pipeline, progress=progress, profiler=profiler, executor=executor,
+        max_pending=max_pending, trusted=trusted, encoders=encoders, errors=errors, compact=compact, cache=cache,
+    )
+
+
+def _stream_batches_as_xlsx(
+        batches,
+        xlsx_template,
+        encoding,
+        compresslevel=None,
+        compressor=None,
+        batch_bytes=None,
+        pipeline=None,
+        progress=None,
+        profiler=None,
+        **render_options,
+    ):
+    """
+    Stream the xlsx document of the batches of rows.
+
+    ``render_options`` are passed to ``render.render_worksheet``.
+    """
+    zip_template, sheet_name, template_elements = open_template(xlsx_template)
+
+    if batch_bytes is not None:
+        _, _, row_template = template_elements
+        batches = batching.split_batches(batches, batch_bytes, batching.get_row_overhead(row_template))
+
+    zipped_stream = zip_to_zipstream(
+        zip_template, exclude=[sheet_name], compresslevel=compresslevel, compressor=compressor,
+    )
+    if progress is not None:
+        batches = _track_batches(batches, progress)
+    if pipeline is not None:
+        batches = pipeline.stage('serialize', batches)
+    if profiler is not None:
+        render_options['cache'] = profiler.timed_cache(render_options.get('cache'))
     # Write the generated worksheet to the stream
-    worksheet_stream = render.render_worksheet(batches, xlsx_sheet_string, encoding)
+    worksheet_stream = render.render_worksheet(batches, template_elements, encoding, **render_options)
+    if profiler is not None:
+        worksheet_stream = profiler.time_worksheet(worksheet_stream)
+    if progress is not None:
+        worksheet_stream = _track_size(worksheet_stream, progress)
+    if pipeline is not None:
+        worksheet_stream = pipeline.stage('render', worksheet_stream)
     zipped_stream.write_iter(
         arcname=sheet_name,
         iterable=worksheet_stream,
         compress_type=zipstream.ZIP_DEFLATED
     )
 
+    if pipeline is not None:
+        zipped_stream = pipeline.stage('compress', zipped_stream)
+    if profiler is not None:
+        zipped_stream = profiler.time_document(zipped_stream)
+    if progress is not None:
+        return _track_output(zipped_stream, progress)
     return zipped_stream
 
 
+def _track_batches(batches, progress):
+    for batch in batches:
+        if not isinstance(batch, collections.abc.Sized):
+            batch = list(batch)
+        progress.add_batch(len(batch))
+        yield batch
+
+
+def _track_size(chunks, progress):
+    for chunk in chunks:
+        progress.size += len(chunk)
+        yield chunk
+
+
+def _track_output(chunks, progress):
+    progress.start()
+    for chunk in chunks:
+        progress.compressed_size += len(chunk)
+        yield chunk
+    progress.finish()
+
+
+def get_template_and_encoders(xlsx_template, columns):
+    """Return the template and the encoders (None if not known) of an export (see ``stream_queryset_as_xlsx``)."""
+    if columns is None:
+        return xlsx_template, None
+    if xlsx_template is not None:
+        raise ValueError('`xlsx_template` and `columns` cannot be used at the same time')
+    return schema.build_template(columns), schema.get_encoders(columns)
+
+
+def open_template(xlsx_template):
+    """
+    Open an xlsx template (the default template if it is not a valid xlsx file). A template given as
+    a path is read from its shared memory mapping.
+
+    Returns:
+        tuple: the template ``ZipFile``, the name of its sheet and the elements of the sheet
+        (see ``render.get_elements_from_template``)
+    """
+    try:
+        if isinstance(xlsx_template, (str, os.PathLike)):
+            xlsx_template = templates.open_mapped_template(xlsx_template)
+        zip_template = zipfile.ZipFile(xlsx_template, mode='r')
+    except Exception:  # pylint: disable=broad-except
+        logger.debug('Template is not a valid Excel file, ignoring it. Every cell will be saved as text.')
+        zip_template = zipfile.ZipFile(default_template.get_default_template(), mode='r')  # pylint: disable=consider-using-with
+
+    sheet_name = get_first_sheet_name(zip_template)
+    if sheet_name is None:
+        logger.debug('Template is not a valid Excel file, ignoring it. Every cell will be saved as text.')
+        zip_template = zipfile.ZipFile(default_template.get_default_template(), mode='r')  # pylint: disable=consider-using-with
+        sheet_name = get_first_sheet_name(zip_template)
+
+    # only the beginning of the template sheet is parsed, however large it is
+    with zip_template.open(sheet_name) as sheet_file:
+        template_elements = render.get_elements_from_template(sheet_file)
+    return zip_template, sheet_name, template_elements
+
+
 def serialize_queryset_by_batch(qs, serializer, batch_size):
-    if isinstance(qs, collections.abc.Iterator):
+    sizer = batching.get_batch_sizer(batch_size)
+    if sizer is not None:
+        yield from _serialize_queryset_by_adaptive_batch(qs, serializer, sizer)
+    elif isinstance(qs, collections.abc.Iterator):
         qs_slices = _chunks(qs, batch_size)
         for batch in qs_slices:
             yield serializer(list(batch))
@@ -88,19 +370,63 @@ def serialize_queryset_by_batch(qs, serializer, batch_size):
             start += batch_size
 
 
+def _serialize_queryset_by_adaptive_batch(qs, serializer, sizer):
+    iterator = qs if isinstance(qs, collections.abc.Iterator) else None
+    start = 0
+    while True:
+        size = sizer.size
+        started_at = time.perf_counter()
+        if iterator is not None:
+            rows = list(islice(iterator, size))
+            if not rows:
+                break
+        else:
+            rows = list(qs[start:start + size])  # force queryset evaluation
+            start += size
+        batch = _record_batch(sizer, serializer(rows), started_at)
+        yield batch
+        if len(rows) < size:
+            break
+
+
+def serialize_cursor_by_batch(cursor, serializer, batch_size):
+    sizer = batching.get_batch_sizer(batch_size)
+    while True:
+        started_at = time.perf_counter()
+        rows = cursor.fetchmany(batch_size if sizer is None else sizer.size)
+        if not rows:
+            break
+        if sizer is None:
+            yield serializer(rows)
+        else:
+            yield _record_batch(sizer, serializer(rows), started_at)
+
+
+def _record_batch(sizer, batch, started_at):
+    if not isinstance(batch, collections.abc.Sized):
+        batch = list(batch)
+    sizer.record(batch, time.perf_counter() - started_at)
+    return batch
+
+
 def _chunks(iterable, size):
     iterator = iter(iterable)
     for first in iterator:
         yield chain([first], islice(iterator, size - 1))
 
 
-def zip_to_zipstream(zip_file, only=None, exclude=None):
+def zip_to_zipstream(zip_file, only=None, exclude=None, compresslevel=None, compressor=None):
     """
     args:
         zip_file (ZipFile): the original zipfile.ZipFile
         only (list): the file names of the files to be included in the stream
         exclude (list): the file names of the files to be excluded in the stream
+        compresslevel (int): the deflate compression level (defaults to the compressor's default level)
+        compressor (Union[str, Compressor]): the deflate implementation (defaults to zlib)
         ..note: only and exclude cannot be used at the same time
+        ..note: deflated and stored members are copied without being recompressed (see ``read_compressed``):
+            compresslevel and compressor only apply to the other members (e.g. encrypted ones), and to
+            the members added to the stream afterwards
     """
     only = only or []
     exclude = exclude or []
@@ -113,16 +439,83 @@ def zip_to_zipstream(zip_file, only=None, exclude=None):
     elif exclude:
         file_names = [name for name in file_names if name not in exclude]
 
-    zip_stream = zipstream.ZipFile(mode='w', compression=zipstream.ZIP_DEFLATED)
+    zip_stream = archive.ZipStream(compresslevel=compresslevel, compressor=compressor)
     for file_name in file_names:
-        zip_stream.write_iter(
-            arcname=file_name,
-            iterable=iter([zip_file.read(file_name)]),
-            compress_type=zipstream.ZIP_DEFLATED,
-        )
+        zinfo = zip_file.getinfo(file_name)
+        if zinfo.compress_type in archive.COMPRESS_TYPES and not zinfo.flag_bits & 0x01:  # not encrypted
+            zip_stream.write_compressed(
+                arcname=file_name,
+                compressed=read_compressed(zip_file, zinfo),
+                crc=zinfo.CRC,
+                file_size=zinfo.file_size,
+                compress_type=zinfo.compress_type,
+            )
+        else:
+            zip_stream.write_iter(
+                arcname=file_name,
+                iterable=iter([zip_file.read(file_name)]),
+                compress_type=zipstream.ZIP_DEFLATED,
+            )
     return zip_stream
 
 
+# Reading the members as they are stored relies on private attributes of ``zipfile`` (the layout of
+# the local headers and the lock of the shared file), present in all the supported python versions
+_CAN_READ_STORED_DATA = all(
+    hasattr(zipfile, name)
+    for name in ('structFileHeader', 'sizeFileHeader', '_FH_FILENAME_LENGTH', '_FH_EXTRA_FIELD_LENGTH')
+)
+
+
+def read_compressed(zip_file, zinfo):
+    """
+    Return the data of a deflated or stored member of ``zip_file`` as it is stored in the archive
+    (not decompressed).
+
+    Should the private attributes of ``zipfile`` it relies on be missing, the member is read with
+    ``zip_file.open()`` and deflated again (with ``zlib`` and its default level).
+    """
+    if not _CAN_READ_STORED_DATA or not hasattr(zip_file, '_lock'):
+        return _read_recompressed(zip_file, zinfo)
+    with zip_file._lock:
+        zip_file.fp.seek(zinfo.header_offset)
+        header = struct.unpack(zipfile.structFileHeader, zip_file.fp.read(zipfile.sizeFileHeader))
+        zip_file.fp.seek(header[zipfile._FH_FILENAME_LENGTH] + header[zipfile._FH_EXTRA_FIELD_LENGTH], 1)
+        return zip_file.fp.read(zinfo.compress_size)
+
+
+def _read_recompressed(zip_file, zinfo):
+    with zip_file.open(zinfo) as member:
+        data = member.read()
+    if zinfo.compress_type == zipfile.ZIP_STORED:
+        return data
+    compressobj = zlib.compressobj(wbits=-zlib.MAX_WBITS)  # raw deflate, as stored in zip archives
+    return compressobj.compress(data) + compressobj.flush()
+
+
+def get_sheet_names(xlsx_zipfile):
+    """Return the worksheets of an xlsx file, in the order of the workbook (or of the archive if it is not known)."""
+    worksheets = [
+        path for path in xlsx_zipfile.namelist() if path.startswith(EXCEL_WORKSHEETS_PATH) and path.endswith('.xml')
+    ]
+    try:
+        workbook = ETree.fromstring(xlsx_zipfile.read(WORKBOOK_PATH))
+        relationships = ETree.fromstring(xlsx_zipfile.read(WORKBOOK_RELS_PATH))
+    except (KeyError, ETree.ParseError):
+        return worksheets
+    targets = {}
+    for relationship in relationships:
+        target = relationship.get('Target', '')
+        # targets are relative to the workbook, unless they are absolute
+        targets[relationship.get('Id')] = target[1:] if target.startswith('/') else posixpath.join('xl', target)
+    ordered = [
+        targets.get(sheet.get(f'{{{render.OPENXML_NS_R}}}id'))
+        for sheet in workbook.iter(f'{{{render.OPENXML_NS}}}sheet')
+    ]
+    ordered = [path for path in ordered if path in worksheets]
+    return ordered + [path for path in worksheets if path not in ordered]
+
+
 def get_first_sheet_name(xlsx_zipfile):
     try:
         return next(
@@ -0,0 +1,122 @@
+"""
+Templates given as a path, memory mapped once and shared by the exports.
+
+The template file is mapped read-only on first use, and the mapping is reused by the following
+exports (from any thread) as long as the file is not modified. Each export reads the mapping
+through a file object of its own, with its own position, so concurrent exports do not share a
+file position. The pages of the mapping are the ones of the page cache: forked workers, and
+processes mapping the same file, share one copy of the template in memory.
+"""
+import io
+import mmap
+import os
+import threading
+
+_lock = threading.Lock()
+_mappings = {}
+
+
+def open_mapped_template(path):
+    """
+        Return a new read-only file object over the memory mapped template at ``path``.
+
+        args:
+            path (Union[str, os.PathLike]): the path of an xlsx template
+    """
+    return MappedFile(get_mapping(path))
+
+
+def get_mapping(path):
+    """Return the read-only memory mapping of the file at ``path``, mapped again if the file has changed."""
+    path = os.path.realpath(path)
+    with open(path, 'rb') as template_file:
+        stat = os.fstat(template_file.fileno())
+        version = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        with _lock:
+            known_version, mapping = _mappings.get(path, (None, None))
+            if known_version != version:
+                # a previous mapping is closed once the exports reading it are done
+                mapping = mmap.mmap(template_file.fileno(), 0, access=mmap.ACCESS_READ)
+                _mappings[path] = (version, mapping)
+    return mapping
+
+
+def clear_mappings():
+    """Forget the mapped templates (they are unmapped once the exports reading them are done)."""
+    with _lock:
+        _mappings.clear()
+
+
+def _reset_lock():
+    global _lock  # pylint: disable=global-statement
+    _lock = threading.Lock()  # the lock may have been held by another thread when the process forked
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_lock)
+
+
+class MappedFile(io.RawIOBase):
+    """
+        A read-only file object over a memory mapping, with a position of its own.
+
+        args:
+            mapping (mmap.mmap): the mapping, left open when the file object is closed
+    """
+
+    def __init__(self, mapping):
+        super().__init__()
+        self._view = memoryview(mapping)
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        self._check_not_closed()
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        self._check_not_closed()
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f'Invalid whence ({whence})')
+        if position < 0:
+            raise ValueError(f'Negative seek position {position}')
+        self._position = position
+        return position
+
+    def read(self, size=-1):
+        return self._read(size).tobytes()
+
+    def readall(self):
+        return self.read()
+
+    def readinto(self, buffer):
+        data = self._read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+    def _read(self, size):
+        self._check_not_closed()
+        start = min(self._position, len(self._view))
+        end = len(self._view) if size is None or size < 0 else min(start + size, len(self._view))
+        self._position = max(self._position, end)
+        return self._view[start:end]
+
+    def _check_not_closed(self):
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')